@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Atomic File Writes and Advisory Locks
+
+Data files are read by the Next.js app (src/app/api/tools) while the update
+scripts rewrite them, so a writer must never leave a half-written file:
+
+- atomic_write_text/bytes/json write to a temp file in the same directory,
+  fsync it, and os.replace() it over the target, then fsync the directory.
+  Readers see either the old file or the new one, never a truncated mix.
+  atomic_open() does the same for output that is streamed in pieces.
+  A temp file left by a crash is ignored by readers and removed by the
+  next write to the same target.
+- file_lock() takes an advisory lock on a sidecar `.<name>.lock` file, so
+  overlapping cron runs of the updater or integrators queue up instead of
+  interleaving. Locks are advisory: readers are not blocked.
+
+Usage:
+    with file_lock(ts_file):
+        text = ts_file.read_text(encoding='utf-8')
+        atomic_write_text(ts_file, update(text))
+"""
+
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking is skipped
+    fcntl = None
+
+PathLike = Union[str, Path]
+
+TEMP_SUFFIX = '.tmp'
+
+
+class FileLockTimeout(RuntimeError):
+    """Another process held the lock for longer than the timeout"""
+
+
+def _temp_prefix(path: Path) -> str:
+    return f'.{path.name}.'
+
+
+def _fsync_directory(directory: Path):
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def remove_stale_temps(path: PathLike):
+    """Delete temp files left next to path by an interrupted write"""
+    path = Path(path)
+    for stale in path.parent.glob(f'{_temp_prefix(path)}*{TEMP_SUFFIX}'):
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+@contextmanager
+def atomic_open(path: PathLike, mode: str = 'w', encoding: str = 'utf-8') -> Iterator[IO]:
+    """
+    File object for writing path in pieces; the target is replaced only
+    when the block exits cleanly, and left untouched if it raises.
+    """
+    if mode not in ('w', 'wb'):
+        raise ValueError("atomic_open only supports 'w' and 'wb'")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    remove_stale_temps(path)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=_temp_prefix(path), suffix=TEMP_SUFFIX)
+    try:
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            # Keep the target's permissions; mkstemp creates files as 0600
+            os.chmod(tmp_name, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(path.parent)
+
+
+def atomic_write_bytes(path: PathLike, data: bytes):
+    """Replace path with data in one step, durably"""
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
+
+
+def atomic_write_text(path: PathLike, text: str, encoding: str = 'utf-8'):
+    """Replace path with text in one step, durably"""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_write_json(path: PathLike, data: Any, **dump_kwargs):
+    """json.dump data to path atomically (dump_kwargs as for json.dumps)"""
+    atomic_write_text(path, json.dumps(data, **dump_kwargs))
+
+
+@contextmanager
+def file_lock(path: PathLike, timeout: float = 60.0, enabled: bool = True) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock for path while the block runs.
+
+    Waits up to timeout seconds for another holder, then raises
+    FileLockTimeout. Does nothing when disabled or on platforms without
+    fcntl.
+    """
+    if not enabled or fcntl is None:
+        yield
+        return
+
+    path = Path(path)
+    lock_path = path.parent / f'.{path.name}.lock'
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a') as lock_file:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise FileLockTimeout(f"{path} is locked by another run (waited {timeout:g}s)")
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
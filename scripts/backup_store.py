@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Backup Store
+
+Replaces the timestamped full copies the update scripts used to drop into
+scripts/backups/. Each backup is keyed by the SHA-256 of the file:
+
+- every distinct version is stored once, gzip-compressed, under
+  objects/<hash[:2]>/<hash>.gz, however many runs back it up
+- backing up a file that matches its latest backup writes nothing at all
+- index.json records which file each backup came from and when
+- a retention policy (keep_last versions per file, plus anything younger
+  than max_age_days) is applied after each new backup, and objects no
+  longer referenced are deleted
+
+Usage:
+    store = BackupStore()
+    entry = store.save(Path('src/data/aiToolsData.ts'), label='integrate_updates')
+
+    python backup_store.py list [FILE]
+    python backup_store.py restore HASH_PREFIX [--to PATH]
+    python backup_store.py prune
+"""
+
+import argparse
+import configparser
+import gzip
+import hashlib
+import json
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from atomic_io import atomic_write_bytes, atomic_write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_STORE_DIR = PROJECT_ROOT / 'scripts' / 'backups' / 'store'
+CONFIG_FILE = PROJECT_ROOT / 'scripts' / 'config.ini'
+
+DEFAULT_KEEP_LAST = 20
+DEFAULT_MAX_AGE_DAYS = 30
+
+
+class BackupStore:
+    """Deduplicated, compressed file backups with retention and restore"""
+
+    def __init__(self, root: Path = DEFAULT_STORE_DIR, keep_last: int = DEFAULT_KEEP_LAST,
+                 max_age_days: float = DEFAULT_MAX_AGE_DAYS, base_dir: Path = PROJECT_ROOT):
+        self.root = Path(root)
+        self.keep_last = keep_last
+        self.max_age_days = max_age_days
+        self.base_dir = Path(base_dir)
+        self.index_path = self.root / 'index.json'
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config_file: Path = CONFIG_FILE, **kwargs) -> 'BackupStore':
+        """Store with retention settings from config.ini's [backup] section"""
+        parser = configparser.ConfigParser(inline_comment_prefixes=('#', ';'))
+        parser.read(config_file, encoding='utf-8')
+        kwargs.setdefault('keep_last', parser.getint('backup', 'keep_last', fallback=DEFAULT_KEEP_LAST))
+        kwargs.setdefault('max_age_days', parser.getfloat('backup', 'max_age_days', fallback=DEFAULT_MAX_AGE_DAYS))
+        return cls(**kwargs)
+
+    def _source_key(self, path: Path) -> str:
+        """Path relative to the project root where possible, so keys survive checkouts elsewhere"""
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.base_dir.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / 'objects' / digest[:2] / f'{digest}.gz'
+
+    def _load_index(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def _save_index(self, entries: List[Dict[str, Any]]):
+        atomic_write_json(self.index_path, entries, indent=2)
+
+    def save(self, path: Path, label: str = '') -> Optional[Dict[str, Any]]:
+        """
+        Back up a file; returns its index entry, or None if the file is missing.
+
+        If the file is unchanged since its latest backup, that entry is
+        returned and nothing is written.
+        """
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        digest = hashlib.sha256(data).hexdigest()
+        source = self._source_key(path)
+        with self._lock:
+            entries = self._load_index()
+            latest = next((e for e in reversed(entries) if e['source'] == source), None)
+            if latest and latest['hash'] == digest:
+                return latest
+
+            object_path = self._object_path(digest)
+            if not object_path.exists():
+                # mtime=0 keeps the compressed bytes identical for identical input
+                atomic_write_bytes(object_path, gzip.compress(data, compresslevel=9, mtime=0))
+
+            entry = {
+                'hash': digest,
+                'source': source,
+                'label': label,
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'size': len(data),
+                'storedSize': object_path.stat().st_size,
+            }
+            entries.append(entry)
+            entries = self._apply_retention(entries)
+            self._save_index(entries)
+            self._delete_unreferenced(entries)
+            return entry
+
+    def _apply_retention(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the newest keep_last entries per source, plus any younger than max_age_days"""
+        cutoff = (datetime.now() - timedelta(days=self.max_age_days)).isoformat(timespec='seconds')
+        seen: Dict[str, int] = {}
+        kept = []
+        for entry in reversed(entries):
+            seen[entry['source']] = seen.get(entry['source'], 0) + 1
+            if seen[entry['source']] <= self.keep_last or entry['created'] >= cutoff:
+                kept.append(entry)
+        kept.reverse()
+        return kept
+
+    def _delete_unreferenced(self, entries: List[Dict[str, Any]]):
+        referenced = {entry['hash'] for entry in entries}
+        objects_dir = self.root / 'objects'
+        if not objects_dir.exists():
+            return
+        for object_path in objects_dir.glob('*/*.gz'):
+            if object_path.name[:-3] not in referenced:
+                object_path.unlink()
+
+    def prune(self) -> int:
+        """Apply the retention policy now; returns how many entries were dropped"""
+        with self._lock:
+            entries = self._load_index()
+            kept = self._apply_retention(entries)
+            if len(kept) != len(entries):
+                self._save_index(kept)
+            self._delete_unreferenced(kept)
+            return len(entries) - len(kept)
+
+    def versions(self, path: Optional[Path] = None) -> List[Dict[str, Any]]:
+        """Index entries, newest first, optionally only those of one file"""
+        entries = self._load_index()
+        if path is not None:
+            source = self._source_key(path)
+            entries = [entry for entry in entries if entry['source'] == source]
+        return list(reversed(entries))
+
+    def find(self, ref: str) -> Dict[str, Any]:
+        """Newest entry whose hash starts with ref; raises KeyError if none or ambiguous"""
+        matches = {entry['hash'] for entry in self._load_index() if entry['hash'].startswith(ref)}
+        if len(matches) != 1:
+            raise KeyError(f"{'No' if not matches else 'Ambiguous'} backup matching {ref!r}")
+        digest = matches.pop()
+        return next(entry for entry in self.versions() if entry['hash'] == digest)
+
+    def read(self, ref: str) -> bytes:
+        """Contents of a backup"""
+        entry = self.find(ref)
+        with open(self._object_path(entry['hash']), 'rb') as f:
+            return gzip.decompress(f.read())
+
+    def restore(self, ref: str, dest: Optional[Path] = None) -> Path:
+        """Write a backup back to its original path (or dest), replacing the file atomically"""
+        entry = self.find(ref)
+        data = self.read(entry['hash'])
+        if dest is None:
+            dest = Path(entry['source'])
+            if not dest.is_absolute():
+                dest = self.base_dir / dest
+        dest = Path(dest)
+        atomic_write_bytes(dest, data)
+        return dest
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line: list, restore and prune backups"""
+    parser = argparse.ArgumentParser(description="Manage the deduplicated backup store")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    list_parser = subparsers.add_parser('list', help="Show backups, newest first")
+    list_parser.add_argument('file', nargs='?', type=Path, help="Only backups of this file")
+    restore_parser = subparsers.add_parser('restore', help="Restore a backup by hash prefix")
+    restore_parser.add_argument('ref', help="Hash (or unique prefix) from 'list'")
+    restore_parser.add_argument('--to', type=Path, help="Write here instead of the original path")
+    subparsers.add_parser('prune', help="Apply the retention policy from config.ini")
+    args = parser.parse_args(argv)
+
+    store = BackupStore.from_config()
+    if args.command == 'list':
+        for entry in store.versions(args.file):
+            print(f"{entry['hash'][:12]}  {entry['created']}  {entry['size']:>8}  "
+                  f"{entry['storedSize']:>7}  {entry['source']}  {entry.get('label', '')}")
+    elif args.command == 'restore':
+        try:
+            dest = store.restore(args.ref, args.to)
+        except KeyError as e:
+            print(f"❌ {e.args[0]}")
+            return 1
+        print(f"✅ Restored {args.ref} to {dest}")
+    else:
+        print(f"🧹 Dropped {store.prune()} old backups")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
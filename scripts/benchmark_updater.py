@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Updater Pipeline Benchmark
+
+Runs the fetch stage of AIToolsUpdater, EnhancedAIToolsUpdater and the quick
+updater against the offline stand-in in fake_gemini.py, and reports
+tools/second, p50/p95 per-tool latency, API calls, retries and wall time.
+No network access or API key is needed; link checks in the enhanced
+pipeline go to a throwaway local HTTP server.
+
+Only the fetch stage is exercised, and every file the pipelines write
+(journal, logs, metrics, output and report) goes to a temporary directory
+that is removed afterwards, so nothing reaches src/data, scripts/cache or
+scripts/logs.
+
+Usage:
+    python benchmark_updater.py
+    python benchmark_updater.py --tools 30 --latency 0.3 --error-rate 0.05 \\
+        --malformed-rate 0.1 --rpm-limit 120 --pipelines updater quick
+    python benchmark_updater.py --pipelines updater --prompt-batch 5
+    python benchmark_updater.py --json logs/benchmark.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from fake_gemini import FakeGenerativeModel
+
+PIPELINES = ('updater', 'enhanced', 'quick')
+
+
+class _LinkCheckHandler(BaseHTTPRequestHandler):
+    """Answers every HEAD/GET with 200 so URL verification stays local"""
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.end_headers()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_link_server() -> ThreadingHTTPServer:
+    """Start the local link-check server on a free port"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _LinkCheckHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def timed(func: Callable, samples: List[Dict[str, Any]]) -> Callable:
+    """Wrap a per-tool fetch function to record its latency and success"""
+    lock = threading.Lock()
+
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        with lock:
+            samples.append({'seconds': time.perf_counter() - started, 'ok': bool(result)})
+        return result
+
+    return wrapper
+
+
+def timed_batch(func: Callable, samples: List[Dict[str, Any]]) -> Callable:
+    """Like timed(), for batch fetches: one sample per tool, each with the batch latency"""
+    lock = threading.Lock()
+
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        results = func(*args, **kwargs)
+        seconds = time.perf_counter() - started
+        with lock:
+            samples.extend({'seconds': seconds, 'ok': bool(result)} for result in results)
+        return results
+
+    return wrapper
+
+
+def run_updater(args: argparse.Namespace, model: FakeGenerativeModel, names: List[str],
+                samples: List[Dict[str, Any]], workdir: Path):
+    """AIToolsUpdater fetch stage (concurrent or sequential batches)"""
+    from update_ai_tools import AIToolsUpdater, Config
+
+    config = Config()
+    # Keep the benchmark's records out of the real journal, logs and data files
+    config.DATA_DIR = workdir / 'data'
+    config.OUTPUT_FILE = config.DATA_DIR / 'aiToolsData_updated.json'
+    config.SHARD_DIR = config.DATA_DIR / 'tools'
+    config.SEARCH_INDEX_FILE = config.DATA_DIR / 'aiToolsSearchIndex.json'
+    config.AGGREGATES_FILE = config.DATA_DIR / 'aiToolsAggregates.json'
+    config.BACKUP_DIR = workdir / 'backups'
+    config.LOG_FILE = workdir / 'logs' / 'ai_tools_update.log'
+    config.CACHE_FILE = workdir / 'cache' / 'gemini_responses.sqlite3'
+    config.JOURNAL_FILE = workdir / 'cache' / 'update_run.jsonl'
+    config.METRICS_FILE = workdir / 'logs' / 'update_metrics.json'
+    config.PROMETHEUS_FILE = None
+    config.CACHE_ENABLED = False
+    config.REQUESTS_PER_MINUTE = args.rpm
+    config.MAX_CONCURRENT_REQUESTS = args.workers
+    config.RATE_LIMIT_DELAY = args.delay
+    config.RETRY_BASE_DELAY = args.retry_delay
+    config.CONCURRENT = not args.sequential
+    config.PROMPT_BATCH_SIZE = args.prompt_batch
+
+    updater = AIToolsUpdater(config, model=model)
+    if config.CONCURRENT and config.PROMPT_BATCH_SIZE > 1:
+        updater.fetch_tool_batch = timed_batch(updater.fetch_tool_batch, samples)
+    else:
+        updater.fetch_tool_info = timed(updater.fetch_tool_info, samples)
+    tools = [{'name': name, 'company': 'Benchmark', 'category': 'Large Language Models'} for name in names]
+    if config.CONCURRENT:
+        updater.fetch_tools_concurrently(tools)
+    else:
+        updater.fetch_tools_in_batches(tools)
+
+
+def run_enhanced(args: argparse.Namespace, model: FakeGenerativeModel, names: List[str],
+                 samples: List[Dict[str, Any]], workdir: Path):
+    """EnhancedAIToolsUpdater.update_all_tools, including batched URL checks"""
+    from enhanced_ai_tools_updater import EnhancedAIToolsUpdater
+    from url_verifier import URLVerifier
+
+    updater = EnhancedAIToolsUpdater(model=model, use_cache=False, output_dir=str(workdir),
+                                     rate_limit_delay=args.delay)
+    updater.priority_tools = names
+    updater.retry_policy.base_delay = args.retry_delay
+    updater.url_verifier = URLVerifier(cache_path=None)
+    updater.get_current_tool_info = timed(updater.get_current_tool_info, samples)
+    updater.update_all_tools()
+
+
+def run_quick(args: argparse.Namespace, model: FakeGenerativeModel, names: List[str],
+              samples: List[Dict[str, Any]], workdir: Path):
+    """quick_tools_updater.fetch_tools"""
+    import quick_tools_updater
+
+    original = quick_tools_updater.get_tool_info
+    quick_tools_updater.get_tool_info = timed(original, samples)
+    try:
+        quick_tools_updater.fetch_tools(names, backend=model, delay=args.delay)
+    finally:
+        quick_tools_updater.get_tool_info = original
+
+
+RUNNERS = {'updater': run_updater, 'enhanced': run_enhanced, 'quick': run_quick}
+
+
+def benchmark(pipeline: str, args: argparse.Namespace, site_url: str, workdir: Path) -> Dict[str, Any]:
+    """Run one pipeline against a fresh fake backend and summarize it; files go under workdir"""
+    model = FakeGenerativeModel(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        rpm_limit=args.rpm_limit,
+        site_url=site_url,
+        seed=args.seed
+    )
+    names = [f"Benchmark Tool {i}" for i in range(1, args.tools + 1)]
+    samples: List[Dict[str, Any]] = []
+
+    started = time.perf_counter()
+    RUNNERS[pipeline](args, model, names, samples, workdir / pipeline)
+    wall = time.perf_counter() - started
+
+    latencies = [sample['seconds'] for sample in samples]
+    outcomes = Counter(call['outcome'] for call in model.calls)
+    return {
+        'pipeline': pipeline,
+        'tools': len(names),
+        'succeeded': sum(1 for sample in samples if sample['ok']),
+        'wall_seconds': round(wall, 3),
+        'tools_per_second': round(len(names) / wall, 3) if wall else 0.0,
+        'p50_seconds': round(percentile(latencies, 50), 3),
+        'p95_seconds': round(percentile(latencies, 95), 3),
+        'api_calls': len(model.calls),
+        'retries': max(0, len(model.calls) - len(names)),
+        'outcomes': dict(outcomes),
+    }
+
+
+def print_report(results: List[Dict[str, Any]]):
+    """Print a fixed-width summary table"""
+    header = f"{'pipeline':<10} {'ok':>7} {'wall s':>8} {'tools/s':>8} {'p50 s':>7} {'p95 s':>7} {'calls':>6} {'retries':>7}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(
+            f"{r['pipeline']:<10} {r['succeeded']:>3}/{r['tools']:<3} {r['wall_seconds']:>8.2f} "
+            f"{r['tools_per_second']:>8.2f} {r['p50_seconds']:>7.3f} {r['p95_seconds']:>7.3f} "
+            f"{r['api_calls']:>6} {r['retries']:>7}"
+        )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark the updater pipelines against an offline Gemini stand-in")
+    parser.add_argument('--pipelines', nargs='+', choices=PIPELINES, default=list(PIPELINES))
+    parser.add_argument('--tools', type=int, default=10, help="Tools per pipeline")
+    parser.add_argument('--latency', type=float, default=0.2, help="Mean fake API latency (seconds)")
+    parser.add_argument('--jitter', type=float, default=0.05, help="Latency jitter (seconds)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of calls raising a 503")
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help="Fraction of responses with broken JSON")
+    parser.add_argument('--rpm-limit', type=float, help="Fake server quota; extra calls get a 429")
+    parser.add_argument('--rpm', type=float, default=600, help="Client requests/minute for AIToolsUpdater")
+    parser.add_argument('--workers', type=int, default=4, help="Concurrent requests for AIToolsUpdater")
+    parser.add_argument('--delay', type=float, default=0.0, help="Fixed inter-call delay for sequential paths")
+    parser.add_argument('--prompt-batch', type=int, default=1, help="Tools per request for AIToolsUpdater")
+    parser.add_argument('--retry-delay', type=float, default=0.25, help="First retry backoff (seconds)")
+    parser.add_argument('--sequential', action='store_true', help="Use AIToolsUpdater's sequential batch mode")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for fault injection")
+    parser.add_argument('--json', metavar='PATH', help="Also write results as JSON")
+    parser.add_argument('--verbose', action='store_true', help="Keep the pipelines' INFO logging")
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+    if not args.verbose:
+        # Configured before the updaters call basicConfig, which then no-ops
+        logging.basicConfig(level=logging.WARNING)
+    server = start_link_server()
+    site_url = f"http://127.0.0.1:{server.server_port}"
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix='benchmark_updater_') as workdir:
+            for pipeline in args.pipelines:
+                print(f"⏱️  Benchmarking {pipeline}...")
+                results.append(benchmark(pipeline, args, site_url, Path(workdir)))
+    finally:
+        server.shutdown()
+
+    print()
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'settings': vars(args), 'results': results}, f, indent=2)
+        print(f"\n📁 Results saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
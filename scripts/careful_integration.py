@@ -7,30 +7,33 @@ file while preserving the exact TypeScript interface structure.
 """
 
 import json
-import re
 import os
+import re
+import argparse
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from atomic_io import atomic_write_text, file_lock
+from backup_store import BackupStore
+from run_metrics import RunMetrics
+from tool_schema import AITool, validate
+from ts_data_parser import ToolIndex, TSParseError, parse_tools_array, splice, tool_hash
+from ts_emitter import emit_ts
 
 class CarefulDataIntegrator:
     def __init__(self):
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.project_root = os.path.dirname(self.script_dir)
         self.ts_file_path = os.path.join(self.project_root, 'src/data/aiToolsData.ts')
-        self.json_file_path = os.path.join(self.script_dir, 'ai_tools_updated.json')
-        
-        # Fields that exist in the TypeScript interface
-        self.valid_fields = {
-            'id', 'name', 'company', 'category', 'subCategory', 'description', 
-            'longDescription', 'coreFeatures', 'uniqueSellingPoints', 'features',
-            'modelType', 'contextWindow', 'languages', 'platforms', 'pricing',
-            'apiAccess', 'freeTrialAvailable', 'pricingDetails', 'capabilities',
-            'useCases', 'limitations', 'performance', 'integrations', 'sdks',
-            'installation', 'officialWebsite', 'documentation', 'apiDocs',
-            'githubRepo', 'communityForum', 'communityResources', 'tutorials',
-            'releaseDate', 'lastUpdated', 'version', 'popularity', 'status',
-            'userCount', 'tags'
-        }
+        # Where update_ai_tools.py saves its results (Config.OUTPUT_FILE)
+        self.json_file_path = os.path.join(self.project_root, 'src/data/aiToolsData_updated.json')
+        self.metrics = RunMetrics('careful_integration')
+        self.metrics_file = os.path.join(self.script_dir, 'logs', 'careful_integration_metrics.json')
+        
+        # Fields of the TypeScript interface (tool_schema.py is generated from src/types/aiTools.ts)
+        self.valid_fields = frozenset(AITool.__slots__)
+        # tool id -> problems found in its update; those fields are left as they were
+        self.rejected: Dict[str, List[str]] = {}
         
     def load_updated_data(self) -> Dict[str, Any]:
         """Load the updated data from JSON file"""
@@ -41,164 +44,169 @@ class CarefulDataIntegrator:
         with open(self.json_file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     
-    def clean_tool_data(self, tool_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Remove fields that don't exist in the TypeScript interface"""
-        cleaned = {}
-        for key, value in tool_data.items():
-            if key in self.valid_fields:
-                cleaned[key] = value
-            else:
-                print(f"⚠️  Skipping invalid field: {key}")
-        return cleaned
-    
-    def format_value_for_ts(self, value: Any, indent: int = 0) -> str:
-        """Format a Python value for TypeScript syntax"""
-        spaces = '  ' * indent
-        
-        if value is None:
-            return 'undefined'
-        elif isinstance(value, bool):
-            return 'true' if value else 'false'
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, str):
-            # Escape single quotes and wrap in single quotes
-            escaped = value.replace("'", "\\'").replace('\n', '\\n')
-            return f"'{escaped}'"
-        elif isinstance(value, list):
-            if not value:
-                return '[]'
-            items = []
-            for item in value:
-                if isinstance(item, dict):
-                    items.append(self.format_object_for_ts(item, indent + 1))
+    def iter_updated_tools(self, updated_data: Dict[str, Any], index: Optional[ToolIndex] = None):
+        """Yield (tool_id, tool_data) from either {id: tool} or {"tools": [...]} data
+        
+        Records in a "tools" list are matched by the catalog id the updater
+        stamps on them. Records without one (saved before ids were stamped)
+        are looked up in index by name, then by a slug of the name; those
+        that still match no tool are skipped.
+        """
+        if isinstance(updated_data.get('tools'), list):
+            for tool_data in updated_data['tools']:
+                tool_id = index.resolve(tool_data) if index is not None else tool_data.get('id')
+                if tool_id:
+                    yield tool_id, tool_data
                 else:
-                    items.append(self.format_value_for_ts(item, 0))
-            
-            if all(not isinstance(item, dict) for item in value):
-                # Simple array on one line
-                return '[' + ', '.join(items) + ']'
-            else:
-                # Complex array with line breaks
-                formatted_items = [f"{spaces}  {item}" for item in items]
-                return '[\n' + ',\n'.join(formatted_items) + f'\n{spaces}]'
-        elif isinstance(value, dict):
-            return self.format_object_for_ts(value, indent)
+                    print(f"⚠️  Skipping {tool_data.get('name', 'a record')}: no catalog id and no tool of that name")
         else:
-            return f"'{str(value)}'"
+            for tool_id, tool_data in updated_data.items():
+                if isinstance(tool_data, dict):
+                    yield tool_id, tool_data
     
-    def format_object_for_ts(self, obj: Dict[str, Any], indent: int = 0) -> str:
-        """Format a dictionary as TypeScript object syntax"""
-        spaces = '  ' * indent
-        if not obj:
-            return '{}'
-        
-        items = []
-        for key, value in obj.items():
-            formatted_value = self.format_value_for_ts(value, indent + 1)
-            items.append(f"{spaces}  {key}: {formatted_value}")
-        
-        return '{\n' + ',\n'.join(items) + f'\n{spaces}' + '}'
+    def clean_tool_data(self, tool_data: Dict[str, Any], tool_id: str = '') -> Dict[str, Any]:
+        """
+        Keep only fields that exist in the TypeScript interface and hold valid values.
+        
+        Dropped fields and the reasons are collected in self.rejected[tool_id].
+        """
+        cleaned = {key: value for key, value in tool_data.items() if key in self.valid_fields}
+        problems = [f"AITool.{key}: unknown field" for key in tool_data if key not in self.valid_fields]
+        
+        # Required fields come from the existing entry, so only the values present are checked
+        errors = validate(cleaned, partial=True)
+        for error in errors:
+            field = re.match(r'AITool\.(\w+)', error)
+            if field:
+                cleaned.pop(field.group(1), None)
+        problems.extend(errors)
+        
+        if problems:
+            self.rejected.setdefault(tool_id, []).extend(problems)
+        return cleaned
     
-    def update_tool_in_ts(self, ts_content: str, tool_id: str, updated_tool: Dict[str, Any]) -> str:
-        """Update a specific tool in the TypeScript content"""
-        # Find the tool object in the array
-        pattern = rf"(\s*\{{\s*id:\s*['\"]({re.escape(tool_id)})['\"],.*?\}}\s*,?)"
-        
-        # Use a more sophisticated approach to find the complete object
-        lines = ts_content.split('\n')
-        start_line = -1
-        end_line = -1
-        brace_count = 0
-        found_tool = False
-        
-        for i, line in enumerate(lines):
-            if f"id: '{tool_id}'" in line or f'id: "{tool_id}"' in line:
-                start_line = i
-                # Find the opening brace for this object
-                for j in range(i, -1, -1):
-                    if '{' in lines[j]:
-                        start_line = j
-                        found_tool = True
-                        break
-                break
-        
-        if not found_tool:
-            print(f"⚠️  Tool {tool_id} not found in TypeScript file")
-            return ts_content
+    def build_tool_object(self, entry: Dict[str, Any], updated_tool: Dict[str, Any]) -> Dict[str, Any]:
+        """Existing fields overlaid with the cleaned update, keeping the file's key order"""
+        merged = dict(entry['fields'])
+        merged.update(self.clean_tool_data(updated_tool, entry['id']))
+        merged['id'] = entry['id']
+        return merged
+    
+    def update_tool_in_ts(self, ts_content: str, tool_id: str, updated_tool: Dict[str, Any],
+                          entries: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Update a specific tool in the TypeScript content
         
-        # Find the end of this object
-        brace_count = 0
-        for i in range(start_line, len(lines)):
-            line = lines[i]
-            brace_count += line.count('{') - line.count('}')
-            if brace_count == 0 and i > start_line:
-                end_line = i
-                break
-        
-        if end_line == -1:
-            print(f"⚠️  Could not find end of object for tool {tool_id}")
-            return ts_content
+        entries may be passed in from a previous parse_tools_array() call on
+        the same ts_content to avoid re-parsing the file.
+        """
+        if entries is None:
+            entries = parse_tools_array(ts_content)
         
-        # Clean the tool data
-        cleaned_tool = self.clean_tool_data(updated_tool)
+        entry = next((e for e in entries if e['id'] == tool_id), None)
+        if entry is None:
+            print(f"⚠️  Tool {tool_id} not found in TypeScript file")
+            return ts_content
         
         # Generate the new tool object
-        new_tool_content = self.format_object_for_ts(cleaned_tool, 1)
+        new_tool_content = emit_ts(self.build_tool_object(entry, updated_tool), 1)
         
-        # Replace the old content with new content
-        new_lines = lines[:start_line] + [f"  {new_tool_content},"] + lines[end_line + 1:]
-        
-        return '\n'.join(new_lines)
+        # Replace exactly the object's span; surrounding commas and layout stay as they were
+        return ts_content[:entry['start']] + new_tool_content + ts_content[entry['end']:]
     
-    def integrate_updates(self):
-        """Main integration function"""
+    def integrate_updates(self, force: bool = False, updated_data: Optional[Dict[str, Any]] = None,
+                          index: Optional[ToolIndex] = None) -> Optional[str]:
+        """Main integration function
+        
+        Only tools whose normalized fields actually differ from the file are
+        rewritten. When nothing differs the file (and its mtime) is left alone,
+        so the dev server and build do not recompile for a no-op update.
+        Pass force=True to rewrite every listed tool regardless.
+        
+        updated_data and index default to the JSON and TypeScript files on
+        disk; pipeline.py passes the copies it already holds in memory.
+        Returns the new file content, or None if the file was not written.
+        """
         print("🔄 Starting careful data integration...")
         
         # Load updated data
-        updated_data = self.load_updated_data()
+        if updated_data is None:
+            with self.metrics.time('load_json'):
+                updated_data = self.load_updated_data()
         if not updated_data:
             print("❌ No updated data to integrate")
-            return
-        
-        # Create backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = os.path.join(self.script_dir, 'backups', f'aiToolsData_careful_backup_{timestamp}.ts')
-        os.makedirs(os.path.dirname(backup_path), exist_ok=True)
-        
-        # Read current TypeScript file
-        if not os.path.exists(self.ts_file_path):
-            print(f"❌ TypeScript file not found: {self.ts_file_path}")
-            return
-        
-        with open(self.ts_file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+            return None
         
-        # Create backup
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(original_content)
-        print(f"💾 Backup created: {backup_path}")
+        if index is None:
+            # Read current TypeScript file
+            if not os.path.exists(self.ts_file_path):
+                print(f"❌ TypeScript file not found: {self.ts_file_path}")
+                return None
+            
+            try:
+                with self.metrics.time('parse_ts'):
+                    index = ToolIndex.load(self.ts_file_path)
+            except TSParseError as e:
+                print(f"❌ Could not parse tools array: {e}")
+                return None
+        original_content = index.text
         
-        # Process each updated tool
-        updated_content = original_content
-        tools_updated = 0
+        # Work out which tools changed before touching the file
+        edits = []
+        updated_ids = []
+        tools_processed = 0
+        tools_unchanged = 0
         
-        for tool_id, tool_data in updated_data.items():
-            print(f"🔄 Updating tool: {tool_id}")
+        # Several records can resolve to one tool id; the last one wins
+        updates = dict(self.iter_updated_tools(updated_data, index))
+        for tool_id, tool_data in updates.items():
+            tools_processed += 1
+            entry = index.get(tool_id)
+            if entry is None:
+                print(f"⚠️  Tool {tool_id} not found in TypeScript file")
+                continue
             try:
-                updated_content = self.update_tool_in_ts(updated_content, tool_id, tool_data)
-                tools_updated += 1
-                print(f"✅ Updated: {tool_id}")
+                with self.metrics.time('diff'):
+                    new_tool = self.build_tool_object(entry, tool_data)
+                    unchanged = not force and tool_hash(new_tool) == entry['hash']
+                if unchanged:
+                    tools_unchanged += 1
+                    continue
+                
+                print(f"🔄 Updating tool: {tool_id}")
+                with self.metrics.time('format'):
+                    edits.append((entry['start'], entry['end'], emit_ts(new_tool, 1)))
+                updated_ids.append(tool_id)
             except Exception as e:
                 print(f"❌ Failed to update {tool_id}: {str(e)}")
         
-        # Write the updated content back
-        with open(self.ts_file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        tools_updated = len(updated_ids)
+        rejected_count = sum(len(problems) for problems in self.rejected.values())
+        if rejected_count:
+            print(f"⚠️  Left {rejected_count} unknown or invalid fields unchanged in {len(self.rejected)} tools "
+                  f"(listed in CAREFUL_INTEGRATION_SUMMARY.md)")
+        self.metrics.set_counter('fields_rejected', rejected_count)
+        self.metrics.set_counter('tools_processed', tools_processed)
+        self.metrics.set_counter('tools_updated', tools_updated)
+        self.metrics.set_counter('tools_unchanged', tools_unchanged)
+        if not edits:
+            print(f"\n✅ No changes detected in {tools_processed} tools; {self.ts_file_path} left untouched")
+            return None
+        
+        # Create backup (unchanged versions are stored only once)
+        with self.metrics.time('backup'):
+            backup = BackupStore.from_config().save(self.ts_file_path, label='careful_integration')
+        backup_id = backup['hash'][:12]
+        print(f"💾 Backup created: {backup_id} (restore with: python scripts/backup_store.py restore {backup_id})")
+        
+        # Write the updated content back in a single pass
+        with self.metrics.time('write'):
+            updated_content = splice(original_content, edits)
+            atomic_write_text(self.ts_file_path, updated_content)
         
         print(f"\n📊 Integration complete!")
         print(f"✅ Tools updated: {tools_updated}")
-        print(f"💾 Backup saved: {backup_path}")
+        print(f"⏭️  Tools unchanged: {tools_unchanged}")
+        print(f"💾 Backup saved: {backup_id}")
         
         # Generate summary
         summary_path = os.path.join(self.project_root, 'CAREFUL_INTEGRATION_SUMMARY.md')
@@ -206,21 +214,45 @@ class CarefulDataIntegrator:
             f.write(f"# Careful AI Tools Data Integration Summary\n\n")
             f.write(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             f.write(f"## Results\n\n")
-            f.write(f"- **Tools processed:** {len(updated_data)}\n")
+            f.write(f"- **Tools processed:** {tools_processed}\n")
             f.write(f"- **Tools updated:** {tools_updated}\n")
-            f.write(f"- **Backup location:** `{backup_path}`\n\n")
+            f.write(f"- **Tools unchanged:** {tools_unchanged}\n")
+            f.write(f"- **Backup:** `{backup_id}` (restore with `python scripts/backup_store.py restore {backup_id}`)\n\n")
             f.write(f"## Updated Tools\n\n")
             
-            for tool_id in updated_data.keys():
+            for tool_id in updated_ids:
                 f.write(f"- {tool_id}\n")
             
+            if self.rejected:
+                f.write(f"\n## Rejected Fields\n\n")
+                f.write(f"These values did not match `src/types/aiTools.ts`; the existing values were kept.\n\n")
+                for tool_id, problems in sorted(self.rejected.items()):
+                    for problem in problems:
+                        f.write(f"- `{tool_id}`: {problem}\n")
+            
             f.write(f"\n## Next Steps\n\n")
             f.write(f"1. Run `npm run type-check` to verify TypeScript compilation\n")
             f.write(f"2. Test the application with `npm run dev`\n")
             f.write(f"3. Review the updated data in the browser\n")
         
         print(f"📋 Summary saved: {summary_path}")
+        return updated_content
+
+    def save_metrics(self):
+        """Write stage timings and counters for this integration run"""
+        try:
+            self.metrics.write_json(self.metrics_file)
+            print(f"📈 Run metrics saved to: {self.metrics_file}")
+        except OSError as e:
+            print(f"⚠️  Could not save run metrics: {e}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Carefully integrate updated AI tool data into aiToolsData.ts")
+    parser.add_argument('--force', action='store_true',
+                        help="Rewrite every listed tool even if its data is unchanged")
+    args = parser.parse_args()
+    
     integrator = CarefulDataIntegrator()
-    integrator.integrate_updates()
\ No newline at end of file
+    with file_lock(integrator.ts_file_path):
+        integrator.integrate_updates(force=args.force)
+    integrator.save_metrics()
\ No newline at end of file
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Field-Level Delta Refresh
+
+A full refresh asks the model to write out a whole tool record
+(descriptions, features, USPs, platforms, ...) although most of it rarely
+changes between runs. In delta mode the prompt instead carries:
+
+- a compact JSON summary of what is already known (category and a
+  shortened description; name and company are in the question) as context
+- the current value of each volatile field (pricing, version, status and
+  contextWindow by default; [processing] volatile_fields in config.ini)
+
+and asks for a JSON object holding only the volatile fields whose value
+has changed, or {} when none has. The reply is a handful of tokens instead
+of a full record, and merge_delta() lays it over the existing record:
+
+- fields outside the requested set are ignored
+- placeholder answers ("Unknown", "N/A", ...) are ignored
+- values that fail the AITool schema (e.g. an unknown status) are dropped
+- lastUpdated is set to today either way, since the tool has been checked
+
+Usage:
+    prompt = delta_prompt(record, VOLATILE_FIELDS)
+    merged, changed = merge_delta(record, extract_json(response.text), VOLATILE_FIELDS)
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tool_schema import AITool, validate
+
+VOLATILE_FIELDS = ('pricing', 'version', 'status', 'contextWindow')
+CONTEXT_FIELDS = ('category', 'description')
+CONTEXT_DESCRIPTION_CHARS = 160
+
+_PLACEHOLDERS = {'', 'unknown', 'not available', 'n/a', 'none', 'null', 'unchanged'}
+
+
+def parse_field_list(raw: str) -> Tuple[str, ...]:
+    """A comma-separated list of AITool field names; unknown names are skipped"""
+    fields = [field.strip() for field in raw.split(',')]
+    return tuple(dict.fromkeys(field for field in fields if field in AITool.__slots__))
+
+
+def can_delta(record: Optional[Dict[str, Any]]) -> bool:
+    """Whether a record holds enough context to ask for changes only"""
+    return bool(record) and all(isinstance(record.get(field), str) and record[field]
+                                for field in ('name', 'description'))
+
+
+def compact_context(record: Dict[str, Any], fields: Iterable[str]) -> str:
+    """One line of JSON: what is known about the tool, and the current volatile values"""
+    known = {field: record[field] for field in CONTEXT_FIELDS if record.get(field)}
+    description = known.get('description', '')
+    if len(description) > CONTEXT_DESCRIPTION_CHARS:
+        known['description'] = description[:CONTEXT_DESCRIPTION_CHARS].rsplit(' ', 1)[0] + '…'
+    current = {field: record.get(field) for field in fields}
+    return json.dumps({'known': known, 'current': current}, ensure_ascii=False, separators=(',', ':'))
+
+
+def delta_prompt(record: Dict[str, Any], fields: Iterable[str]) -> str:
+    """Ask which of fields have changed for one tool (no date, so the response cache can answer it on a later day)"""
+    fields = list(fields)
+    return f"""
+Check whether any of these details of the AI tool "{record['name']}" by {record.get('company', 'Unknown')} have changed as of today: {', '.join(fields)}.
+
+What is already known (null means not known yet):
+{compact_context(record, fields)}
+
+Reply with a JSON object containing only those of the fields above whose value has changed or is null, each with its new value as a string. Reply with {{}} if nothing has changed. Do not include any other fields.
+"""
+
+
+def delta_batch_prompt(records: List[Dict[str, Any]], fields: Iterable[str]) -> str:
+    """Ask which of fields have changed for several tools, answered as a JSON array"""
+    fields = list(fields)
+    tool_lines = '\n'.join(
+        f'{ref}. "{record["name"]}" by {record.get("company", "Unknown")}\n   {compact_context(record, fields)}'
+        for ref, record in enumerate(records, 1)
+    )
+    return f"""
+Check whether any of these details have changed as of today for each of the following AI tools: {', '.join(fields)}.
+Under each tool is what is already known (null means not known yet).
+
+{tool_lines}
+
+Reply with a JSON array with exactly one object per tool, in the same order. Each object must include "ref" set to the tool's number above, plus only those of the fields above whose value has changed or is null, each with its new value as a string ({{"ref": 1}} if nothing has changed for tool 1).
+"""
+
+
+def _is_placeholder(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value.strip().lower() in _PLACEHOLDERS)
+
+
+def merge_delta(record: Dict[str, Any], delta: Dict[str, Any], fields: Iterable[str],
+                today: Optional[str] = None) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    record with the changed fields from delta applied.
+
+    Returns (merged copy, names of the fields that changed). Anything in
+    delta outside fields, placeholder answers and values that fail the
+    AITool schema are left out.
+    """
+    changes = {
+        field: delta[field]
+        for field in fields
+        if field in delta and not _is_placeholder(delta[field]) and delta[field] != record.get(field)
+    }
+    for error in validate(changes, partial=True):
+        field = re.match(r'AITool\.(\w+)', error)
+        if field:
+            changes.pop(field.group(1), None)
+
+    merged = dict(record)
+    merged.update(changes)
+    merged['lastUpdated'] = today or datetime.now().strftime('%Y-%m-%d')
+    return merged, list(changes)
@@ -5,41 +5,75 @@ Automatically gathers accurate and up-to-date information for AI tools.
 """
 
 import os
-import json
-import logging
-import time
+import argparse
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
-import google.generativeai as genai
-from dotenv import load_dotenv
-import requests
 from urllib.parse import urlparse
-import re
 
-# Load environment variables
-load_dotenv('../.env.local')
+from atomic_io import atomic_write_json
+from backup_store import BackupStore
+from log_setup import configure_logging, logging_settings
+from gemini_client import LazyGeminiModel, load_env_file
+from response_cache import CachedModel, ResponseCache
+from json_extract import try_extract_json
+from retry_policy import MalformedResponseError, RetryPolicy
+from run_metrics import RunMetrics
+from tool_aggregates import Aggregates
 
 class EnhancedAIToolsUpdater:
-    def __init__(self):
-        """Initialize the enhanced AI tools updater."""
-        self.api_key = os.getenv('GEMINI_API_KEY')
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
+    MODEL_NAME = 'gemini-1.5-flash'
+
+    def __init__(self, max_age: Optional[float] = None, model: Any = None, use_cache: bool = True,
+                 output_dir: str = '.', rate_limit_delay: float = 2):
+        """Initialize the enhanced AI tools updater.
+
+        max_age: ignore cached responses older than this many seconds.
+        model: optional stand-in for the Gemini model (see fake_gemini.py).
+        use_cache: set False to always call the model.
+        output_dir: where the output, report, log and metrics files go.
+        rate_limit_delay: seconds to wait after each real API call.
+        """
+        self.output_dir = output_dir
+        self.rate_limit_delay = rate_limit_delay
+        if model is None:
+            # Load environment variables
+            load_env_file('../.env.local')
+            self.api_key = os.getenv('GEMINI_API_KEY')
+            if not self.api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment variables")
+            
+            # Gemini is imported and configured on the first request
+            model = LazyGeminiModel(self.MODEL_NAME, self.api_key)
         
-        # Configure Gemini
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        # Repeated prompts are answered from the response cache
+        self.model = CachedModel(
+            model,
+            ResponseCache.from_config() if use_cache else None,
+            self.MODEL_NAME,
+            max_age=max_age
+        )
         
         # Setup logging
         self.setup_logging()
         
+        # Stage timings and counters, saved at the end of run()
+        self.metrics = RunMetrics('enhanced_ai_tools_updater')
+        self.metrics_file = os.path.join(self.output_dir, 'logs', 'enhanced_update_metrics.json')
+        self.prometheus_file = None
+        
+        # Backoff for 429s and server errors; malformed answers are re-asked
+        self.retry_policy = RetryPolicy(
+            max_attempts=3, base_delay=2, logger=self.logger,
+            sleep=lambda seconds: self.metrics.sleep(seconds, 'retry_backoff')
+        )
+        
+        # Shared keep-alive link checker, created on first use
+        self._url_verifier = None
+        
         # Data directories
         self.data_dir = '../src/data'
-        self.output_file = 'ai_tools_enhanced_update.json'
-        self.backup_dir = 'backups'
-        
-        # Ensure directories exist
-        os.makedirs(self.backup_dir, exist_ok=True)
+        self.output_file = os.path.join(self.output_dir, 'ai_tools_enhanced_update.json')
+        self.report_file = os.path.join(self.output_dir, 'ENHANCED_UPDATE_REPORT.md')
         
         # AI tools to focus on
         self.priority_tools = [
@@ -53,33 +87,61 @@ class EnhancedAIToolsUpdater:
         ]
 
     def setup_logging(self):
-        """Setup logging configuration."""
-        log_dir = 'logs'
-        os.makedirs(log_dir, exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(f'{log_dir}/enhanced_ai_tools_update.log'),
-                logging.StreamHandler()
-            ]
+        """Setup queued logging (JSON lines to the log file); level from config.ini [logging]."""
+        self.logger = configure_logging(
+            __name__,
+            os.path.join(self.output_dir, 'logs', 'enhanced_ai_tools_update.log'),
+            **logging_settings(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.ini'))
         )
-        self.logger = logging.getLogger(__name__)
+
+    @property
+    def url_verifier(self):
+        """Link checker with cached results between runs (imports requests on first use)"""
+        if self._url_verifier is None:
+            from url_verifier import URLVerifier
+            self._url_verifier = URLVerifier()
+        return self._url_verifier
+
+    @url_verifier.setter
+    def url_verifier(self, verifier):
+        self._url_verifier = verifier
 
     def verify_url(self, url: str) -> bool:
         """Verify if a URL is valid and accessible."""
-        try:
-            if not url or not url.startswith(('http://', 'https://')):
-                return False
-            
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            return response.status_code == 200
-        except:
-            return False
+        return self.url_verifier.verify(url)
 
-    def get_current_tool_info(self, tool_name: str) -> Optional[Dict[str, Any]]:
-        """Get current, up-to-date information for an AI tool using Gemini."""
+    def apply_url_checks(self, tool_name: str, tool_data: Dict[str, Any], url_status: Dict[str, bool]):
+        """Replace unreachable URLs in tool_data using precomputed check results."""
+        if 'officialWebsite' in tool_data:
+            if not url_status.get(tool_data['officialWebsite'], False):
+                tool_data['officialWebsite'] = f"https://search.google.com/search?q={tool_name.replace(' ', '+')}"
+        
+        if 'documentation' in tool_data:
+            if not url_status.get(tool_data['documentation'], False):
+                tool_data['documentation'] = tool_data['officialWebsite']
+
+    def verify_tool_urls(self, tools: List[Dict[str, Any]]):
+        """Check every tool's URLs in one concurrent batch and apply fallbacks."""
+        urls = [
+            tool[field]
+            for tool in tools
+            for field in ('officialWebsite', 'documentation')
+            if tool.get(field)
+        ]
+        self.logger.info(f"🔗 Verifying {len(set(urls))} URLs for {len(tools)} tools...")
+        with self.metrics.time('verify_urls'):
+            url_status = self.url_verifier.verify_many(urls)
+        self.metrics.increment('urls_checked', len(set(urls)))
+        
+        for tool in tools:
+            self.apply_url_checks(tool.get('name', ''), tool, url_status)
+
+    def get_current_tool_info(self, tool_name: str, verify_urls: bool = True) -> Optional[Dict[str, Any]]:
+        """Get current, up-to-date information for an AI tool using Gemini.
+
+        With verify_urls=False the URLs are left for verify_tool_urls() to
+        check in a batch together with the rest of the run.
+        """
         
         prompt = f"""
         Please provide the most current and accurate information about the AI tool "{tool_name}" as of October 2025. 
@@ -124,125 +186,130 @@ class EnhancedAIToolsUpdater:
         Please ensure all information is current as of October 2025. If you don't have exact information for a field, provide the most reasonable estimate or mark as "Unknown" for strings and false for booleans.
         """
         
-        try:
-            self.logger.info(f"🔍 Fetching current info for: {tool_name}")
-            
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
+        def attempt() -> Dict[str, Any]:
+            with self.metrics.time('api_call'):
+                response = self.model.generate_content(prompt)
             
             # Extract JSON from response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                tool_data = json.loads(json_match.group())
-                
-                # Verify and clean URLs
-                if 'officialWebsite' in tool_data:
-                    if not self.verify_url(tool_data['officialWebsite']):
-                        tool_data['officialWebsite'] = f"https://search.google.com/search?q={tool_name.replace(' ', '+')}"
-                
-                if 'documentation' in tool_data:
-                    if not self.verify_url(tool_data['documentation']):
-                        tool_data['documentation'] = tool_data['officialWebsite']
-                
-                self.logger.info(f"✅ Successfully fetched info for: {tool_name}")
-                return tool_data
-            else:
-                self.logger.error(f"❌ No valid JSON found in response for {tool_name}")
-                return None
-                
+            with self.metrics.time('parse'):
+                tool_data = try_extract_json(response.text.strip())
+            if not tool_data:
+                self.metrics.increment('parse_failures')
+                self.model.invalidate(prompt)
+                raise MalformedResponseError("No valid JSON found in response")
+            return tool_data
+        
+        try:
+            self.logger.info("🔍 Fetching current info for: %s", tool_name, extra={'tool': tool_name, 'stage': 'fetch'})
+            with self.metrics.time('fetch_tool'):
+                tool_data = self.retry_policy.call(attempt, description=tool_name)
         except Exception as e:
-            self.logger.error(f"❌ Error fetching info for {tool_name}: {str(e)}")
+            self.logger.error("❌ Error fetching info for %s: %s", tool_name, e, extra={'tool': tool_name, 'stage': 'fetch'})
+            self.model.invalidate(prompt)
             return None
+        
+        # Verify and clean URLs (both checked concurrently)
+        if verify_urls:
+            with self.metrics.time('verify_urls'):
+                url_status = self.url_verifier.verify_many(
+                    [tool_data.get('officialWebsite'), tool_data.get('documentation')]
+                )
+            self.apply_url_checks(tool_name, tool_data, url_status)
+        
+        self.logger.info("✅ Successfully fetched info for: %s", tool_name, extra={'tool': tool_name, 'stage': 'fetch'})
+        return tool_data
 
     def create_backup(self):
-        """Create backup of existing data."""
+        """Back up existing data to the deduplicated store."""
         try:
-            existing_file = f'{self.data_dir}/aiToolsData.ts'
-            if os.path.exists(existing_file):
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_file = f'{self.backup_dir}/aiToolsData_enhanced_backup_{timestamp}.ts'
-                
-                with open(existing_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                self.logger.info(f"💾 Backup created: {backup_file}")
-                return backup_file
+            entry = BackupStore.from_config().save(f'{self.data_dir}/aiToolsData.ts', label='enhanced_ai_tools_updater')
+            if entry:
+                self.logger.info(f"💾 Backup created: {entry['hash'][:12]}")
+                return entry['hash'][:12]
         except Exception as e:
             self.logger.error(f"❌ Error creating backup: {str(e)}")
         return None
 
+    def add_tool_metadata(self, tool_name: str, tool_info: Dict[str, Any]):
+        """Fill in the structured fields the site expects from the fetched info."""
+        tool_info.update({
+            'id': tool_name.lower().replace(' ', '-').replace('.', ''),
+            'features': [
+                {'name': feature, 'description': f"{feature} capability", 'available': True}
+                for feature in tool_info.get('coreFeatures', [])
+            ],
+            'capabilities': [
+                {'name': usp, 'description': f"{usp} functionality", 'level': 'Advanced'}
+                for usp in tool_info.get('uniqueSellingPoints', [])
+            ],
+            'useCases': [
+                {
+                    'title': f"{tool_info.get('category', 'General')} Use Case",
+                    'description': f"Professional use of {tool_name} for {tool_info.get('category', 'various tasks')}",
+                    'industry': 'Technology',
+                    'benefits': ['Efficiency', 'Quality', 'Innovation']
+                }
+            ],
+            'integrations': [
+                {'name': 'API', 'description': 'REST API integration', 'type': 'API'},
+                {'name': 'Web', 'description': 'Web-based interface', 'type': 'Native'}
+            ],
+            'installation': {
+                'requirements': ['Internet connection', 'Modern web browser'],
+                'steps': [
+                    f"Visit {tool_info.get('officialWebsite', 'official website')}",
+                    "Create account or sign in",
+                    "Choose appropriate plan",
+                    "Start using the tool"
+                ]
+            },
+            'performance': {
+                'accuracy': 90,
+                'speed': 85,
+                'reliability': 95,
+                'latency': 'Low',
+                'uptime': '99.9%'
+            },
+            'popularity': {
+                'trendingScore': tool_info.get('popularityScore', 80),
+                'userCount': 100000,
+                'githubStars': 0,
+                'weeklyDownloads': 0
+            }
+        })
+
     def update_all_tools(self):
         """Update information for all priority AI tools."""
         updated_tools = []
         failed_tools = []
+        fetched = []
         
         self.logger.info(f"🚀 Starting enhanced update for {len(self.priority_tools)} AI tools...")
         
         for i, tool_name in enumerate(self.priority_tools, 1):
-            self.logger.info(f"📊 Progress: {i}/{len(self.priority_tools)} - {tool_name}")
+            self.logger.info("📊 Progress: %d/%d - %s", i, len(self.priority_tools), tool_name, extra={'tool': tool_name})
             
-            # Get current tool information
-            tool_info = self.get_current_tool_info(tool_name)
+            # Get current tool information; URLs are verified in one batch below
+            hits_before = self.model.hits
+            tool_info = self.get_current_tool_info(tool_name, verify_urls=False)
             
             if tool_info:
-                # Add additional metadata
-                tool_info.update({
-                    'id': tool_name.lower().replace(' ', '-').replace('.', ''),
-                    'features': [
-                        {'name': feature, 'description': f"{feature} capability", 'available': True}
-                        for feature in tool_info.get('coreFeatures', [])
-                    ],
-                    'capabilities': [
-                        {'name': usp, 'description': f"{usp} functionality", 'level': 'Advanced'}
-                        for usp in tool_info.get('uniqueSellingPoints', [])
-                    ],
-                    'useCases': [
-                        {
-                            'title': f"{tool_info.get('category', 'General')} Use Case",
-                            'description': f"Professional use of {tool_name} for {tool_info.get('category', 'various tasks')}",
-                            'industry': 'Technology',
-                            'benefits': ['Efficiency', 'Quality', 'Innovation']
-                        }
-                    ],
-                    'integrations': [
-                        {'name': 'API', 'description': 'REST API integration', 'type': 'API'},
-                        {'name': 'Web', 'description': 'Web-based interface', 'type': 'Native'}
-                    ],
-                    'installation': {
-                        'requirements': ['Internet connection', 'Modern web browser'],
-                        'steps': [
-                            f"Visit {tool_info.get('officialWebsite', 'official website')}",
-                            "Create account or sign in",
-                            "Choose appropriate plan",
-                            "Start using the tool"
-                        ]
-                    },
-                    'performance': {
-                        'accuracy': 90,
-                        'speed': 85,
-                        'reliability': 95,
-                        'latency': 'Low',
-                        'uptime': '99.9%'
-                    },
-                    'popularity': {
-                        'trendingScore': tool_info.get('popularityScore', 80),
-                        'userCount': 100000,
-                        'githubStars': 0,
-                        'weeklyDownloads': 0
-                    }
-                })
-                
-                updated_tools.append(tool_info)
-                self.logger.info(f"✅ Updated: {tool_name}")
+                fetched.append((tool_name, tool_info))
             else:
                 failed_tools.append(tool_name)
-                self.logger.warning(f"⚠️ Failed to update: {tool_name}")
+                self.logger.warning("⚠️ Failed to update: %s", tool_name, extra={'tool': tool_name})
             
-            # Rate limiting
-            time.sleep(2)
+            # Rate limiting, only needed after a real API call
+            if self.model.hits == hits_before:
+                self.metrics.sleep(self.rate_limit_delay)
+        
+        # Check every URL from this run at once, then build the final records
+        self.verify_tool_urls([tool_info for _, tool_info in fetched])
+        
+        for tool_name, tool_info in fetched:
+            self.add_tool_metadata(tool_name, tool_info)
+            updated_tools.append(tool_info)
+            self.logger.info("✅ Updated: %s", tool_name, extra={'tool': tool_name, 'stage': 'metadata'})
         
         return updated_tools, failed_tools
 
@@ -256,13 +323,14 @@ class EnhancedAIToolsUpdater:
         }
         
         # Save JSON output
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with self.metrics.time('save_output'):
+            atomic_write_json(self.output_file, output_data, indent=2, ensure_ascii=False)
         
         self.logger.info(f"💾 Updated data saved to: {self.output_file}")
         
         # Generate summary report
-        self.generate_summary_report(updated_tools)
+        with self.metrics.time('summary_report'):
+            self.generate_summary_report(updated_tools)
 
     def generate_summary_report(self, updated_tools: List[Dict[str, Any]]):
         """Generate a summary report of the updates."""
@@ -290,18 +358,15 @@ class EnhancedAIToolsUpdater:
         report += f"""
 ## Categories Distribution
 """
-        categories = {}
-        for tool in updated_tools:
-            category = tool.get('category', 'Unknown')
-            categories[category] = categories.get(category, 0) + 1
-        
-        for category, count in sorted(categories.items()):
-            report += f"- **{category}**: {count} tools\n"
+        aggregates = Aggregates()
+        aggregates.apply(updated_tools)
+        for category, ids in sorted(aggregates.categories.items()):
+            report += f"- **{category}**: {len(ids)} tools\n"
         
-        with open('ENHANCED_UPDATE_REPORT.md', 'w', encoding='utf-8') as f:
+        with open(self.report_file, 'w', encoding='utf-8') as f:
             f.write(report)
         
-        self.logger.info("📋 Summary report generated: ENHANCED_UPDATE_REPORT.md")
+        self.logger.info(f"📋 Summary report generated: {self.report_file}")
 
     def run(self):
         """Run the enhanced update process."""
@@ -309,10 +374,13 @@ class EnhancedAIToolsUpdater:
             self.logger.info("🚀 Starting Enhanced AI Tools Update Process...")
             
             # Create backup
-            backup_file = self.create_backup()
+            with self.metrics.time('backup'):
+                backup_file = self.create_backup()
             
             # Update all tools
             updated_tools, failed_tools = self.update_all_tools()
+            self.metrics.set_counter('tools_updated', len(updated_tools))
+            self.metrics.set_counter('tools_failed', len(failed_tools))
             
             if updated_tools:
                 # Save updated data
@@ -333,11 +401,42 @@ class EnhancedAIToolsUpdater:
         except Exception as e:
             self.logger.error(f"❌ Update process failed: {str(e)}")
             return False
+        finally:
+            self.save_metrics()
+
+    def save_metrics(self):
+        """Write the run's stage timings and counters (and the Prometheus file, if set)"""
+        self.metrics.set_counter('retries', self.retry_policy.retries)
+        self.metrics.set_counter('cache_hits', self.model.hits)
+        try:
+            self.metrics.write_json(self.metrics_file)
+            self.metrics.write_prometheus(self.prometheus_file)
+            self.logger.info(f"📈 Run metrics saved to: {self.metrics_file}")
+        except OSError as e:
+            self.logger.warning(f"Could not save run metrics: {e}")
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Enhanced AI tools updater")
+    parser.add_argument('--max-age', type=float, metavar='SECONDS',
+                        help="Ignore cached responses older than this (0 forces a full refresh)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="List the tools that would be updated without calling the API")
+    parser.add_argument('--prometheus-file', metavar='PATH',
+                        help="Also write run metrics in Prometheus text format")
+    args = parser.parse_args()
+    
     try:
-        updater = EnhancedAIToolsUpdater()
+        if args.dry_run:
+            # Stand-in model: nothing is imported or called
+            updater = EnhancedAIToolsUpdater(model=object(), use_cache=False)
+            print(f"🔍 Dry run: would update {len(updater.priority_tools)} tools:")
+            for tool_name in updater.priority_tools:
+                print(f"   - {tool_name}")
+            return
+        
+        updater = EnhancedAIToolsUpdater(max_age=args.max_age)
+        updater.prometheus_file = args.prometheus_file
         success = updater.run()
         
         if success:
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Offline Gemini Stand-in
+
+FakeGenerativeModel implements generate_content(prompt) like
+google.generativeai.GenerativeModel, without any network access. It answers
+tool prompts (single or numbered batch prompts) with plausible JSON and can inject the failure modes seen in
+production runs. Delta prompts (delta_refresh.py) are answered with only
+those requested fields whose value differs from the current one given in the
+prompt, or {} when none does, so their output size can be measured too.
+
+Failure modes:
+
+- latency: fixed delay plus random jitter per call
+- error_rate: fraction of calls that raise a 503-style server error
+- malformed_rate: fraction of responses whose JSON is broken
+- rpm_limit: calls beyond this many per rolling minute raise a 429 error
+  carrying a retry_delay, like the API's ResourceExhausted
+
+Every call is recorded in .calls so harnesses can count retries.
+
+Usage:
+    model = FakeGenerativeModel(latency=0.2, error_rate=0.05, rpm_limit=60)
+    updater = AIToolsUpdater(config, model=model)
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class FakeAPIError(Exception):
+    """Base class for injected API failures"""
+
+    code = 500
+
+
+class FakeServerError(FakeAPIError):
+    """Transient server-side failure (HTTP 503)"""
+
+    code = 503
+
+
+class FakeRateLimitError(FakeAPIError):
+    """Quota exceeded (HTTP 429); retry_delay is the server's suggested wait in seconds"""
+
+    code = 429
+
+    def __init__(self, message: str, retry_delay: float):
+        super().__init__(message)
+        self.retry_delay = retry_delay
+
+
+class FakeResponse:
+    """Minimal stand-in for a Gemini response"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGenerativeModel:
+    """In-process generate_content backend with configurable latency and faults"""
+
+    def __init__(self, latency: float = 0.1, jitter: float = 0.05, error_rate: float = 0.0,
+                 malformed_rate: float = 0.0, rpm_limit: Optional[float] = None,
+                 site_url: str = 'https://example.com', seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.rpm_limit = rpm_limit
+        self.site_url = site_url.rstrip('/')
+        self.calls: List[Dict[str, Any]] = []
+        self._random = random.Random(seed)
+        self._window: deque = deque()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def tool_names(prompt: str) -> List[str]:
+        """Tool names a prompt asks about (a numbered batch list, the first quoted name, or 'about X as of')"""
+        batch = re.findall(r'^\d+\. "([^"]+)" by ', prompt, re.MULTILINE)
+        if batch:
+            return batch
+        match = re.search(r'AI tool "([^"]+)"', prompt) or re.search(r'about (.+?) as of', prompt)
+        return [match.group(1)] if match else ['Unknown Tool']
+
+    @staticmethod
+    def delta_request(prompt: str) -> Optional[Tuple[List[str], List[Dict[str, Any]]]]:
+        """For a delta prompt: the fields asked about and each tool's current values, in order"""
+        match = re.search(r'^Check whether any of these details.*: ([\w, ]+)\.$', prompt, re.MULTILINE)
+        if not match:
+            return None
+        fields = [field.strip() for field in match.group(1).split(',')]
+        current = []
+        for line in re.findall(r'^\s*(\{"known":.*\})\s*$', prompt, re.MULTILINE):
+            try:
+                current.append(json.loads(line).get('current') or {})
+            except ValueError:
+                current.append({})
+        return fields, current
+
+    def _delta_record(self, name: str, fields: List[str], current: Dict[str, Any]) -> Dict[str, Any]:
+        record = self._tool_record(name)
+        return {field: record[field] for field in fields if field in record and record[field] != current.get(field)}
+
+    def _tool_record(self, name: str) -> Dict[str, Any]:
+        slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+        score = 50 + sum(map(ord, name)) % 50
+        return {
+            "name": name,
+            "company": f"{name.split()[0]} Labs",
+            "category": "Large Language Models",
+            "description": f"{name} is an AI tool used for benchmarking the update pipeline.",
+            "longDescription": f"{name} provides synthetic data for offline runs. " * 4,
+            "coreFeatures": [f"{name} feature {i}" for i in range(1, 5)],
+            "uniqueSellingPoints": [f"{name} advantage {i}" for i in range(1, 4)],
+            "pricing": "Freemium",
+            "apiAccess": True,
+            "freeTrialAvailable": True,
+            "platforms": ["Web", "API"],
+            "languages": ["English"],
+            "useCases": ["Benchmarking", "Testing"],
+            "limitations": ["Synthetic data"],
+            "officialWebsite": f"{self.site_url}/{slug}",
+            "documentation": f"{self.site_url}/{slug}/docs",
+            "releaseDate": "2024-01",
+            "lastUpdated": datetime.now().strftime('%Y-%m-%d'),
+            "version": "1.0",
+            "status": "Active",
+            "popularityScore": score,
+            "popularity": {"trendingScore": score, "marketShare": 5},
+            "tags": ["Benchmark"],
+        }
+
+    def _render(self, records: List[Dict[str, Any]], batch: bool, malformed: bool) -> str:
+        payload = records if batch else records[0]
+        body = json.dumps(payload, indent=2)
+        if not malformed:
+            return f"Here is the current information:\n```json\n{body}\n```"
+
+        kind = self._random.choice(('truncated', 'trailing_comma', 'trailing_prose'))
+        if kind == 'truncated':
+            return body[:len(body) // 2]
+        if kind == 'trailing_comma':
+            return re.sub(r'(\S)\n(\s*)([}\]])', r'\1,\n\2\3', body, count=1)
+        return f"{body}\n\nNote: values marked {{estimated}} are approximate."
+
+    def generate_content(self, prompt: str, **kwargs) -> FakeResponse:
+        """Answer a prompt after the configured latency, or raise an injected error"""
+        started = time.monotonic()
+        names = self.tool_names(prompt)
+        batch = bool(re.search(r'^1\. "', prompt, re.MULTILINE))
+
+        with self._lock:
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= 60:
+                self._window.popleft()
+            rate_limited = self.rpm_limit is not None and len(self._window) >= self.rpm_limit
+            if not rate_limited:
+                self._window.append(now)
+            retry_delay = 60 - (now - self._window[0]) if rate_limited else 0.0
+            roll = self._random.random()
+            malformed = self._random.random() < self.malformed_rate
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+        outcome = 'ok'
+        try:
+            if rate_limited:
+                outcome = 'rate_limited'
+                raise FakeRateLimitError("429 Resource has been exhausted (e.g. check quota).", retry_delay)
+
+            time.sleep(delay)
+            if roll < self.error_rate:
+                outcome = 'error'
+                raise FakeServerError("503 The service is currently unavailable.")
+
+            if malformed:
+                outcome = 'malformed'
+            delta = self.delta_request(prompt)
+            if delta:
+                fields, current = delta
+                records = [
+                    self._delta_record(name, fields, current[index] if index < len(current) else {})
+                    for index, name in enumerate(names)
+                ]
+            else:
+                records = [self._tool_record(name) for name in names]
+            if batch:
+                for ref, record in enumerate(records, 1):
+                    record['ref'] = ref
+            return FakeResponse(self._render(records, batch, malformed))
+        finally:
+            with self._lock:
+                self.calls.append({
+                    'tools': names,
+                    'outcome': outcome,
+                    'duration': time.monotonic() - started,
+                })
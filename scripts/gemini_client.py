@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Lazy Gemini Client
+
+google.generativeai pulls in the gRPC and protobuf stacks, which takes about
+a second to import. The helpers here keep that cost off the startup path:
+
+- LazyGeminiModel imports the client, configures the API key and builds the
+  model on its first generate_content() call, not when it is constructed
+- gemini_available() checks the package is installed without importing it
+- load_env_file() imports python-dotenv only when an env file is read
+
+Config lookups, dry runs and fake-backend runs therefore never load them.
+
+Usage:
+    model = LazyGeminiModel('gemini-2.5-flash', api_key)
+    response = model.generate_content(prompt)   # client is loaded here
+"""
+
+import importlib.util
+import threading
+from typing import Any
+
+INSTALL_HINT = "pip install python-dotenv google-generativeai requests"
+
+
+def gemini_available() -> bool:
+    """True if google-generativeai is installed (checked without importing it)"""
+    try:
+        return importlib.util.find_spec('google.generativeai') is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def load_env_file(path) -> bool:
+    """Load variables from a .env file into os.environ"""
+    from dotenv import load_dotenv
+    return load_dotenv(path)
+
+
+class LazyGeminiModel:
+    """generate_content() front end that builds the Gemini model on first use"""
+
+    def __init__(self, model_name: str, api_key: str):
+        self.model_name = model_name
+        self._api_key = api_key
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the client has been imported and the model built yet"""
+        return self._model is not None
+
+    def _load(self) -> Any:
+        with self._lock:
+            if self._model is None:
+                import google.generativeai as genai
+                genai.configure(api_key=self._api_key)
+                self._model = genai.GenerativeModel(self.model_name)
+            return self._model
+
+    def generate_content(self, prompt: str, **kwargs) -> Any:
+        """Forward to GenerativeModel.generate_content, loading the client if needed"""
+        return self._load().generate_content(prompt, **kwargs)
@@ -14,17 +14,30 @@ import json
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from atomic_io import atomic_write_text, file_lock
+from backup_store import BackupStore
+from run_metrics import RunMetrics
+from ts_data_parser import ToolIndex, TSParseError, parse_object_fields, parse_tools_array, splice
+from ts_emitter import emit_ts, quote_string
 
 
 class DataIntegrator:
     """Integrates updated AI tools data into the TypeScript file"""
     
+    # Top-level fields refreshed from the updated data
+    STRING_FIELDS = ('description', 'longDescription')
+    ARRAY_FIELDS = ('coreFeatures', 'uniqueSellingPoints')
+    UPDATED_COMMENT_RE = re.compile(r'[ \t]*// Updated on \S*')
+    
     def __init__(self):
         self.project_root = Path(__file__).parent.parent
         self.data_dir = self.project_root / 'src' / 'data'
         self.ts_file = self.data_dir / 'aiToolsData.ts'
         self.json_file = self.data_dir / 'aiToolsData_updated.json'
+        self.metrics = RunMetrics('integrate_updates')
+        self.metrics_file = self.project_root / 'scripts' / 'logs' / 'integrate_metrics.json'
         
     def load_updated_data(self) -> Dict[str, Any]:
         """Load the updated JSON data"""
@@ -49,135 +62,68 @@ class DataIntegrator:
     
     def extract_tool_objects(self, ts_content: str) -> List[Dict[str, Any]]:
         """Extract all tool objects from TypeScript content"""
-        # Find the array start
-        array_start = ts_content.find('export const aiToolsData: AITool[] = [')
-        if array_start == -1:
+        try:
+            entries = parse_tools_array(ts_content)
+        except TSParseError as e:
+            print(f"❌ Could not parse tools array: {e}")
             return []
         
-        # Find individual tool objects
-        tools = []
-        current_pos = array_start
-        
-        # Look for tool objects by finding opening braces after id field
-        pattern = r'\{\s*id:\s*[\'"]([^\'"]+)[\'"]'
-        matches = re.finditer(pattern, ts_content)
-        
-        for match in matches:
-            tool_id = match.group(1)
-            start_pos = match.start()
-            
-            # Find the matching closing brace
-            brace_count = 0
-            end_pos = start_pos
-            
-            for i, char in enumerate(ts_content[start_pos:], start_pos):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_pos = i + 1
-                        break
-            
-            if end_pos > start_pos:
-                tool_content = ts_content[start_pos:end_pos]
-                tools.append({
-                    'id': tool_id,
-                    'start': start_pos,
-                    'end': end_pos,
-                    'content': tool_content
-                })
-        
-        return tools
+        return [
+            {**entry, 'content': ts_content[entry['start']:entry['end']]}
+            for entry in entries
+        ]
     
-    def create_enhanced_tool_object(self, original_tool: str, updated_data: Dict[str, Any]) -> str:
-        """Create an enhanced tool object with updated data"""
-        # Parse the original tool to extract key information
-        lines = original_tool.split('\n')
-        
-        # Helper function to escape strings for TypeScript
-        def escape_string(s: str) -> str:
-            return s.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '\\r')
-        
-        # Helper function to format array
-        def format_array(arr: List[str], indent: int = 6) -> str:
-            if not arr:
-                return '[]'
-            
-            formatted_items = []
-            for item in arr:
-                escaped_item = escape_string(item)
-                formatted_items.append(f"{'  ' * indent}'{escaped_item}'")
-            
-            return '[\n' + ',\n'.join(formatted_items) + '\n' + '  ' * (indent - 1) + ']'
+    def build_tool_edits(self, ts_content: str, tool: Dict[str, Any], updated_data: Dict[str, Any],
+                         current_date: str) -> List[Tuple[int, int, str]]:
+        """
+        Collect the field replacements for one tool as (start, end, text) edits.
         
-        # Update description if available
-        if 'description' in updated_data:
-            new_desc = escape_string(updated_data['description'])
-            original_tool = re.sub(
-                r"description:\s*'[^']*'",
-                f"description: '{new_desc}'",
-                original_tool,
-                flags=re.DOTALL
-            )
+        Only top-level fields are touched, using the value spans recorded by
+        the parser, so nested description fields and escaped quotes are safe.
+        """
+        spans = tool['spans']
+        edits = []
         
-        # Update longDescription if available
-        if 'longDescription' in updated_data:
-            new_long_desc = escape_string(updated_data['longDescription'])
-            original_tool = re.sub(
-                r"longDescription:\s*'[^']*'",
-                f"longDescription: '{new_long_desc}'",
-                original_tool,
-                flags=re.DOTALL
-            )
+        # Update description and longDescription if available
+        for field in self.STRING_FIELDS:
+            if field in updated_data and field in spans:
+                start, end = spans[field]
+                edits.append((start, end, quote_string(updated_data[field])))
         
-        # Update coreFeatures if available
-        if 'coreFeatures' in updated_data and updated_data['coreFeatures']:
-            new_features = format_array(updated_data['coreFeatures'])
-            original_tool = re.sub(
-                r"coreFeatures:\s*\[[^\]]*\]",
-                f"coreFeatures: {new_features}",
-                original_tool,
-                flags=re.DOTALL
-            )
-        
-        # Update uniqueSellingPoints if available
-        if 'uniqueSellingPoints' in updated_data and updated_data['uniqueSellingPoints']:
-            new_usps = format_array(updated_data['uniqueSellingPoints'])
-            original_tool = re.sub(
-                r"uniqueSellingPoints:\s*\[[^\]]*\]",
-                f"uniqueSellingPoints: {new_usps}",
-                original_tool,
-                flags=re.DOTALL
-            )
+        # Update coreFeatures and uniqueSellingPoints if available
+        for field in self.ARRAY_FIELDS:
+            if updated_data.get(field) and field in spans:
+                start, end = spans[field]
+                # One item per line, as the arrays are laid out in the file
+                edits.append((start, end, emit_ts(updated_data[field], 2, expand_arrays=True)))
         
         # Update lastUpdated
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        original_tool = re.sub(
-            r"lastUpdated:\s*'[^']*'",
-            f"lastUpdated: '{current_date}'",
-            original_tool
-        )
+        if 'lastUpdated' in spans:
+            start, end = spans['lastUpdated']
+            edits.append((start, end, f"'{current_date}'"))
         
-        # Add a comment indicating the update
-        if '  {' in original_tool:
-            original_tool = original_tool.replace('  {', f'  {{ // Updated on {current_date}', 1)
+        # Add (or refresh) a comment after the opening brace indicating the update
+        brace_end = tool['start'] + 1
+        comment = self.UPDATED_COMMENT_RE.match(ts_content, brace_end)
+        edits.append((brace_end, comment.end() if comment else brace_end, f' // Updated on {current_date}'))
         
-        return original_tool
+        return edits
+    
+    def create_enhanced_tool_object(self, original_tool: str, updated_data: Dict[str, Any]) -> str:
+        """Create an enhanced tool object with updated data"""
+        fields, spans, end = parse_object_fields(original_tool)
+        tool = {'start': len(original_tool) - len(original_tool.lstrip()), 'spans': spans}
+        current_date = datetime.now().strftime('%Y-%m-%d')
+        return splice(original_tool, self.build_tool_edits(original_tool, tool, updated_data, current_date))
     
     def backup_original_file(self):
-        """Create a backup of the original file"""
-        backup_dir = self.project_root / 'scripts' / 'backups'
-        backup_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_file = backup_dir / f'aiToolsData_ts_backup_{timestamp}.ts'
-        
+        """Back up the original file to the deduplicated store"""
         try:
-            ts_content = self.load_existing_ts_data()
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                f.write(ts_content)
-            print(f"✅ Backup created: {backup_file}")
+            entry = BackupStore.from_config().save(self.ts_file, label='integrate_updates')
+            if entry is None:
+                print(f"❌ TypeScript file not found: {self.ts_file}")
+                return False
+            print(f"✅ Backup created: {entry['hash'][:12]} (python backup_store.py restore {entry['hash'][:12]})")
             return True
         except Exception as e:
             print(f"❌ Failed to create backup: {e}")
@@ -188,78 +134,79 @@ class DataIntegrator:
         print("🔄 Starting data integration...")
         
         # Load data
-        updated_data = self.load_updated_data()
+        with self.metrics.time('load_json'):
+            updated_data = self.load_updated_data()
         if not updated_data or 'tools' not in updated_data:
             print("❌ No updated data to integrate")
             return False
         
-        ts_content = self.load_existing_ts_data()
-        if not ts_content:
-            print("❌ Failed to load TypeScript file")
+        try:
+            with self.metrics.time('parse_ts'):
+                index = ToolIndex.load(self.ts_file)
+        except FileNotFoundError:
+            print(f"❌ TypeScript file not found: {self.ts_file}")
+            return False
+        except TSParseError as e:
+            print(f"❌ Could not parse tools array: {e}")
             return False
+        ts_content = index.text
         
         # Create backup
-        if not self.backup_original_file():
+        with self.metrics.time('backup'):
+            backed_up = self.backup_original_file()
+        if not backed_up:
             print("❌ Failed to create backup, aborting")
             return False
         
-        # Extract existing tool objects
-        existing_tools = self.extract_tool_objects(ts_content)
+        # Existing tool objects, from the cached index when the file is unchanged
+        existing_tools = [{**entry, 'content': index.content(entry)} for entry in index]
         print(f"📊 Found {len(existing_tools)} existing tools")
         
-        # Create a mapping of tool names to updated data
+        # Updated data by catalog id: the id the updater stamped on the record,
+        # or for older records the tool with the same name (see ToolIndex.resolve)
         updated_tools_map = {}
         for tool_data in updated_data['tools']:
-            tool_name = tool_data.get('name', '')
-            if tool_name:
-                updated_tools_map[tool_name.lower()] = tool_data
+            tool_id = index.resolve(tool_data)
+            if tool_id:
+                updated_tools_map[tool_id] = tool_data
+            else:
+                print(f"⚠️  Skipping {tool_data.get('name', 'a record')}: no catalog id and no tool of that name")
         
         print(f"� Found {len(updated_tools_map)} updated tools")
         
-        # Process updates
-        updated_content = ts_content
+        # Collect every field edit first, then write the file in one pass
+        current_date = datetime.now().strftime('%Y-%m-%d')
+        edits = []
         tools_updated = 0
-        offset = 0  # Track position changes due to content replacement
         
         for tool in existing_tools:
-            # Extract tool name from the content
-            name_match = re.search(r"name:\s*'([^']+)'", tool['content'])
-            if not name_match:
-                continue
-            
-            tool_name = name_match.group(1)
-            tool_name_lower = tool_name.lower()
+            tool_name = tool['fields'].get('name') or tool['id']
             
-            if tool_name_lower in updated_tools_map:
+            if tool['id'] in updated_tools_map:
                 print(f"🔄 Updating: {tool_name}")
-                
-                # Create enhanced tool object
-                enhanced_tool = self.create_enhanced_tool_object(
-                    tool['content'], 
-                    updated_tools_map[tool_name_lower]
-                )
-                
-                # Calculate actual positions with offset
-                actual_start = tool['start'] + offset
-                actual_end = tool['end'] + offset
-                
-                # Replace the content
-                updated_content = (
-                    updated_content[:actual_start] +
-                    enhanced_tool +
-                    updated_content[actual_end:]
-                )
-                
-                # Update offset
-                offset += len(enhanced_tool) - (tool['end'] - tool['start'])
-                
+                with self.metrics.time('build_edits'):
+                    edits.extend(self.build_tool_edits(
+                        ts_content,
+                        tool,
+                        updated_tools_map[tool['id']],
+                        current_date
+                    ))
                 tools_updated += 1
                 print(f"✅ Updated: {tool_name}")
         
+        with self.metrics.time('splice'):
+            updated_content = splice(ts_content, edits)
+        self.metrics.set_counter('tools_existing', len(existing_tools))
+        self.metrics.set_counter('tools_updated', tools_updated)
+        if not edits:
+            print(f"\n✅ No changes to write; {self.ts_file} left untouched")
+            return True
+        
         # Save the updated file
         try:
-            with open(self.ts_file, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            with self.metrics.time('write'):
+                # The dev server may reload aiToolsData.ts at any moment
+                atomic_write_text(self.ts_file, updated_content)
             
             print(f"\n✅ Integration complete!")
             print(f"📊 Tools updated: {tools_updated}")
@@ -274,6 +221,14 @@ class DataIntegrator:
             print(f"❌ Failed to save updated file: {e}")
             return False
     
+    def save_metrics(self):
+        """Write stage timings and counters for this integration run"""
+        try:
+            self.metrics.write_json(self.metrics_file)
+            print(f"📈 Run metrics saved to: {self.metrics_file}")
+        except OSError as e:
+            print(f"⚠️  Could not save run metrics: {e}")
+    
     def create_update_summary(self, updated_data: Dict[str, Any], tools_updated: int):
         """Create a summary of the updates"""
         summary_file = self.project_root / 'UPDATE_SUMMARY.md'
@@ -326,7 +281,9 @@ def main():
     print("=" * 50)
     
     integrator = DataIntegrator()
-    success = integrator.integrate_updates()
+    with file_lock(integrator.ts_file):
+        success = integrator.integrate_updates()
+    integrator.save_metrics()
     
     if success:
         print("\n🎉 Data integration successful!")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+JSON Extraction from Model Responses
+
+Finds the first balanced JSON object (or array) in a model response with a
+single forward scan that tracks strings and escapes, instead of a greedy
+regex that backtracks and swallows any text after the JSON.
+
+- ```json fenced blocks are searched first, then the whole response
+- text before and after the JSON is ignored
+- common model mistakes are repaired on the fly: trailing commas,
+  // and /* */ comments, and raw control characters inside strings
+
+Usage:
+    data = extract_json(response.text)            # first {...}
+    items = extract_json(response.text, list)     # first [...]
+"""
+
+import json
+import re
+from typing import Any, Iterator, Optional, Tuple
+
+_FENCE_RE = re.compile(r'```(?:json|JSON)?[ \t]*\n(.*?)```', re.DOTALL)
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_CLOSERS = {'{': '}', '[': ']'}
+
+# How many candidate openings to try before giving up on a response
+MAX_CANDIDATES = 8
+
+
+class JSONExtractionError(ValueError):
+    """No parseable JSON value of the expected type was found"""
+
+
+def _scan_balanced(text: str, start: int) -> Optional[Tuple[str, int]]:
+    """
+    Scan from the opening bracket at start to its matching close.
+
+    Returns (repaired JSON text, end position), or None if the value is cut
+    off. Trailing commas and comments outside strings are dropped as the
+    scan goes, so no second repair pass is needed. A comma is held back
+    until the next significant character shows whether it is trailing.
+    """
+    length = len(text)
+    stack = [_CLOSERS[text[start]]]
+    chunks = []
+    run_start = start
+    pos = start + 1
+    pending_comma = False
+
+    while pos < length:
+        char = text[pos]
+        if char in ' \t\r\n':
+            pos += 1
+            continue
+
+        if char == '/' and pos + 1 < length and text[pos + 1] in '/*':
+            chunks.append(text[run_start:pos])
+            if text[pos + 1] == '/':
+                newline = text.find('\n', pos)
+                pos = length if newline == -1 else newline
+            else:
+                close = text.find('*/', pos + 2)
+                if close == -1:
+                    return None
+                pos = close + 2
+            run_start = pos
+            continue
+
+        if pending_comma:
+            # A comma is only kept if something other than a closer follows it
+            pending_comma = False
+            if char not in '}]':
+                chunks.append(text[run_start:pos])
+                chunks.append(',')
+                run_start = pos
+
+        if char == ',':
+            chunks.append(text[run_start:pos])
+            run_start = pos + 1
+            pending_comma = True
+        elif char == '"':
+            # Jump over the whole string, escapes included
+            string = _STRING_RE.match(text, pos)
+            if not string:
+                return None
+            pos = string.end()
+            continue
+        elif char in '{[':
+            stack.append(_CLOSERS[char])
+        elif char in '}]':
+            if char != stack[-1]:
+                return None
+            stack.pop()
+            if not stack:
+                chunks.append(text[run_start:pos + 1])
+                return ''.join(chunks), pos + 1
+        pos += 1
+
+    return None
+
+
+def _search_regions(text: str) -> Iterator[str]:
+    """Fenced code blocks first, then the whole response"""
+    for match in _FENCE_RE.finditer(text):
+        yield match.group(1)
+    yield text
+
+
+def extract_json(text: str, expect: type = dict) -> Any:
+    """
+    Return the first JSON value of type expect (dict or list) found in text.
+
+    Raises JSONExtractionError if none can be parsed.
+    """
+    if not text:
+        raise JSONExtractionError("Empty response")
+
+    opener = '{' if expect is dict else '['
+    last_error = "No JSON found in response"
+    for region in _search_regions(text):
+        pos = region.find(opener)
+        attempts = 0
+        while pos != -1 and attempts < MAX_CANDIDATES:
+            attempts += 1
+            scanned = _scan_balanced(region, pos)
+            if scanned is None:
+                last_error = "JSON in response is incomplete"
+            else:
+                candidate, end = scanned
+                try:
+                    # strict=False tolerates raw newlines and tabs inside strings
+                    value = json.loads(candidate, strict=False)
+                except json.JSONDecodeError as e:
+                    last_error = f"JSON parsing error: {e}"
+                else:
+                    if isinstance(value, expect):
+                        return value
+            pos = region.find(opener, pos + 1)
+
+    raise JSONExtractionError(last_error)
+
+
+def try_extract_json(text: str, expect: type = dict) -> Optional[Any]:
+    """Like extract_json, but returns None instead of raising"""
+    try:
+        return extract_json(text, expect)
+    except JSONExtractionError:
+        return None
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Structured, Queued Logging
+
+Log calls from fetch workers only put the record on an in-memory queue. A
+single QueueListener thread formats it and writes it out, so workers never
+wait on the file or console handler locks:
+
+- the log file gets one JSON object per line, with the tool, stage and
+  duration fields passed through `extra=` when present
+- the console gets the usual human-readable lines
+- message arguments are formatted by the listener, not the caller, and
+  records below the configured level are dropped before any formatting,
+  so use %-style arguments rather than f-strings on hot paths
+
+The level and outputs come from the [logging] section of config.ini.
+Like logging.basicConfig, configure_logging() does nothing if the root
+logger already has handlers (e.g. set up by a benchmark or test harness).
+
+Usage:
+    logger = configure_logging(__name__, Path('logs/run.log'), **logging_settings(config_file))
+    logger.info("Fetched %s", name, extra={'tool': tool_id, 'stage': 'fetch', 'duration': 0.42})
+"""
+
+import atexit
+import configparser
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Optional structured fields callers can pass with extra=
+STRUCTURED_FIELDS = ('tool', 'stage', 'duration')
+
+_listener: Optional[QueueListener] = None
+
+
+class JSONLineFormatter(logging.Formatter):
+    """One JSON object per record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = round(value, 6) if isinstance(value, float) else value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats the message in the calling thread; the
+    queue here never leaves the process, so the record can go as it is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def logging_settings(config_file: Path) -> Dict[str, Any]:
+    """level, to_file and to_console from config.ini's [logging] section"""
+    parser = configparser.ConfigParser(inline_comment_prefixes=('#', ';'))
+    parser.read(config_file, encoding='utf-8')
+    return {
+        'level': parser.get('logging', 'log_level', fallback='INFO').upper(),
+        'to_file': parser.getboolean('logging', 'log_to_file', fallback=True),
+        'to_console': parser.getboolean('logging', 'log_to_console', fallback=True),
+    }
+
+
+def configure_logging(name: str, log_file: Optional[Path], level: str = 'INFO',
+                      to_file: bool = True, to_console: bool = True,
+                      stream=sys.stdout) -> logging.Logger:
+    """Route root logging through a queue to JSON-file and console handlers; return logger `name`"""
+    global _listener
+
+    root = logging.getLogger()
+    if root.handlers:
+        return logging.getLogger(name)
+
+    handlers = []
+    if to_file and log_file:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(JSONLineFormatter())
+        handlers.append(file_handler)
+    if to_console:
+        console_handler = logging.StreamHandler(stream)
+        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        handlers.append(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(getattr(logging, str(level).upper(), logging.INFO))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return logging.getLogger(name)
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+AI Tools Pipeline
+
+One entry point for the refresh workflow that used to take three scripts
+(update_ai_tools.py, then careful_integration.py, then write_ai_tools_txt.py),
+each re-reading and re-parsing what the previous one had just written:
+
+    fetch      refresh the tools that most need it through the Gemini API and
+               save aiToolsData_updated.json (plus shards, search index and
+               aggregates)
+    validate   check aiToolsData.ts and the fetched records against
+               src/types/aiTools.ts
+    integrate  merge the fetched records into aiToolsData.ts
+    export     write ai-tools-list.txt (or .tsv / .jsonl)
+    run        all of the above, in that order (the default)
+
+Every stage works on one Pipeline object. aiToolsData.ts is parsed once, the
+fetched records are handed from fetch to integrate in memory, and integrate
+passes the text it wrote on to export instead of export reading it back. An
+end-to-end run therefore reads each input once and writes each artifact once,
+atomically. A single stage run on its own reads its inputs from the files
+the previous stage wrote, at the same paths update_ai_tools.Config uses.
+
+Usage:
+    python pipeline.py                        # fetch, validate, integrate, export
+    python pipeline.py run --max-tools 10
+    python pipeline.py fetch --dry-run
+    python pipeline.py validate
+    python pipeline.py integrate --force
+    python pipeline.py export --format tsv
+
+    npm run ai-tools -- run --max-tools 10
+"""
+
+import argparse
+import json
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from atomic_io import file_lock
+from careful_integration import CarefulDataIntegrator
+from run_metrics import RunMetrics
+from tool_export import FORMATS, export_tools
+from tool_schema import validate
+from ts_data_parser import ToolIndex, TSParseError
+from update_ai_tools import AIToolsUpdater, Config, add_update_arguments, config_from_args
+from write_ai_tools_txt import OUT as EXPORT_FILE, state_file_for
+
+STAGES = ('fetch', 'validate', 'integrate', 'export')
+METRICS_FILE = Config.PROJECT_ROOT / 'scripts' / 'logs' / 'pipeline_metrics.json'
+
+# Problems printed per validate run; the rest are only counted
+MAX_PROBLEMS_SHOWN = 20
+
+
+class Pipeline:
+    """The refresh stages, sharing one in-memory catalog"""
+
+    def __init__(self, config: Config, export_format: str = 'txt', export_file: Optional[Path] = None,
+                 changed_only: bool = False, force: bool = False, model: Any = None):
+        """
+        model: optional stand-in for the Gemini API, passed on to AIToolsUpdater
+        (e.g. fake_gemini.FakeGenerativeModel).
+        """
+        self.config = config
+        self.export_format = export_format
+        self.export_file = export_file or EXPORT_FILE.with_suffix(f'.{export_format}')
+        self.changed_only = changed_only
+        self.force = force
+        self.model = model
+        self.metrics = RunMetrics('pipeline')
+        # Parsed aiToolsData.ts, kept current as stages change it
+        self.index: Optional[ToolIndex] = None
+        # Records from this run's fetch, or from OUTPUT_FILE
+        self.updates: Optional[List[Dict[str, Any]]] = None
+
+    def catalog(self) -> ToolIndex:
+        """aiToolsData.ts, parsed on first use"""
+        if self.index is None:
+            with self.metrics.time('load_catalog'):
+                self.index = ToolIndex.load(self.config.TS_DATA_FILE)
+        return self.index
+
+    def fetched_tools(self) -> List[Dict[str, Any]]:
+        """This run's fetched records, or those an earlier fetch saved to OUTPUT_FILE"""
+        if self.updates is None:
+            with self.metrics.time('load_updates'):
+                try:
+                    with open(self.config.OUTPUT_FILE, 'r', encoding='utf-8') as f:
+                        tools = json.load(f).get('tools', [])
+                except (OSError, ValueError, AttributeError):
+                    tools = []
+            self.updates = [tool for tool in tools if isinstance(tool, dict)]
+        return self.updates
+
+    def fetch(self) -> bool:
+        """Refresh the scheduled tools and save OUTPUT_FILE and its derived artifacts"""
+        updater = AIToolsUpdater(self.config, model=self.model)
+        with self.metrics.time('fetch'):
+            tools = updater.run_update(self.catalog())
+        if tools is None:
+            # A dry run or an interruption: there is nothing new for later stages
+            return False
+        self.updates = tools
+        self.metrics.set_counter('tools_fetched', len(tools))
+        return True
+
+    def validate(self) -> bool:
+        """
+        Check the catalog and the fetched records against the AITool interface.
+
+        Problems in fetched records are reported only, since integrate leaves
+        those fields as they were; problems in the catalog itself stop the run.
+        """
+        with self.metrics.time('validate'):
+            catalog_problems = [
+                f"{entry['id']}: {problem}"
+                for entry in self.catalog()
+                for problem in validate(entry['fields'])
+            ]
+            update_problems = [
+                f"{tool.get('name', '?')}: {problem}"
+                for tool in self.fetched_tools()
+                for problem in validate(tool, partial=True)
+            ]
+        self.metrics.set_counter('catalog_problems', len(catalog_problems))
+        self.metrics.set_counter('update_problems', len(update_problems))
+
+        print(f"🔍 {len(self.catalog())} catalog tools: {len(catalog_problems)} problems; "
+              f"{len(self.fetched_tools())} fetched records: {len(update_problems)} problems")
+        for problem in (catalog_problems + update_problems)[:MAX_PROBLEMS_SHOWN]:
+            print(f"   - {problem}")
+        hidden = len(catalog_problems) + len(update_problems) - MAX_PROBLEMS_SHOWN
+        if hidden > 0:
+            print(f"   ... and {hidden} more")
+        return not catalog_problems
+
+    def integrate(self) -> bool:
+        """Merge the fetched records into aiToolsData.ts"""
+        tools = self.fetched_tools()
+        if not tools:
+            print(f"⏭️  No fetched records in {self.config.OUTPUT_FILE}; nothing to integrate")
+            return True
+
+        integrator = CarefulDataIntegrator()
+        integrator.ts_file_path = str(self.config.TS_DATA_FILE)
+        with self.metrics.time('integrate'):
+            content = integrator.integrate_updates(force=self.force, updated_data={'tools': tools},
+                                                   index=self.catalog())
+        if content is not None:
+            # Export works from the text just written rather than reading the file back
+            with self.metrics.time('reindex'):
+                self.index = ToolIndex.from_text(content, self.config.TS_DATA_FILE)
+        for name, value in integrator.metrics.snapshot()['counters'].items():
+            self.metrics.set_counter(name, value)
+        return True
+
+    def export(self) -> bool:
+        """Write the tool list in export_format"""
+        state_file = state_file_for(self.export_file) if self.changed_only else None
+        with self.metrics.time('export'):
+            count = export_tools(self.catalog().entries, self.export_file, self.export_format, state_file)
+        self.metrics.set_counter('tools_exported', count)
+        print(f"📄 Wrote {self.export_file} with {count} entries")
+        return True
+
+    def run(self, stages: List[str]) -> int:
+        """Run stages in order, stopping at the first that fails; returns an exit code"""
+        for stage in stages:
+            print(f"\n▶️  {stage}")
+            try:
+                ok = getattr(self, stage)()
+            except (OSError, TSParseError) as e:
+                print(f"❌ {stage} failed: {e}")
+                return 1
+            if stage == 'fetch' and self.config.DRY_RUN:
+                print("Dry run: stopping after fetch")
+                return 0
+            if not ok:
+                print(f"❌ Stopping after {stage}")
+                return 1
+        return 0
+
+    def save_metrics(self):
+        """Write the time spent per stage and the run's counters"""
+        try:
+            self.metrics.write_json(METRICS_FILE)
+        except OSError as e:
+            print(f"⚠️  Could not save run metrics: {e}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Fetch, validate, integrate and export the AI tools catalog")
+    parser.add_argument('stage', nargs='?', choices=STAGES + ('run',), default='run',
+                        help="Stage to run on its own, or 'run' for all of them in order (default)")
+    add_update_arguments(parser)
+    parser.add_argument('--force', action='store_true',
+                        help="Integrate: rewrite every fetched tool even if its data is unchanged")
+    parser.add_argument('--format', choices=sorted(FORMATS), default='txt',
+                        help="Export: output format (default: txt)")
+    parser.add_argument('--out', type=Path, help="Export: output file (default: ai-tools-list.<format>)")
+    parser.add_argument('--changed-only', action='store_true',
+                        help="Export: only tools that changed since the last --changed-only export")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    args = parse_args(argv)
+    stages = list(STAGES) if args.stage == 'run' else [args.stage]
+    config = config_from_args(args)
+    pipeline = Pipeline(config, args.format, args.out, args.changed_only, args.force)
+
+    print("AI Tools Pipeline: " + ' → '.join(stages))
+    print("=" * 50)
+
+    try:
+        with ExitStack() as locks:
+            # Held for the whole run, so overlapping runs wait instead of interleaving writes
+            if 'fetch' in stages:
+                locks.enter_context(file_lock(config.OUTPUT_FILE, timeout=config.LOCK_TIMEOUT,
+                                              enabled=config.LOCK_WRITES and not config.DRY_RUN))
+            if 'integrate' in stages and not config.DRY_RUN:
+                locks.enter_context(file_lock(config.TS_DATA_FILE, timeout=config.LOCK_TIMEOUT,
+                                              enabled=config.LOCK_WRITES))
+            status = pipeline.run(stages)
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+    if not config.DRY_RUN:
+        pipeline.save_metrics()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,24 +5,43 @@ Fetch current information for key AI tools
 """
 
 import os
-import json
 import time
+import argparse
 from datetime import datetime
-import google.generativeai as genai
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv('../.env.local')
+from atomic_io import atomic_write_json
+from gemini_client import LazyGeminiModel, load_env_file
+from response_cache import CachedModel, ResponseCache
+from json_extract import try_extract_json
 
-def get_tool_info(tool_name: str):
-    """Get current info for a specific tool"""
-    api_key = os.getenv('NEXT_PUBLIC_GEMINI_API_KEY') or os.getenv('GEMINI_API_KEY')
-    if not api_key:
-        print("❌ GEMINI_API_KEY not found")
-        return None
-    
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-2.5-flash')
+MODEL_NAME = 'gemini-2.5-flash'
+
+# Shared by every call in this run; both are set in main() (None: no caching)
+response_cache = None
+max_age = None
+gemini_model = None
+
+def get_tool_info(tool_name: str, backend=None):
+    """Get current info for a specific tool
+
+    backend: optional stand-in for the Gemini model (see fake_gemini.py);
+    it is called directly, without the response cache.
+    """
+    global gemini_model
+    if backend is not None:
+        model = CachedModel(backend, None, MODEL_NAME)
+    else:
+        if gemini_model is None:
+            # Load environment variables
+            load_env_file('../.env.local')
+            api_key = os.getenv('NEXT_PUBLIC_GEMINI_API_KEY') or os.getenv('GEMINI_API_KEY')
+            if not api_key:
+                print("❌ GEMINI_API_KEY not found")
+                return None
+            # Gemini is imported and configured on the first request
+            gemini_model = LazyGeminiModel(MODEL_NAME, api_key)
+        
+        model = CachedModel(gemini_model, response_cache, MODEL_NAME, max_age=max_age)
     
     prompt = f"""
     Provide current information about {tool_name} as of October 2025 in JSON format:
@@ -44,22 +63,45 @@ def get_tool_info(tool_name: str):
         response = model.generate_content(prompt)
         
         # Extract JSON from response
-        import re
-        json_match = re.search(r'\{.*\}', response.text, re.DOTALL)
-        if json_match:
-            data = json.loads(json_match.group())
+        data = try_extract_json(response.text)
+        if data:
             print(f"✅ Got info for: {tool_name}")
             return data
         else:
             print(f"❌ No JSON found for: {tool_name}")
+            model.invalidate(prompt)
             return None
             
     except Exception as e:
         print(f"❌ Error for {tool_name}: {str(e)}")
+        model.invalidate(prompt)
         return None
 
+def fetch_tools(tools, backend=None, delay: float = 2):
+    """Fetch info for each tool in order, pausing between real API calls"""
+    results = []
+    
+    for tool in tools:
+        hits_before = response_cache.hits if response_cache else 0
+        info = get_tool_info(tool, backend)
+        if info:
+            results.append(info)
+        if not response_cache or response_cache.hits == hits_before:
+            time.sleep(delay)  # Rate limiting, only needed after a real API call
+    
+    return results
+
 def main():
     """Main function"""
+    global max_age, response_cache
+    parser = argparse.ArgumentParser(description="Quick AI tools information updater")
+    parser.add_argument('--max-age', type=float, metavar='SECONDS',
+                        help="Ignore cached responses older than this (0 forces a full refresh)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="List the tools that would be fetched without calling the API")
+    args = parser.parse_args()
+    max_age = args.max_age
+    
     tools = [
         "GPT-4 Turbo",
         "Claude 3.5 Sonnet", 
@@ -68,15 +110,18 @@ def main():
         "Minimax Voice-01"
     ]
     
-    results = []
+    if args.dry_run:
+        print(f"🔍 Dry run: would fetch {len(tools)} tools:")
+        for tool in tools:
+            print(f"   - {tool}")
+        return
+    
+    # Settings from config.ini's [cache] section, shared with the other updaters
+    response_cache = ResponseCache.from_config()
     
     print("🚀 Fetching current AI tools information...")
     
-    for tool in tools:
-        info = get_tool_info(tool)
-        if info:
-            results.append(info)
-        time.sleep(2)  # Rate limiting
+    results = fetch_tools(tools)
     
     # Save results
     output = {
@@ -85,8 +130,7 @@ def main():
         "tools": results
     }
     
-    with open('quick_tools_update.json', 'w') as f:
-        json.dump(output, f, indent=2)
+    atomic_write_json('quick_tools_update.json', output, indent=2)
     
     print(f"✅ Completed! Updated {len(results)} tools")
     print("📁 Results saved to: quick_tools_update.json")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Token Bucket Rate Limiter
+
+Thread-safe limiter shared by every worker that calls the Gemini API.
+It enforces two limits at once:
+
+- requests per minute, using a token bucket that refills continuously
+- requests in flight, using a bounded semaphore
+
+Usage:
+    limiter = TokenBucketLimiter(requests_per_minute=30, max_concurrent=4)
+    with limiter:
+        response = model.generate_content(prompt)
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucketLimiter:
+    """Shared requests-per-minute and concurrency limiter"""
+
+    def __init__(self, requests_per_minute: float, max_concurrent: int = 1,
+                 burst: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        self.rate = requests_per_minute / 60.0  # tokens per second
+        self.capacity = float(burst if burst is not None else max_concurrent)
+        self.max_concurrent = max_concurrent
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Tokens may go negative: each waiter reserves its own future slot,
+            # so callers are released in arrival order without busy polling.
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a concurrency slot and a rate token are both available"""
+        self._slots.acquire()
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                self._sleep(wait)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self):
+        """Free the concurrency slot taken by acquire()"""
+        self._slots.release()
+
+    def __enter__(self) -> 'TokenBucketLimiter':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
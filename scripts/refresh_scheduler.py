@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Staleness-Driven Refresh Scheduler
+
+Each run can only afford MAX_TOOLS_PER_RUN API calls. Rather than always
+refreshing the first tools of a fixed list, every tool in the catalog gets
+a score and the run takes the highest-scoring ones from a heap:
+
+    score = days since lastUpdated
+            x category weight ([priority_categories] in config.ini)
+            x (1 + popularity.trendingScore / 100)
+
+so a stale tool in a high-priority category that many people look at is
+refreshed first. Tools refreshed within min_age_days are not refetched,
+and tools with no usable lastUpdated count as MISSING_DATE_DAYS old.
+Staleness is counted in whole days, so the order is stable within a day
+and an interrupted run resumes with the same selection.
+
+Usage:
+    scheduler = RefreshScheduler(load_priority_weights(config_file))
+    selected = scheduler.schedule(tools, budget=50)
+"""
+
+import configparser
+import heapq
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Weight of each [priority_categories] level; unlisted categories get DEFAULT_WEIGHT
+PRIORITY_LEVEL_WEIGHTS = {
+    'high_priority': 3.0,
+    'medium_priority': 2.0,
+    'low_priority': 1.0,
+}
+DEFAULT_WEIGHT = 1.0
+MISSING_DATE_DAYS = 365
+
+
+def _category_list(raw: str) -> List[str]:
+    """A [priority_categories] value: a JSON array, or a comma-separated list"""
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = raw.split(',')
+    if isinstance(value, str):
+        value = [value]
+    return [str(item).strip().strip('"\'') for item in value if str(item).strip()]
+
+
+def load_priority_weights(config_file: Path) -> Dict[str, float]:
+    """category -> weight from config.ini's [priority_categories] section"""
+    parser = configparser.ConfigParser(inline_comment_prefixes=('#', ';'))
+    parser.read(config_file, encoding='utf-8')
+    if not parser.has_section('priority_categories'):
+        return {}
+
+    weights: Dict[str, float] = {}
+    for level, raw in parser.items('priority_categories'):
+        weight = PRIORITY_LEVEL_WEIGHTS.get(level)
+        if weight is None:
+            continue
+        for category in _category_list(raw):
+            # A category listed twice keeps its highest priority
+            weights[category] = max(weight, weights.get(category, 0.0))
+    return weights
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """A date from 'YYYY-MM-DD', 'YYYY-MM' or an ISO timestamp; None if unusable"""
+    if not isinstance(value, str) or not value:
+        return None
+    for length, fmt in ((10, '%Y-%m-%d'), (7, '%Y-%m')):
+        try:
+            return datetime.strptime(value[:length], fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def trending_score(tool: Dict[str, Any]) -> float:
+    """popularity.trendingScore clamped to 0-100, or 0 when missing"""
+    popularity = tool.get('popularity')
+    score = popularity.get('trendingScore') if isinstance(popularity, dict) else None
+    if not isinstance(score, (int, float)) or isinstance(score, bool):
+        return 0.0
+    return min(100.0, max(0.0, float(score)))
+
+
+class RefreshScheduler:
+    """Picks the tools that most need a refresh within a per-run budget"""
+
+    def __init__(self, category_weights: Optional[Dict[str, float]] = None,
+                 default_weight: float = DEFAULT_WEIGHT, min_age_days: int = 1,
+                 today: Optional[date] = None):
+        self.category_weights = category_weights or {}
+        self.default_weight = default_weight
+        self.min_age_days = min_age_days
+        self.today = today or date.today()
+
+    def staleness_days(self, tool: Dict[str, Any]) -> int:
+        """Whole days since the tool was last updated"""
+        updated = parse_date(tool.get('lastUpdated'))
+        if updated is None:
+            return MISSING_DATE_DAYS
+        return max(0, (self.today - updated).days)
+
+    def priority(self, tool: Dict[str, Any]) -> float:
+        """Category weight, boosted by up to 2x for trending tools"""
+        weight = self.category_weights.get(tool.get('category'), self.default_weight)
+        return weight * (1 + trending_score(tool) / 100)
+
+    def score(self, tool: Dict[str, Any]) -> float:
+        """Staleness x priority; 0 for tools refreshed too recently to refetch"""
+        days = self.staleness_days(tool)
+        if days < self.min_age_days:
+            return 0.0
+        return days * self.priority(tool)
+
+    def schedule(self, tools: Iterable[Dict[str, Any]], budget: int) -> List[Dict[str, Any]]:
+        """Up to budget tools with a positive score, most urgent first"""
+        heap = []
+        for position, tool in enumerate(tools):
+            score = self.score(tool)
+            if score > 0:
+                # position breaks ties in catalog order and keeps dicts out of comparisons
+                heap.append((-score, position, tool))
+        return [tool for _, _, tool in heapq.nsmallest(max(0, budget), heap)]
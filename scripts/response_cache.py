@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Gemini Response Cache
+
+Persistent, content-addressed cache for model responses. Entries are keyed
+by a SHA-256 of (model name, prompt), expire after a TTL, and are evicted in
+least-recently-used order once the cache grows past its size limit.
+
+Storage is a single SQLite file, so it survives crashes and is shared by all
+updater scripts. A small in-memory layer in front of it serves repeated
+lookups within a run without touching the disk.
+
+The [cache] section of config.ini (enabled, ttl_hours, max_size_mb)
+applies to every updater through ResponseCache.from_config().
+
+Usage:
+    cache = ResponseCache.from_config()  # None if disabled in config.ini
+    model = CachedModel(genai.GenerativeModel(name), cache, name)
+    response = model.generate_content(prompt)  # served from cache on a hit
+"""
+
+import configparser
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / 'cache' / 'gemini_responses.sqlite3'
+CONFIG_FILE = Path(__file__).parent / 'config.ini'
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+class ResponseCache:
+    """On-disk cache of response texts keyed by (model name, prompt hash)"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' key TEXT PRIMARY KEY,'
+            ' model TEXT NOT NULL,'
+            ' created REAL NOT NULL,'
+            ' accessed REAL NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' text TEXT NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+        self._db.commit()
+        self._total_bytes = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    @classmethod
+    def from_config(cls, config_file: Path = CONFIG_FILE, **kwargs) -> Optional['ResponseCache']:
+        """Cache with the settings from config.ini's [cache] section, or None if disabled there"""
+        parser = configparser.ConfigParser(inline_comment_prefixes=('#', ';'))
+        parser.read(config_file, encoding='utf-8')
+        if not parser.getboolean('cache', 'enabled', fallback=True):
+            return None
+        kwargs.setdefault('ttl_seconds', parser.getfloat('cache', 'ttl_hours',
+                                                         fallback=DEFAULT_TTL_SECONDS / 3600) * 3600)
+        kwargs.setdefault('max_bytes', int(parser.getfloat('cache', 'max_size_mb',
+                                                           fallback=DEFAULT_MAX_BYTES / 1024 / 1024) * 1024 * 1024))
+        return cls(**kwargs)
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        """Content address for a prompt sent to a given model"""
+        digest = hashlib.sha256()
+        digest.update(model_name.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(prompt.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _is_fresh(self, created: float, max_age: Optional[float]) -> bool:
+        limit = self.ttl_seconds if max_age is None else min(max_age, self.ttl_seconds)
+        return time.time() - created <= limit
+
+    def get(self, model_name: str, prompt: str, max_age: Optional[float] = None) -> Optional[str]:
+        """Return the cached response text, or None if missing or too old"""
+        key = self.make_key(model_name, prompt)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._is_fresh(entry[0], max_age):
+                self.hits += 1
+                return entry[1]
+
+            row = self._db.execute(
+                'SELECT created, text FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or not self._is_fresh(row[0], max_age):
+                self.misses += 1
+                return None
+
+            self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (time.time(), key))
+            self._db.commit()
+            self._memory[key] = (row[0], row[1])
+            self.hits += 1
+            return row[1]
+
+    def put(self, model_name: str, prompt: str, text: str):
+        """Store a response text, evicting old entries if over the size limit"""
+        key = self.make_key(model_name, prompt)
+        size = len(text.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            old = self._db.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses (key, model, created, accessed, size, text)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (key, model_name, now, now, size, text)
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._memory[key] = (now, text)
+            self._evict()
+            self._db.commit()
+
+    def invalidate(self, model_name: str, prompt: str):
+        """Drop a cached response, e.g. one that turned out to be unusable"""
+        key = self.make_key(model_name, prompt)
+        with self._lock:
+            self._memory.pop(key, None)
+            row = self._db.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            if row:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._db.commit()
+                self._total_bytes -= row[0]
+
+    def _evict(self):
+        """Remove expired entries, then least recently used ones until under max_bytes"""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        self._db.execute('DELETE FROM responses WHERE created < ?', (time.time() - self.ttl_seconds,))
+        self._total_bytes = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+        rows = self._db.execute('SELECT key, size FROM responses ORDER BY accessed ASC')
+        doomed = []
+        for key, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            doomed.append((key,))
+            self._total_bytes -= size
+        if doomed:
+            self._db.executemany('DELETE FROM responses WHERE key = ?', doomed)
+            for (key,) in doomed:
+                self._memory.pop(key, None)
+
+    def close(self):
+        """Close the underlying database"""
+        with self._lock:
+            self._db.close()
+
+
+class CachedResponse:
+    """Minimal stand-in for a Gemini response served from the cache"""
+
+    from_cache = True
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class CachedModel:
+    """
+    Wraps a GenerativeModel so generate_content consults the cache first.
+    
+    Only cache misses go through the optional rate limiter, so hits never
+    spend request quota. Passing cache=None disables caching.
+    """
+
+    def __init__(self, model: Any, cache: Optional[ResponseCache], model_name: str,
+                 max_age: Optional[float] = None, limiter: Any = None):
+        self.model = model
+        self.cache = cache
+        self.model_name = model_name
+        self.max_age = max_age
+        self.limiter = limiter
+
+    def generate_content(self, prompt: str, **kwargs) -> Any:
+        """Return a cached response, or call the model and cache its text"""
+        if self.cache is not None:
+            text = self.cache.get(self.model_name, prompt, self.max_age)
+            if text is not None:
+                return CachedResponse(text)
+
+        if self.limiter is not None:
+            with self.limiter:
+                response = self.model.generate_content(prompt, **kwargs)
+        else:
+            response = self.model.generate_content(prompt, **kwargs)
+
+        if self.cache is not None:
+            try:
+                text = response.text
+            except Exception:
+                # Blocked or empty candidates; let the caller handle it
+                text = None
+            if text:
+                self.cache.put(self.model_name, prompt, text)
+        return response
+
+    @property
+    def hits(self) -> int:
+        """Cache hits so far (0 when caching is disabled)"""
+        return self.cache.hits if self.cache is not None else 0
+
+    def invalidate(self, prompt: str):
+        """Forget the cached response for a prompt"""
+        if self.cache is not None:
+            self.cache.invalidate(self.model_name, prompt)
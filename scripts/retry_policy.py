@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Shared Retry Policy
+
+One RetryPolicy is shared by every worker of an updater. Failed calls are
+sorted into four kinds, and each kind is handled differently:
+
+- rate_limited (429, quota exhausted): wait for the server's retry delay if
+  it gave one, otherwise back off exponentially, and pause the whole pool
+  for that long so other workers stop sending requests too
+- transient (5xx, timeouts, dropped connections): exponential backoff
+  with jitter, for this caller only
+- malformed (a response arrived but its JSON could not be used): retried
+  straight away, since waiting does not change what the model returns
+- permanent (bad request, auth, not found): not retried
+
+Usage:
+    policy = RetryPolicy(max_attempts=3, base_delay=2, logger=logger)
+    data = policy.call(lambda: fetch(prompt), description=tool_name)
+"""
+
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional, Tuple
+
+RATE_LIMITED = 'rate_limited'
+TRANSIENT = 'transient'
+MALFORMED = 'malformed'
+PERMANENT = 'permanent'
+
+RATE_LIMITED_STATUSES = {429}
+TRANSIENT_STATUSES = {408, 500, 502, 503, 504}
+PERMANENT_STATUSES = {400, 401, 403, 404, 405, 422}
+
+# Exception class names used by google.api_core and requests
+RATE_LIMITED_NAMES = {'ResourceExhausted', 'TooManyRequests'}
+TRANSIENT_NAMES = {
+    'ServiceUnavailable', 'InternalServerError', 'DeadlineExceeded', 'GatewayTimeout',
+    'BadGateway', 'Aborted', 'Timeout', 'ReadTimeout', 'ConnectTimeout', 'ConnectionError',
+}
+PERMANENT_NAMES = {
+    'InvalidArgument', 'PermissionDenied', 'Unauthenticated', 'Unauthorized', 'Forbidden',
+    'NotFound', 'MethodNotImplemented', 'BadRequest', 'FailedPrecondition',
+}
+
+_RETRY_IN_RE = re.compile(r'retry in ([\d.]+)\s*s', re.IGNORECASE)
+_RETRY_DELAY_RE = re.compile(r'retry_delay\s*\{\s*seconds:\s*(\d+)')
+
+
+class MalformedResponseError(Exception):
+    """The model answered, but its output could not be used"""
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for attr in ('code', 'status_code'):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(exc, 'response', None)
+    value = getattr(response, 'status_code', None)
+    return value if isinstance(value, int) else None
+
+
+def classify_error(exc: BaseException) -> str:
+    """Sort an exception into RATE_LIMITED, TRANSIENT, MALFORMED or PERMANENT"""
+    if isinstance(exc, MalformedResponseError):
+        return MALFORMED
+
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    status = _status_code(exc)
+    if status in RATE_LIMITED_STATUSES or names & RATE_LIMITED_NAMES:
+        return RATE_LIMITED
+    if status in TRANSIENT_STATUSES or names & TRANSIENT_NAMES:
+        return TRANSIENT
+    if status in PERMANENT_STATUSES or names & PERMANENT_NAMES:
+        return PERMANENT
+
+    message = str(exc).lower()
+    if '429' in message or 'quota' in message or 'resource has been exhausted' in message:
+        return RATE_LIMITED
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return TRANSIENT
+    # Unknown errors get the benefit of the doubt
+    return TRANSIENT
+
+
+def _seconds(value: Any) -> Optional[float]:
+    """Seconds from a number, timedelta or protobuf Duration"""
+    if value is None:
+        return None
+    if hasattr(value, 'total_seconds'):
+        return value.total_seconds()
+    if hasattr(value, 'seconds') and hasattr(value, 'nanos'):
+        return value.seconds + value.nanos / 1e9
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def server_retry_delay(exc: BaseException) -> Optional[float]:
+    """The wait the server asked for, from retry_delay, RetryInfo details, Retry-After or the message"""
+    delay = _seconds(getattr(exc, 'retry_delay', None))
+    if delay is not None:
+        return max(0.0, delay)
+
+    for detail in getattr(exc, 'details', None) or ():
+        delay = _seconds(getattr(detail, 'retry_delay', None))
+        if delay is not None:
+            return max(0.0, delay)
+
+    headers = getattr(getattr(exc, 'response', None), 'headers', None) or {}
+    retry_after = headers.get('Retry-After') if hasattr(headers, 'get') else None
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    match = _RETRY_IN_RE.search(str(exc)) or _RETRY_DELAY_RE.search(str(exc))
+    return float(match.group(1)) if match else None
+
+
+class RetryPolicy:
+    """Error-aware retries with exponential backoff and a pool-wide pause on 429s"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 60.0,
+                 logger: Any = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 rng: Optional[random.Random] = None):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.logger = logger
+        self._clock = clock
+        self._sleep = sleep
+        self._random = rng or random.Random()
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self.retries = 0
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential delay for a 0-based attempt, with up to 50% jitter taken off"""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (0.5 + self._random.random() / 2)
+
+    def pause(self, seconds: float):
+        """Hold back every caller of this policy for the next `seconds`"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def wait_if_paused(self):
+        """Block while a pool-wide pause is in effect"""
+        while True:
+            with self._lock:
+                remaining = self._paused_until - self._clock()
+            if remaining <= 0:
+                return
+            self._sleep(remaining)
+
+    def record_failure(self, exc: BaseException, attempt: int = 0) -> Tuple[str, float]:
+        """
+        Classify a failure and work out the wait before the next attempt.
+
+        Rate limits also pause the whole pool. Returns (kind, delay).
+        """
+        kind = classify_error(exc)
+        if kind == MALFORMED or kind == PERMANENT:
+            return kind, 0.0
+
+        delay = self.backoff_delay(attempt)
+        if kind == RATE_LIMITED:
+            server_delay = server_retry_delay(exc)
+            if server_delay is not None:
+                delay = min(self.max_delay, server_delay)
+            self.pause(delay)
+        return kind, delay
+
+    def call(self, operation: Callable[[], Any], description: str = 'request') -> Any:
+        """
+        Run operation until it succeeds or the policy gives up.
+
+        The last exception is re-raised when attempts run out or the error
+        is permanent.
+        """
+        for attempt in range(self.max_attempts):
+            self.wait_if_paused()
+            try:
+                return operation()
+            except Exception as e:
+                kind, delay = self.record_failure(e, attempt)
+                if kind == PERMANENT or attempt == self.max_attempts - 1:
+                    raise
+
+                with self._lock:
+                    self.retries += 1
+                if self.logger:
+                    self.logger.warning(
+                        "Attempt %d failed for %s (%s): %s; retrying in %.1fs",
+                        attempt + 1, description, kind, e, delay,
+                        extra={'tool': description, 'stage': 'retry', 'duration': delay}
+                    )
+                # Rate-limit waits happen in wait_if_paused(), shared with the pool
+                if kind == TRANSIENT and delay > 0:
+                    self._sleep(delay)
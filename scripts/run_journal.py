@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Append-only Run Journal
+
+Records every successfully fetched tool as one JSON line the moment it
+arrives, flushed and fsync'd, so an interrupted update run loses nothing
+that was already paid for. A later run with --resume reads the journal
+back and only fetches the tools that are missing from it.
+
+- one line per tool: {"name": <tool name from the tools list>, "data": {...}}
+- a line cut off by a crash is ignored when the journal is read back
+- the journal is removed once its records are compacted into the output file
+
+Usage:
+    journal = RunJournal(path)
+    done = journal.load()              # {tool name: fetched data}
+    journal.append(tool['name'], data)
+    ...
+    journal.clear()
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+
+class RunJournal:
+    """Thread-safe, fsync'd JSONL journal of completed tool fetches"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Read back completed tools, skipping unreadable (e.g. truncated) lines"""
+        records: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and isinstance(entry.get('data'), dict):
+                        records[entry.get('name')] = entry['data']
+        except OSError:
+            pass
+        return records
+
+    def append(self, name: str, data: Dict[str, Any]):
+        """Durably record one completed tool"""
+        line = json.dumps({'name': name, 'data': data}, ensure_ascii=False) + '\n'
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                torn = self._ends_mid_line()
+                self._file = open(self.path, 'a', encoding='utf-8')
+                if torn:
+                    # A crash cut the last record short; start a fresh line so
+                    # only that record is lost, not this one as well
+                    self._file.write('\n')
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _ends_mid_line(self) -> bool:
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b'\n'
+        except OSError:
+            return False
+
+    def close(self):
+        """Close the journal file (it stays on disk for --resume)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clear(self):
+        """Close and delete the journal, e.g. after compaction or for a fresh run"""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
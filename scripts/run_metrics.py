@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Run Metrics
+
+Lightweight, thread-safe instrumentation for the update scripts:
+
+- stage timers: `with metrics.time('api_call'):` records one duration sample
+- counters: metrics.increment('parse_failures')
+- sleep(): time.sleep that is also recorded, so waiting shows up as a stage
+
+At the end of a run write_json() saves a machine-readable summary
+(per-stage count/total/mean/p50/p95/max plus counters), and
+write_prometheus() optionally saves the same data in the Prometheus text
+format for a node_exporter textfile collector. Comparing the JSON of two
+runs shows where a regression came from.
+
+Usage:
+    metrics = RunMetrics('update_ai_tools')
+    with metrics.time('parse'):
+        data = extract_json(text)
+    metrics.increment('tools_fetched')
+    metrics.write_json(Path('logs/update_metrics.json'))
+"""
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from atomic_io import atomic_write_text
+
+# Upper bounds (seconds) of the Prometheus histogram buckets
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class RunMetrics:
+    """Per-stage durations and counters for one run"""
+
+    def __init__(self, run_name: str):
+        self.run_name = run_name
+        self.started_at = datetime.now().isoformat()
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stages: Dict[str, List[float]] = {}
+        self._counters: Dict[str, float] = {}
+
+    def observe(self, stage: str, seconds: float):
+        """Record one duration sample for a stage"""
+        with self._lock:
+            self._stages.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as one sample of stage (recorded even if it raises)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def sleep(self, seconds: float, stage: str = 'sleep'):
+        """time.sleep, recorded under stage"""
+        with self.time(stage):
+            time.sleep(seconds)
+
+    def increment(self, counter: str, amount: float = 1):
+        """Add to a counter"""
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def set_counter(self, counter: str, value: float):
+        """Set a counter to a value read from elsewhere (e.g. cache hits)"""
+        with self._lock:
+            self._counters[counter] = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics so far as a JSON-serializable dict"""
+        with self._lock:
+            stages = {name: sorted(samples) for name, samples in self._stages.items()}
+            counters = dict(self._counters)
+
+        summary = {}
+        for name, ordered in sorted(stages.items()):
+            total = sum(ordered)
+            summary[name] = {
+                'count': len(ordered),
+                'total_seconds': round(total, 6),
+                'mean_seconds': round(total / len(ordered), 6),
+                'p50_seconds': round(_percentile(ordered, 50), 6),
+                'p95_seconds': round(_percentile(ordered, 95), 6),
+                'max_seconds': round(ordered[-1], 6),
+                'buckets': [sum(1 for value in ordered if value <= bound) for bound in HISTOGRAM_BUCKETS],
+            }
+
+        return {
+            'run': self.run_name,
+            'startedAt': self.started_at,
+            'wallSeconds': round(time.perf_counter() - self._started, 6),
+            'bucketBounds': list(HISTOGRAM_BUCKETS),
+            'stages': summary,
+            'counters': dict(sorted(counters.items())),
+        }
+
+    def prometheus_text(self, prefix: str = 'ai_tools') -> str:
+        """Metrics in the Prometheus text exposition format"""
+        data = self.snapshot()
+        run = data['run']
+        lines = [
+            f"# HELP {prefix}_run_wall_seconds Wall time of the run",
+            f"# TYPE {prefix}_run_wall_seconds gauge",
+            f'{prefix}_run_wall_seconds{{run="{run}"}} {data["wallSeconds"]}',
+            f"# HELP {prefix}_stage_seconds Time spent per stage",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        for stage, stats in data['stages'].items():
+            labels = f'run="{run}",stage="{stage}"'
+            for bound, count in zip(HISTOGRAM_BUCKETS, stats['buckets']):
+                lines.append(f'{prefix}_stage_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_bucket{{{labels},le="+Inf"}} {stats["count"]}')
+            lines.append(f'{prefix}_stage_seconds_sum{{{labels}}} {stats["total_seconds"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{{labels}}} {stats["count"]}')
+        for counter, value in data['counters'].items():
+            lines.append(f"# TYPE {prefix}_{counter}_total counter")
+            lines.append(f'{prefix}_{counter}_total{{run="{run}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path: Path):
+        """Save snapshot() as JSON"""
+        atomic_write_text(path, json.dumps(self.snapshot(), indent=2) + '\n')
+
+    def write_prometheus(self, path: Optional[Path]):
+        """Save prometheus_text(), if a path is configured"""
+        if path:
+            # The textfile collector may read at any moment, so never expose a partial file
+            atomic_write_text(path, self.prometheus_text())
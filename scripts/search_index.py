@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Prebuilt Search Index
+
+searchTools() in src/utils/toolsConsolidator.ts lowercases and scans the
+name, description and company of every tool on every query. This module
+builds an inverted index once, when the pipeline writes the catalog, so
+a lookup only touches the query's own terms:
+
+- text is normalized (lowercase, accents stripped) and split into terms
+- each term maps to a posting list of (tool, score), where the score sums
+  the FIELD_WEIGHTS of every field the term appears in, so a hit in the
+  name outranks one in the description
+- terms are stored sorted, so every term starting with a prefix is found
+  by binary search; queries match as you type
+
+The artifact is compact JSON that the api/tools route reads once per
+change:
+
+    {"version": 1, "lastUpdated": ..., "ids": ["gpt-4", ...],
+     "terms": ["agent", "ai", ...], "postings": [[0, 8, 3, 1], ...]}
+
+postings[i] lists (index into ids, score) pairs for terms[i], flattened.
+
+Usage:
+    write_search_index(Path('src/data/aiToolsSearchIndex.json'), tools, last_updated)
+    search(index, 'code assist')
+
+    python search_index.py                          # from aiToolsData_updated.json
+    python search_index.py ../src/data/aiToolsData.ts --query "image gen"
+"""
+
+import argparse
+import bisect
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from atomic_io import atomic_write_bytes
+from tool_shards import tool_id
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CATALOG = PROJECT_ROOT / 'src' / 'data' / 'aiToolsData_updated.json'
+DEFAULT_INDEX_FILE = PROJECT_ROOT / 'src' / 'data' / 'aiToolsSearchIndex.json'
+
+INDEX_VERSION = 1
+
+# How much a term found in each field adds to a tool's score
+FIELD_WEIGHTS = {
+    'name': 8,
+    'company': 4,
+    'tags': 4,
+    'category': 3,
+    'subCategory': 3,
+    'description': 2,
+    'coreFeatures': 1,
+    'useCases': 1,
+}
+
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+    'it', 'its', 'of', 'on', 'or', 'the', 'to', 'with',
+})
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def normalize(text: str) -> str:
+    """Lowercase text with accents stripped"""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    """Normalized search terms of text, without stop words"""
+    return [token for token in _TOKEN_RE.findall(normalize(text)) if token not in STOP_WORDS]
+
+
+def _field_text(value: Any) -> Iterable[str]:
+    """Strings inside a field: the value itself, list items, or the title/name of object items"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, str):
+                yield item
+            elif isinstance(item, dict):
+                label = item.get('title') or item.get('name')
+                if isinstance(label, str):
+                    yield label
+
+
+def build_search_index(tools: List[Dict[str, Any]], last_updated: str = '') -> Dict[str, Any]:
+    """The inverted index of tools, as described in the module docstring"""
+    ids: List[str] = []
+    scores: Dict[str, Dict[int, int]] = {}
+    for tool in tools:
+        ident = tool_id(tool)
+        if not ident:
+            continue
+        doc = len(ids)
+        ids.append(ident)
+        for field, weight in FIELD_WEIGHTS.items():
+            # A term scores once per field, however often it repeats there
+            terms = {term for text in _field_text(tool.get(field)) for term in tokenize(text)}
+            for term in terms:
+                postings = scores.setdefault(term, {})
+                postings[doc] = postings.get(doc, 0) + weight
+
+    terms = sorted(scores)
+    postings = []
+    for term in terms:
+        ranked = sorted(scores[term].items(), key=lambda item: (-item[1], item[0]))
+        postings.append([value for pair in ranked for value in pair])
+
+    return {
+        'version': INDEX_VERSION,
+        'lastUpdated': last_updated,
+        'fields': FIELD_WEIGHTS,
+        'ids': ids,
+        'terms': terms,
+        'postings': postings,
+    }
+
+
+def write_search_index(path: Path, tools: List[Dict[str, Any]], last_updated: str = '') -> Dict[str, Any]:
+    """Build the index for tools and write it to path atomically; returns the index"""
+    index = build_search_index(tools, last_updated)
+    atomic_write_bytes(path, json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    return index
+
+
+def _prefix_range(terms: List[str], prefix: str) -> Tuple[int, int]:
+    start = bisect.bisect_left(terms, prefix)
+    end = bisect.bisect_left(terms, prefix + '\uffff', start)
+    return start, end
+
+
+def search(index: Dict[str, Any], query: str, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """
+    Tool ids matching every term of query (each as a prefix), best first.
+
+    Returns (id, score) pairs; an empty query matches nothing.
+    """
+    query_terms = tokenize(query)
+    if not query_terms:
+        return []
+
+    terms, postings = index['terms'], index['postings']
+    totals: Optional[Dict[int, int]] = None
+    for query_term in query_terms:
+        # Best score per tool among all terms sharing this prefix
+        best: Dict[int, int] = {}
+        start, end = _prefix_range(terms, query_term)
+        for position in range(start, end):
+            flat = postings[position]
+            for i in range(0, len(flat), 2):
+                doc, score = flat[i], flat[i + 1]
+                if score > best.get(doc, 0):
+                    best[doc] = score
+        if totals is None:
+            totals = best
+        else:
+            totals = {doc: totals[doc] + score for doc, score in best.items() if doc in totals}
+        if not totals:
+            return []
+
+    ids = index['ids']
+    ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    if limit is not None:
+        ranked = ranked[:limit]
+    return [(ids[doc], score) for doc, score in ranked]
+
+
+def load_catalog(path: Path) -> Tuple[List[Dict[str, Any]], str]:
+    """(tools, lastUpdated) from a catalog JSON or a TypeScript data file"""
+    path = Path(path)
+    if path.suffix == '.ts':
+        from ts_data_parser import ToolIndex
+        return [entry['fields'] for entry in ToolIndex.load(path)], ''
+    with open(path, 'r', encoding='utf-8') as f:
+        catalog = json.load(f)
+    return catalog.get('tools', []), catalog.get('lastUpdated', '')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line: build the index, or query it"""
+    parser = argparse.ArgumentParser(description="Build the prebuilt search index for the tools catalog")
+    parser.add_argument('catalog', nargs='?', type=Path, default=DEFAULT_CATALOG,
+                        help="Catalog JSON or aiToolsData.ts (default: aiToolsData_updated.json)")
+    parser.add_argument('--out', type=Path, default=DEFAULT_INDEX_FILE, help="Index file to write")
+    parser.add_argument('--query', help="Search the freshly built index and print the results")
+    args = parser.parse_args(argv)
+
+    try:
+        tools, last_updated = load_catalog(args.catalog)
+    except Exception as e:
+        print(f"❌ Could not read {args.catalog}: {e}")
+        return 1
+
+    index = write_search_index(args.out, tools, last_updated)
+    print(f"✅ Indexed {len(index['ids'])} tools, {len(index['terms'])} terms: {args.out}")
+    if args.query:
+        for ident, score in search(index, args.query):
+            print(f"{score:>4}  {ident}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,68 @@
 Test script for AI Tools Updater
 
 This script tests the basic functionality of the AI tools updater
-including API connectivity and configuration loading.
+including API connectivity and configuration loading, and checks that the
+TypeScript emitter and the incremental aggregates give the same results as
+a parse and a full rebuild. The fetch path (rate limiting, retries, the
+journal, delta refreshes) runs against fake_gemini.py, so those tests need
+no API key.
 
 Usage:
     python test_updater.py
 """
 
+import _thread
+import json
+import logging
 import os
+import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
 
 # Add the parent directory to the path so we can import the main script
 sys.path.insert(0, str(Path(__file__).parent))
 
+def make_test_updater(workdir, model, **settings):
+    """AIToolsUpdater on model (see fake_gemini.py) with every file under workdir and no pacing"""
+    from update_ai_tools import AIToolsUpdater, Config
+    
+    # Keep the updaters' log output out of the test report
+    if not logging.getLogger().handlers:
+        logging.getLogger().addHandler(logging.NullHandler())
+    
+    workdir = Path(workdir)
+    config = Config()
+    config.DATA_DIR = workdir / 'data'
+    config.TS_DATA_FILE = config.DATA_DIR / 'aiToolsData.ts'
+    config.OUTPUT_FILE = config.DATA_DIR / 'aiToolsData_updated.json'
+    config.SHARD_DIR = config.DATA_DIR / 'tools'
+    config.SEARCH_INDEX_FILE = config.DATA_DIR / 'aiToolsSearchIndex.json'
+    config.AGGREGATES_FILE = config.DATA_DIR / 'aiToolsAggregates.json'
+    config.BACKUP_DIR = workdir / 'backups'
+    config.LOG_FILE = workdir / 'logs' / 'ai_tools_update.log'
+    config.CACHE_FILE = workdir / 'cache' / 'gemini_responses.sqlite3'
+    config.JOURNAL_FILE = workdir / 'cache' / 'update_run.jsonl'
+    config.METRICS_FILE = workdir / 'logs' / 'update_metrics.json'
+    config.PROMETHEUS_FILE = None
+    config.CACHE_ENABLED = False
+    config.REQUESTS_PER_MINUTE = 60000
+    config.RATE_LIMIT_DELAY = 0
+    config.RETRY_BASE_DELAY = 0.01
+    config.PROMPT_BATCH_SIZE = 1
+    config.REFRESH_MODE = 'full'
+    for name, value in settings.items():
+        setattr(config, name, value)
+    return AIToolsUpdater(config, model=model)
+
+def make_test_tools(count):
+    """count scheduling entries like those extract_tools_from_typescript() returns"""
+    return [
+        {'id': f'test-tool-{i}', 'name': f'Test Tool {i}', 'company': 'Test', 'category': 'Large Language Models'}
+        for i in range(1, count + 1)
+    ]
+
 def test_environment():
     """Test environment setup"""
     print("🔧 Testing environment setup...")
@@ -129,6 +178,686 @@ def test_updater_import():
         print(f"❌ Failed to import updater: {e}")
         return False
 
+def test_import_time():
+    """Test that the updater CLIs start without loading the Gemini client"""
+    print("\n⏱️  Testing import time...")
+    
+    budget = 0.5  # seconds; importing google.generativeai alone takes ~1s
+    heavy = ('google.generativeai', 'grpc', 'requests', 'dotenv')
+    code = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        "import update_ai_tools, enhanced_ai_tools_updater, quick_tools_updater\n"
+        "print(time.perf_counter() - started)\n"
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))\n"
+    )
+    
+    # A fresh interpreter, so modules imported by earlier tests don't count
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=Path(__file__).parent, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"❌ Import failed: {result.stderr.strip()}")
+        return False
+    
+    lines = result.stdout.splitlines()
+    seconds = float(lines[0])
+    loaded = lines[1] if len(lines) > 1 else ''
+    if loaded:
+        print(f"❌ Heavy modules loaded at import time: {loaded}")
+        return False
+    if seconds > budget:
+        print(f"❌ Import took {seconds:.3f}s (budget {budget}s)")
+        return False
+    
+    print(f"✅ Updater modules imported in {seconds * 1000:.0f} ms")
+    return True
+
+def test_ts_emitter_round_trip():
+    """Test that emitted TypeScript parses back to the same values"""
+    print("\n🔁 Testing TypeScript emitter round trip...")
+    
+    from ts_data_parser import ToolIndex, parse_ts_literal
+    from ts_emitter import emit_ts
+    
+    tricky = {
+        'name': "It's a \\ backslash",
+        'description': 'Line\u2028separator, paragraph\u2029separator\nnewline\ttab \x7f',
+        'Free plan': ['quoted \'key\'', '', 'plain'],
+        'popularity': {'trendingScore': 85, 'marketShare': 12.5},
+        'apiAccess': True,
+        'tags': [],
+        'nested': [{'a': ['x', {'b': {}}]}, []],
+    }
+    values = [tricky]
+    ts_file = Path(__file__).parent.parent / 'src' / 'data' / 'aiToolsData.ts'
+    if ts_file.exists():
+        values.extend(entry['fields'] for entry in ToolIndex.load(ts_file))
+    
+    for value in values:
+        for expand_arrays in (False, True):
+            text = emit_ts(value, 1, expand_arrays)
+            parsed = parse_ts_literal(text)[0]
+            if parsed != value:
+                print(f"❌ Round trip changed {value.get('name', value)!r}")
+                return False
+            if emit_ts(parsed, 1, expand_arrays) != text:
+                print(f"❌ Re-emitting {value.get('name', value)!r} gave different text")
+                return False
+    
+    for char in ('\u2028', '\u2029'):
+        if char in emit_ts(tricky):
+            print(f"❌ U+{ord(char):04X} written unescaped")
+            return False
+    
+    print(f"✅ {len(values)} values round-trip through emit_ts and the parser")
+    return True
+
+def test_aggregates_incremental():
+    """Test that an incremental aggregates update matches a full rebuild"""
+    print("\n📊 Testing incremental aggregates...")
+    
+    from tool_aggregates import update_aggregates
+    
+    def tool(ident, category, tags, score):
+        return {'id': ident, 'name': ident.title(), 'category': category, 'tags': tags,
+                'popularity': {'trendingScore': score, 'marketShare': 1}}
+    
+    before = [
+        tool('alpha', 'Writing', ['text'], 90),
+        tool('beta', 'Writing', ['text', 'seo'], 70),
+        tool('gamma', 'Images', ['art'], 70),
+        tool('delta', 'Images', ['art', 'video'], 40),
+        tool('epsilon', 'Code', ['ide'], 55),
+    ]
+    after = [
+        tool('alpha', 'Writing', ['text'], 20),            # score drops
+        tool('beta', 'Images', ['seo', 'art'], 70),        # category and tags change
+        tool('gamma', 'Images', ['art'], 70),              # unchanged
+        tool('epsilon', 'Code', ['ide', 'agents'], 95),    # delta removed; new tag and score
+        tool('zeta', 'Code', ['agents'], 70),              # added, tied on score
+    ]
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        incremental = Path(workdir) / 'incremental.json'
+        rebuilt = Path(workdir) / 'rebuilt.json'
+        update_aggregates(incremental, before, 'now', top_n=3)
+        counts = update_aggregates(incremental, after, 'now', top_n=3)
+        update_aggregates(rebuilt, after, 'now', top_n=3)
+        incremental_data = json.loads(incremental.read_text(encoding='utf-8'))
+        rebuilt_data = json.loads(rebuilt.read_text(encoding='utf-8'))
+    
+    if counts != {'changed': 4, 'unchanged': 1, 'removed': 1}:
+        print(f"❌ Unexpected update counts: {counts}")
+        return False
+    if incremental_data != rebuilt_data:
+        for key in rebuilt_data:
+            if incremental_data.get(key) != rebuilt_data[key]:
+                print(f"❌ '{key}' differs: {incremental_data.get(key)} != {rebuilt_data[key]}")
+        return False
+    
+    print("✅ Incremental update matches a full rebuild")
+    return True
+
+def test_interrupt_keeps_paid_results():
+    """Test that Ctrl-C during a concurrent run journals every completed call"""
+    print("\n🛑 Testing interrupted concurrent fetch...")
+    
+    from fake_gemini import FakeGenerativeModel
+    
+    model = FakeGenerativeModel(latency=0.1, jitter=0.0, seed=1)
+    with tempfile.TemporaryDirectory() as workdir:
+        updater = make_test_updater(workdir, model, MAX_CONCURRENT_REQUESTS=2)
+        timer = threading.Timer(0.35, _thread.interrupt_main)
+        timer.start()
+        try:
+            updater.fetch_tools_concurrently(make_test_tools(20))
+            interrupted = False
+        except KeyboardInterrupt:
+            interrupted = True
+        finally:
+            timer.cancel()
+            updater.journal.close()
+        journaled = updater.journal.load()
+    
+    completed = sum(1 for call in model.calls if call['outcome'] == 'ok')
+    if not interrupted:
+        print("❌ The run finished before the interrupt; nothing was tested")
+        return False
+    if len(model.calls) >= 20:
+        print(f"❌ Queued requests still ran after the interrupt ({len(model.calls)} calls)")
+        return False
+    if len(journaled) != completed:
+        print(f"❌ {completed} calls completed but {len(journaled)} results were journaled")
+        return False
+    
+    print(f"✅ Interrupted after {len(model.calls)} of 20 calls; all {completed} results journaled")
+    return True
+
+def test_integration_matching():
+    """Test that careful integration places records by stamped id, then by name or slug"""
+    print("\n🧩 Testing integration record matching...")
+    
+    from careful_integration import CarefulDataIntegrator
+    from ts_data_parser import ToolIndex
+    
+    index = ToolIndex.from_text(
+        "export const aiToolsData: AITool[] = [\n"
+        "  {\n    id: 'gpt-4',\n    name: 'GPT-4'\n  },\n"
+        "  {\n    id: 'canva-magic-studio',\n    name: 'Canva Magic Studio'\n  },\n"
+        "  {\n    id: 'notion-ai',\n    name: 'Notion Assistant'\n  }\n"
+        "]\n"
+    )
+    records = [
+        {'id': 'canva-magic-studio', 'name': 'Canva Magic Studio (AI Capabilities)'},  # stamped id
+        {'name': 'gpt-4'},                                                             # no id: name
+        {'name': 'Notion AI'},                                                         # no id: slug
+        {'name': 'Unknown Tool'},                                                      # no match
+    ]
+    expected = {
+        'canva-magic-studio': 'Canva Magic Studio (AI Capabilities)',
+        'gpt-4': 'gpt-4',
+        'notion-ai': 'Notion AI',
+    }
+    
+    matched = {
+        tool_id: record['name']
+        for tool_id, record in CarefulDataIntegrator().iter_updated_tools({'tools': records}, index)
+    }
+    if matched != expected:
+        print(f"❌ Records matched as {matched}, expected {expected}")
+        return False
+    
+    print("✅ Stamped ids, names and slugs all matched; the unknown record was skipped")
+    return True
+
+def test_response_cache():
+    """Test cache hits and misses, TTL and max_age expiry, LRU eviction, and date-free prompts"""
+    print("\n🗄️  Testing response cache...")
+    
+    import response_cache
+    import update_ai_tools
+    from datetime import datetime, timedelta
+    from fake_gemini import FakeGenerativeModel
+    from response_cache import CachedModel, ResponseCache
+    
+    class Clock:
+        """Stands in for the time module inside response_cache"""
+        now = 1_000_000.0
+        
+        @classmethod
+        def time(cls):
+            return cls.now
+    
+    real_time = response_cache.time
+    response_cache.time = Clock
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            cache = ResponseCache(Path(workdir) / 'responses.sqlite3', ttl_seconds=3600, max_bytes=10_000)
+            try:
+                fake = FakeGenerativeModel(latency=0, seed=1)
+                model = CachedModel(fake, cache, 'fake')
+                first = model.generate_content('prompt a').text
+                second = model.generate_content('prompt a').text
+                if len(fake.calls) != 1 or first != second or (cache.hits, cache.misses) != (1, 1):
+                    print(f"❌ Repeated prompt made {len(fake.calls)} model calls "
+                          f"({cache.hits} hits, {cache.misses} misses)")
+                    return False
+                
+                Clock.now += 600
+                if cache.get('fake', 'prompt a', max_age=300) is not None:
+                    print("❌ Entry older than max_age was served")
+                    return False
+                if cache.get('fake', 'prompt a') is None:
+                    print("❌ Entry within the TTL was not served")
+                    return False
+                Clock.now += 3600
+                if cache.get('fake', 'prompt a') is not None:
+                    print("❌ Entry older than the TTL was served")
+                    return False
+                
+                # Three 4000-byte entries do not fit in 10000; the least recently read goes
+                for prompt in ('p1', 'p2'):
+                    cache.put('fake', prompt, 'x' * 4000)
+                    Clock.now += 1
+                cache._memory.clear()
+                cache.get('fake', 'p1')
+                Clock.now += 1
+                cache.put('fake', 'p3', 'x' * 4000)
+                cache._memory.clear()
+                kept = [prompt for prompt in ('p1', 'p2', 'p3') if cache.get('fake', prompt) is not None]
+                if kept != ['p1', 'p3']:
+                    print(f"❌ LRU eviction kept {kept}, expected ['p1', 'p3']")
+                    return False
+            finally:
+                cache.close()
+            
+            # Prompts carry no date, so a run resumed on a later day hits the cache
+            updater = make_test_updater(workdir, FakeGenerativeModel(latency=0))
+            tool = make_test_tools(1)[0]
+            today = (updater.generate_update_prompt(tool), updater.generate_batch_prompt([tool, tool]))
+            
+            class NextMonth(datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return datetime.now(tz) + timedelta(days=40)
+            
+            update_ai_tools.datetime = NextMonth
+            try:
+                later = (updater.generate_update_prompt(tool), updater.generate_batch_prompt([tool, tool]))
+            finally:
+                update_ai_tools.datetime = datetime
+            if today != later:
+                print("❌ Prompts for the same tool differ from one day to the next")
+                return False
+    finally:
+        response_cache.time = real_time
+    
+    print("✅ Hits, misses, TTL and max_age expiry, LRU eviction and prompt keys all behave")
+    return True
+
+def test_shard_variants():
+    """Test that shards never keep a stale .br or a .gz/.br without its .json"""
+    print("\n🗂️  Testing shard variants...")
+    
+    import tool_shards
+    
+    real_brotli = tool_shards.brotli
+    tool_shards.brotli = None
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            shard_dir = Path(workdir)
+            tools = make_test_tools(2)
+            tool_shards.write_shards(shard_dir, tools, '2024-01-01')
+            
+            # As left by an earlier run with brotli, and by an interrupted removal
+            stale = shard_dir / 'test-tool-1.json.br'
+            stale.write_bytes(b'old content')
+            orphans = [shard_dir / 'gone.json.gz', shard_dir / 'gone.json.br']
+            for orphan in orphans:
+                orphan.write_bytes(b'old content')
+            
+            tools[0] = dict(tools[0], company='Renamed')
+            tool_shards.write_shards(shard_dir, tools, '2024-01-02')
+            left = [path.name for path in [stale] + orphans if path.exists()]
+            if left:
+                print(f"❌ Stale variants left behind: {left}")
+                return False
+            if not (shard_dir / 'test-tool-1.json.gz').exists():
+                print("❌ .gz variant of a rewritten shard is missing")
+                return False
+    finally:
+        tool_shards.brotli = real_brotli
+    
+    print("✅ Stale .br and orphaned variants were removed")
+    return True
+
+def test_changed_only_export():
+    """Test that --changed-only exports a tool again when only an exported field like lastUpdated changed"""
+    print("\n📤 Testing changed-only export...")
+    
+    from tool_export import export_tools
+    from ts_data_parser import ToolIndex
+    
+    def catalog(gpt_updated):
+        return ToolIndex.from_text(
+            "export const aiToolsData: AITool[] = [\n"
+            f"  {{\n    id: 'gpt-4',\n    name: 'GPT-4',\n    lastUpdated: '{gpt_updated}'\n  }},\n"
+            "  {\n    id: 'notion-ai',\n    name: 'Notion AI',\n    lastUpdated: '2024-01-01'\n  }\n"
+            "]\n"
+        )
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        out = Path(workdir) / 'tools.tsv'
+        state_file = Path(workdir) / 'tools.state.json'
+        counts = [
+            export_tools(catalog('2024-01-01').entries, out, 'tsv', state_file),
+            export_tools(catalog('2024-01-01').entries, out, 'tsv', state_file),
+            export_tools(catalog('2024-02-01').entries, out, 'tsv', state_file),
+        ]
+        if counts != [2, 0, 1]:
+            print(f"❌ Exported {counts} tools over three runs, expected [2, 0, 1]")
+            return False
+        if '2024-02-01' not in out.read_text(encoding='utf-8'):
+            print("❌ The new lastUpdated was not exported")
+            return False
+    
+    print("✅ Unchanged tools were skipped and a new lastUpdated was exported")
+    return True
+
+def test_rate_limiter():
+    """Test that the token bucket holds both the requests-per-minute and the concurrency ceiling"""
+    print("\n⏱️  Testing rate limiter...")
+    
+    from rate_limiter import TokenBucketLimiter
+    
+    # A fake clock that sleeping advances: 60/minute with a burst of 2 means
+    # two requests at once, then one a second
+    clock = [0.0]
+    waits = []
+    
+    def sleep(seconds):
+        waits.append(round(seconds, 6))
+        clock[0] += seconds
+    
+    limiter = TokenBucketLimiter(60, max_concurrent=2, clock=lambda: clock[0], sleep=sleep)
+    for _ in range(5):
+        with limiter:
+            pass
+    if waits != [1.0, 1.0, 1.0]:
+        print(f"❌ Waits of {waits} for 5 requests, expected [1.0, 1.0, 1.0]")
+        return False
+    
+    limiter = TokenBucketLimiter(60000, max_concurrent=3)
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+    
+    def request():
+        with limiter:
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            threading.Event().wait(0.02)
+            with lock:
+                in_flight[0] -= 1
+    
+    threads = [threading.Thread(target=request) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if not 2 <= peak[0] <= 3:
+        print(f"❌ {peak[0]} requests in flight at once, expected at most 3 (and more than 1)")
+        return False
+    
+    print(f"✅ One request a second after the burst; at most {peak[0]} of 3 allowed in flight")
+    return True
+
+def test_concurrent_order():
+    """Test that concurrent fetches come back in catalog order, however the requests finish"""
+    print("\n🔀 Testing concurrent result order...")
+    
+    from fake_gemini import FakeGenerativeModel
+    
+    tools = make_test_tools(12)
+    expected = [tool['id'] for tool in tools]
+    for batch_size in (1, 3):
+        with tempfile.TemporaryDirectory() as workdir:
+            # Jitter larger than the latency makes requests finish out of order
+            fake = FakeGenerativeModel(latency=0.005, jitter=0.03, seed=batch_size)
+            updater = make_test_updater(workdir, fake, MAX_CONCURRENT_REQUESTS=4, PROMPT_BATCH_SIZE=batch_size)
+            try:
+                results = updater.fetch_tools_concurrently(tools)
+            finally:
+                updater.journal.clear()
+            order = [record.get('id') for record in results]
+            if order != expected:
+                print(f"❌ Batches of {batch_size}: results came back as {order}")
+                return False
+            if any(record.get('company') == 'Test' for record in results):
+                print(f"❌ Batches of {batch_size}: some tools kept their original info")
+                return False
+    
+    print("✅ Results kept catalog order with single and batched prompts")
+    return True
+
+def test_journal_resume():
+    """Test that the journal survives a torn last line and that --resume skips journaled tools"""
+    print("\n📓 Testing run journal and --resume...")
+    
+    from fake_gemini import FakeGenerativeModel
+    from run_journal import RunJournal
+    from ts_data_parser import ToolIndex
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        journal = RunJournal(Path(workdir) / 'run.jsonl')
+        journal.append('Tool A', {'name': 'Tool A'})
+        journal.append('Tool B', {'name': 'Tool B'})
+        journal.close()
+        # A crash in the middle of a write leaves half a line behind
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"name": "Tool C", "da')
+        journal.append('Tool D', {'name': 'Tool D'})
+        journal.close()
+        if sorted(journal.load()) != ['Tool A', 'Tool B', 'Tool D']:
+            print(f"❌ Journal read back {sorted(journal.load())}, expected Tool A, B and D")
+            return False
+        
+        tools = make_test_tools(4)
+        index = ToolIndex.from_text(
+            "export const aiToolsData: AITool[] = [\n"
+            + ",\n".join(f"  {{\n    id: '{tool['id']}',\n    name: '{tool['name']}',\n"
+                          f"    company: 'Test',\n    category: 'Large Language Models'\n  }}"
+                          for tool in tools)
+            + "\n]\n"
+        )
+        fake = FakeGenerativeModel(latency=0)
+        updater = make_test_updater(workdir, fake, RESUME=True, MIN_REFRESH_AGE_DAYS=0)
+        for tool in tools[:2]:
+            updater.journal.append(tool['name'], {'id': tool['id'], 'name': tool['name'], 'company': 'From Journal'})
+        updater.journal.close()
+        output = updater.run_update(index)
+        
+        fetched = sorted(name for call in fake.calls for name in call['tools'])
+        if fetched != ['Test Tool 3', 'Test Tool 4']:
+            print(f"❌ Resumed run fetched {fetched}, expected only Test Tool 3 and 4")
+            return False
+        companies = [record.get('company') for record in output or []]
+        if len(companies) != 4 or companies[:2] != ['From Journal', 'From Journal']:
+            print(f"❌ Resumed run saved companies {companies}, expected the journaled two first")
+            return False
+        if updater.config.JOURNAL_FILE.exists():
+            print("❌ Journal was not removed after compaction")
+            return False
+    
+    print("✅ Torn line skipped, later records kept; --resume fetched only the missing tools")
+    return True
+
+def test_retry_policy():
+    """Test error classification, which kinds are retried, and the pool-wide pause on a 429"""
+    print("\n🔁 Testing retry policy...")
+    
+    import random
+    from fake_gemini import FakeRateLimitError, FakeServerError
+    from retry_policy import MalformedResponseError, RetryPolicy, classify_error
+    
+    class BadRequest(Exception):
+        code = 400
+    
+    cases = [
+        (FakeRateLimitError("429 Resource has been exhausted", 5), 'rate_limited'),
+        (Exception("Quota exceeded for requests per minute"), 'rate_limited'),
+        (FakeServerError("503 Service Unavailable"), 'transient'),
+        (TimeoutError("timed out"), 'transient'),
+        (MalformedResponseError("no JSON"), 'malformed'),
+        (BadRequest("400 API key not valid"), 'permanent'),
+    ]
+    for error, expected in cases:
+        if classify_error(error) != expected:
+            print(f"❌ {type(error).__name__}({error}) classified as {classify_error(error)}, expected {expected}")
+            return False
+    
+    clock = [0.0]
+    sleeps = []
+    
+    def sleep(seconds):
+        sleeps.append(round(seconds, 6))
+        clock[0] += seconds
+    
+    def make_policy():
+        del sleeps[:]
+        return RetryPolicy(max_attempts=3, base_delay=1, max_delay=30, clock=lambda: clock[0],
+                           sleep=sleep, rng=random.Random(0))
+    
+    def failing(*errors):
+        """Operation raising errors in turn, then returning 'ok'; counts its calls"""
+        calls = []
+        
+        def operation():
+            calls.append(clock[0])
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return 'ok'
+        return operation, calls
+    
+    # A 429 on one worker holds back the next request from any worker for the server's delay
+    policy = make_policy()
+    kind, delay = policy.record_failure(FakeRateLimitError("429", 5))
+    started = clock[0]
+    operation, calls = failing()
+    if (kind, delay) != ('rate_limited', 5) or policy.call(operation) != 'ok' or calls != [started + 5]:
+        print(f"❌ Other workers were not paused for the 429's retry delay (sleeps {sleeps})")
+        return False
+    
+    policy = make_policy()
+    operation, calls = failing(BadRequest("400"))
+    try:
+        policy.call(operation)
+    except BadRequest:
+        pass
+    if len(calls) != 1 or sleeps:
+        print(f"❌ Permanent error was tried {len(calls)} times")
+        return False
+    
+    policy = make_policy()
+    operation, calls = failing(MalformedResponseError("no JSON"))
+    if policy.call(operation) != 'ok' or len(calls) != 2 or sleeps:
+        print(f"❌ Malformed response: {len(calls)} calls, sleeps {sleeps}; expected an immediate retry")
+        return False
+    
+    policy = make_policy()
+    operation, calls = failing(*[FakeServerError("503")] * 3)
+    try:
+        policy.call(operation)
+    except FakeServerError:
+        pass
+    if len(calls) != 3 or len(sleeps) != 2 or not (0.5 <= sleeps[0] <= 1 and 1 <= sleeps[1] <= 2):
+        print(f"❌ Transient errors: {len(calls)} calls with backoff {sleeps}, expected 3 calls, 2 growing waits")
+        return False
+    
+    print("✅ Errors classified; permanent not retried, malformed retried at once, "
+          "transient backed off, 429 paused the pool")
+    return True
+
+def test_json_extraction():
+    """Test the balanced JSON extractor on fences, trailing commas, comments and truncated responses"""
+    print("\n🧾 Testing JSON extraction...")
+    
+    from json_extract import JSONExtractionError, extract_json
+    
+    cases = [
+        ('Sure! {"draft": true}\n```json\n{"name": "GPT-4", "tags": ["llm",],}\n```\nHope this helps {x}',
+         dict, {'name': 'GPT-4', 'tags': ['llm']}),
+        ('Here you go: {"name": "A {b} [c]", "note": "say \\"hi\\"",} and that is all.',
+         dict, {'name': 'A {b} [c]', 'note': 'say "hi"'}),
+        ('{\n  // the model likes comments\n  "name": "Claude", /* inline */ "version": "3",\n}',
+         dict, {'name': 'Claude', 'version': '3'}),
+        ('Results:\n[{"ref": 1}, {"ref": 2},]\nDone.', list, [{'ref': 1}, {'ref': 2}]),
+    ]
+    for text, expect, expected in cases:
+        try:
+            value = extract_json(text, expect)
+        except JSONExtractionError as e:
+            print(f"❌ {text!r} raised {e}")
+            return False
+        if value != expected:
+            print(f"❌ {text!r} gave {value!r}, expected {expected!r}")
+            return False
+    
+    for text in ('```json\n{"name": "GPT-4", "tags": ["llm", "chat"', '', 'No JSON here.'):
+        try:
+            value = extract_json(text)
+        except JSONExtractionError:
+            continue
+        print(f"❌ {text!r} gave {value!r} instead of raising JSONExtractionError")
+        return False
+    
+    print("✅ Fenced, commented and trailing-comma JSON parsed; truncated and missing JSON rejected")
+    return True
+
+def test_backup_store():
+    """Test that backups are deduplicated by content and pruned to keep_last versions"""
+    print("\n💾 Testing backup store...")
+    
+    from backup_store import BackupStore
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        data_file = workdir / 'aiToolsData.ts'
+        # max_age_days=-1: no version is young enough to be kept on age alone
+        store = BackupStore(workdir / 'store', keep_last=2, max_age_days=-1, base_dir=workdir)
+        
+        def stored_objects():
+            return sorted(path.name for path in (store.root / 'objects').glob('*/*.gz'))
+        
+        data_file.write_text('version 1', encoding='utf-8')
+        first = store.save(data_file)
+        again = store.save(data_file)
+        if again != first or len(store.versions()) != 1 or len(stored_objects()) != 1:
+            print(f"❌ Unchanged file stored again: {len(store.versions())} versions, {len(stored_objects())} objects")
+            return False
+        
+        for version in range(2, 5):
+            data_file.write_text(f'version {version}', encoding='utf-8')
+            store.save(data_file)
+        kept = [store.read(entry['hash']).decode('utf-8') for entry in store.versions(data_file)]
+        if kept != ['version 4', 'version 3'] or len(stored_objects()) != 2:
+            print(f"❌ Retention kept {kept} and {len(stored_objects())} objects, expected versions 4 and 3")
+            return False
+        
+        store.restore(store.versions(data_file)[1]['hash'][:12])
+        if data_file.read_text(encoding='utf-8') != 'version 3':
+            print("❌ Restore did not bring back version 3")
+            return False
+    
+    print("✅ Identical backup deduplicated; only the last 2 versions and their objects kept")
+    return True
+
+def test_delta_merge():
+    """Test that delta answers only change the volatile fields, single and batched"""
+    print("\n🔧 Testing delta merge...")
+    
+    from datetime import datetime
+    from delta_refresh import VOLATILE_FIELDS, merge_delta
+    from fake_gemini import FakeGenerativeModel
+    
+    record = {'id': 'gpt-4', 'name': 'GPT-4', 'description': 'Original description',
+              'pricing': 'Paid', 'version': '4', 'status': 'Active'}
+    delta = {'pricing': 'Freemium', 'version': 'Unknown', 'status': 'Exploded', 'description': 'Rewritten'}
+    merged, changed = merge_delta(record, delta, VOLATILE_FIELDS, today='2024-05-01')
+    expected = dict(record, pricing='Freemium', lastUpdated='2024-05-01')
+    if merged != expected or changed != ['pricing']:
+        print(f"❌ merge_delta gave {merged} (changed {changed}), expected {expected}")
+        return False
+    if record['pricing'] != 'Paid':
+        print("❌ merge_delta modified the record it was given")
+        return False
+    
+    # Through the updater: the fake answers delta prompts with only the changed fields
+    tools = make_test_tools(2)
+    for batch_size in (1, 2):
+        with tempfile.TemporaryDirectory() as workdir:
+            fake = FakeGenerativeModel(latency=0)
+            updater = make_test_updater(workdir, fake, REFRESH_MODE='delta', PROMPT_BATCH_SIZE=batch_size)
+            updater.current_records = {
+                tool['id']: dict(tool, description='Original description', longDescription='Kept',
+                                 pricing='Paid', version='1.0', status='Active')
+                for tool in tools
+            }
+            results = [record for start in range(0, len(tools), batch_size)
+                       for record in updater.fetch_tool_batch(tools[start:start + batch_size])]
+        for tool, result in zip(tools, results):
+            expected = dict(updater.current_records[tool['id']], pricing='Freemium',
+                            lastUpdated=datetime.now().strftime('%Y-%m-%d'))
+            if result != expected:
+                print(f"❌ Batches of {batch_size}: {tool['name']} came back as {result}, expected {expected}")
+                return False
+    
+    print("✅ Only changed, valid volatile fields were merged; everything else was kept")
+    return True
+
 def main():
     """Run all tests"""
     print("🧪 AI Tools Updater Test Suite")
@@ -139,6 +868,21 @@ def main():
         ("Environment File", test_env_file),
         ("Directory Structure", test_directory_structure),
         ("Updater Import", test_updater_import),
+        ("Import Time", test_import_time),
+        ("TypeScript Emitter", test_ts_emitter_round_trip),
+        ("Aggregates", test_aggregates_incremental),
+        ("Interrupted Fetch", test_interrupt_keeps_paid_results),
+        ("Integration Matching", test_integration_matching),
+        ("Response Cache", test_response_cache),
+        ("Shard Variants", test_shard_variants),
+        ("Changed-only Export", test_changed_only_export),
+        ("Rate Limiter", test_rate_limiter),
+        ("Concurrent Order", test_concurrent_order),
+        ("Journal and Resume", test_journal_resume),
+        ("Retry Policy", test_retry_policy),
+        ("JSON Extraction", test_json_extraction),
+        ("Backup Store", test_backup_store),
+        ("Delta Merge", test_delta_merge),
         ("Gemini API", test_gemini_api),
     ]
     
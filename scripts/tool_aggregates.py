@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Precomputed Category, Tag and Trending Lists
+
+getToolsByCategory() and getFeaturedTools() in toolsConsolidator.ts filter
+and sort the whole catalog on every call. This module writes the lists
+they need once, when the pipeline saves the catalog:
+
+- categories: category -> tool ids
+- tags: tag -> tool ids
+- topTrending: the top_n tool ids by popularity.trendingScore
+- ranking: every tool id by trendingScore, which topTrending is cut from
+
+Every list is ordered the same way (trendingScore descending, then id),
+so a page can slice any of them for "top tools in X".
+
+The artifact also keeps each tool's category, tags, score and tool_hash.
+On the next run only tools whose hash changed, or that were added or
+removed, are moved between lists (by binary insertion), instead of
+regrouping and resorting the catalog.
+
+Usage:
+    update_aggregates(Path('src/data/aiToolsAggregates.json'), tools, last_updated)
+
+    python tool_aggregates.py ../src/data/aiToolsData.ts --top 10
+"""
+
+import argparse
+import bisect
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from atomic_io import atomic_write_json
+from search_index import load_catalog
+from tool_shards import tool_id
+from ts_data_parser import tool_hash
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CATALOG = PROJECT_ROOT / 'src' / 'data' / 'aiToolsData_updated.json'
+DEFAULT_AGGREGATES_FILE = PROJECT_ROOT / 'src' / 'data' / 'aiToolsAggregates.json'
+
+AGGREGATES_VERSION = 1
+DEFAULT_TOP_N = 12
+
+
+def trending_score(tool: Dict[str, Any]) -> float:
+    """popularity.trendingScore, or 0 when missing or not a number"""
+    popularity = tool.get('popularity')
+    score = popularity.get('trendingScore') if isinstance(popularity, dict) else None
+    return score if isinstance(score, (int, float)) and not isinstance(score, bool) else 0
+
+
+def _summary(tool: Dict[str, Any]) -> Dict[str, Any]:
+    tags = tool.get('tags')
+    return {
+        'category': tool.get('category') or 'Unknown',
+        'tags': [tag for tag in tags if isinstance(tag, str)] if isinstance(tags, list) else [],
+        'score': trending_score(tool),
+        'hash': tool_hash(tool),
+    }
+
+
+class Aggregates:
+    """The lists above plus per-tool state, kept sorted by (-score, id)"""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        self.tools: Dict[str, Dict[str, Any]] = data.get('tools', {})
+        self.categories: Dict[str, List[str]] = data.get('categories', {})
+        self.tags: Dict[str, List[str]] = data.get('tags', {})
+        self.ranking: List[str] = data.get('ranking', [])
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['Aggregates']:
+        """The saved aggregates, or None if missing, unreadable or from another version"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != AGGREGATES_VERSION:
+            return None
+        return cls(data)
+
+    def _key(self, ident: str) -> Tuple[float, str]:
+        return -self.tools[ident]['score'], ident
+
+    def _insert(self, ids: List[str], ident: str):
+        keys = [self._key(other) for other in ids]
+        ids.insert(bisect.bisect_left(keys, self._key(ident)), ident)
+
+    @staticmethod
+    def _discard(groups: Dict[str, List[str]], name: str, ident: str):
+        ids = groups.get(name)
+        if ids and ident in ids:
+            ids.remove(ident)
+            if not ids:
+                del groups[name]
+
+    def remove(self, ident: str):
+        """Take a tool out of every list"""
+        summary = self.tools.pop(ident, None)
+        if summary is None:
+            return
+        self._discard(self.categories, summary['category'], ident)
+        for tag in summary['tags']:
+            self._discard(self.tags, tag, ident)
+        if ident in self.ranking:
+            self.ranking.remove(ident)
+
+    def add(self, ident: str, tool: Dict[str, Any]):
+        """Add (or re-add) a tool to the lists it belongs in"""
+        self.remove(ident)
+        summary = _summary(tool)
+        self.tools[ident] = summary
+        self._insert(self.categories.setdefault(summary['category'], []), ident)
+        for tag in dict.fromkeys(summary['tags']):
+            self._insert(self.tags.setdefault(tag, []), ident)
+        self._insert(self.ranking, ident)
+
+    def apply(self, tools: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Bring the lists in line with tools, touching only what changed"""
+        current: Dict[str, Dict[str, Any]] = {}
+        for tool in tools:
+            ident = tool_id(tool)
+            if ident:
+                current[ident] = tool
+
+        removed = [ident for ident in self.tools if ident not in current]
+        for ident in removed:
+            self.remove(ident)
+
+        changed = 0
+        for ident, tool in current.items():
+            previous = self.tools.get(ident)
+            if previous is None or previous['hash'] != tool_hash(tool):
+                self.add(ident, tool)
+                changed += 1
+        return {'changed': changed, 'unchanged': len(current) - changed, 'removed': len(removed)}
+
+    def to_dict(self, last_updated: str, top_n: int) -> Dict[str, Any]:
+        return {
+            'version': AGGREGATES_VERSION,
+            'lastUpdated': last_updated,
+            'totalTools': len(self.tools),
+            'categories': dict(sorted(self.categories.items())),
+            'tags': dict(sorted(self.tags.items())),
+            'topTrending': self.ranking[:top_n],
+            'ranking': self.ranking,
+            'tools': dict(sorted(self.tools.items())),
+        }
+
+
+def update_aggregates(path: Path, tools: List[Dict[str, Any]], last_updated: str = '',
+                      top_n: int = DEFAULT_TOP_N) -> Dict[str, int]:
+    """
+    Update the aggregates file at path for tools, atomically.
+
+    Returns counts of changed, unchanged and removed tools.
+    """
+    aggregates = Aggregates.load(path) or Aggregates()
+    counts = aggregates.apply(tools)
+    atomic_write_json(path, aggregates.to_dict(last_updated, top_n), ensure_ascii=False, separators=(',', ':'))
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line: update the aggregates from a catalog"""
+    parser = argparse.ArgumentParser(description="Write precomputed category, tag and trending lists")
+    parser.add_argument('catalog', nargs='?', type=Path, default=DEFAULT_CATALOG,
+                        help="Catalog JSON or aiToolsData.ts (default: aiToolsData_updated.json)")
+    parser.add_argument('--out', type=Path, default=DEFAULT_AGGREGATES_FILE, help="Aggregates file to write")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP_N, help="Length of topTrending")
+    args = parser.parse_args(argv)
+
+    try:
+        tools, last_updated = load_catalog(args.catalog)
+    except Exception as e:
+        print(f"❌ Could not read {args.catalog}: {e}")
+        return 1
+
+    counts = update_aggregates(args.out, tools, last_updated, args.top)
+    print(f"✅ Aggregates in {args.out}: {counts['changed']} changed, "
+          f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
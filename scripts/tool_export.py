@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tool Catalog Exporter
+
+Exports the tools in aiToolsData.ts as plain text (ai-tools-list.txt), TSV
+or JSONL. Earlier versions of write_ai_tools_txt.py compiled a fresh regex
+for every key of every tool and ran about 20 searches over each object's
+text. Here:
+
+- fields come from the parse ToolIndex already does (one linear pass over
+  the file, or none when its cached index is current), so exporting needs
+  no regex at all
+- rows are rendered and written one tool at a time, straight into the
+  output through atomic_open(), rather than collected in memory first
+- with a state file, only tools whose exported fields changed since the
+  last export are written. This is export_hash(), not the catalog's
+  tool_hash, which ignores lastUpdated even though it is a column here
+
+Usage:
+    index = ToolIndex.load(Path('src/data/aiToolsData.ts'))
+    export_tools(index.entries, Path('tools.tsv'), 'tsv')
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from atomic_io import atomic_open, atomic_write_json
+
+# Columns of every format, in output order
+EXPORT_FIELDS = (
+    'id', 'name', 'company', 'category', 'shortDescription', 'longDescription', 'pricing',
+    'apiAccess', 'officialWebsite', 'documentation', 'releaseDate', 'lastUpdated', 'version',
+    'userCount', 'coreFeatures', 'tags', 'integrations', 'supportedPlatforms', 'license',
+)
+
+
+def render_value(value: Any) -> str:
+    """A field value as one line of text: lists joined with ', ', objects by name"""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, list):
+        return ', '.join(part for part in (render_value(item) for item in value) if part)
+    if isinstance(value, dict):
+        label = value.get('name') or value.get('title')
+        return render_value(label) if label is not None else ''
+    return ' '.join(str(value).split())
+
+
+def write_txt(f: IO, rows: Iterable[Dict[str, Any]], total: int) -> int:
+    """The human-readable ai-tools-list.txt layout"""
+    count = 0
+    for count, row in enumerate(rows, 1):
+        header = f"Tool {count}/{total}: {render_value(row.get('name')) or 'Unknown'}"
+        f.write(f"{header}\n{'-' * len(header)}\n")
+        for field in EXPORT_FIELDS:
+            f.write(f"{field}: {render_value(row.get(field))}\n")
+        f.write('\n')
+    return count
+
+
+def write_tsv(f: IO, rows: Iterable[Dict[str, Any]], total: int) -> int:
+    """One header line, then one tab-separated line per tool"""
+    f.write('\t'.join(EXPORT_FIELDS) + '\n')
+    count = 0
+    for count, row in enumerate(rows, 1):
+        # render_value() folds whitespace, so values never contain tabs or newlines
+        f.write('\t'.join(render_value(row.get(field)) for field in EXPORT_FIELDS) + '\n')
+    return count
+
+
+def write_jsonl(f: IO, rows: Iterable[Dict[str, Any]], total: int) -> int:
+    """One JSON object per tool, keeping list and object values as they are"""
+    count = 0
+    for count, row in enumerate(rows, 1):
+        record = {field: row[field] for field in EXPORT_FIELDS if field in row}
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    return count
+
+
+FORMATS: Dict[str, Callable[[IO, Iterable[Dict[str, Any]], int], int]] = {
+    'txt': write_txt,
+    'tsv': write_tsv,
+    'jsonl': write_jsonl,
+}
+
+
+def export_hash(fields: Dict[str, Any]) -> str:
+    """SHA-256 of the EXPORT_FIELDS of a tool, i.e. of what an export row shows"""
+    payload = json.dumps({field: fields.get(field) for field in EXPORT_FIELDS},
+                         sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def load_export_state(state_file: Path) -> Dict[str, str]:
+    """tool id -> export_hash as of the last export"""
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _rows(entries: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for entry in entries:
+        yield entry['fields']
+
+
+def export_tools(entries: List[Dict[str, Any]], out_path: Path, fmt: str = 'txt',
+                 state_file: Optional[Path] = None) -> int:
+    """
+    Write ToolIndex entries to out_path in fmt; returns the number written.
+
+    With state_file, only entries whose export_hash differs from the last
+    export recorded there are written, and the state is updated afterwards.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r} (expected one of {', '.join(FORMATS)})")
+
+    state = load_export_state(state_file) if state_file else {}
+    if state_file:
+        hashed = [(entry, export_hash(entry['fields'])) for entry in entries]
+        changed = [(entry, digest) for entry, digest in hashed if state.get(entry['id']) != digest]
+        entries = [entry for entry, _ in changed]
+
+    with atomic_open(out_path) as f:
+        count = FORMATS[fmt](f, _rows(entries), len(entries))
+
+    if state_file:
+        state.update({entry['id']: digest for entry, digest in changed if entry['id']})
+        atomic_write_json(state_file, state, indent=2, sort_keys=True)
+    return count
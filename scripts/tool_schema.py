@@ -0,0 +1,837 @@
+#!/usr/bin/env python3
+"""
+Tool Records and Validator
+
+GENERATED by tool_schema_gen.py from src/types/aiTools.ts; do not edit.
+Rerun `python tool_schema_gen.py` after changing the TypeScript types.
+
+Usage:
+    errors = validate(tool)                  # [] when tool is a valid AITool
+    errors = validate(update, partial=True)  # don't require missing fields
+    record = AITool.from_dict(tool)
+"""
+
+from typing import Any, Dict, List
+
+
+def _type_name(value: Any) -> str:
+    return 'missing' if value is _MISSING else type(value).__name__
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _record(cls):
+    return lambda value: cls.from_dict(value) if isinstance(value, dict) else value
+
+
+def _list_of(convert):
+    return lambda value: [convert(item) for item in value] if isinstance(value, list) else value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, _Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+_MISSING = object()
+
+
+class _Record:
+    """Fixed-field record; unset optional fields are None and left out of to_dict()"""
+
+    __slots__ = ()
+    REQUIRED: tuple = ()
+    _converters: Dict[str, Any] = {}
+
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"{type(self).__name__} has no field(s) {', '.join(sorted(fields))}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_Record':
+        """Record from a plain dict; unknown keys are dropped"""
+        converters = cls._converters
+        return cls(**{
+            name: converters[name](data[name]) if name in converters else data[name]
+            for name in cls.__slots__ if name in data
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in interface field order"""
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = _plain(value)
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__
+                           if getattr(self, name) is not None)
+        return f'{type(self).__name__}({fields})'
+
+
+AI_CAPABILITY_LEVEL = frozenset({'Basic', 'Advanced', 'Expert'})
+AI_CATEGORY = frozenset({'Large Language Models', 'Code Generation', 'Design & Creative Tools', 'Design Tools', 'Writing Assistants', 'AI Platforms & Services', 'Agent Frameworks', 'Developer Tools', 'Video Generation', 'Voice & Audio', 'Specialized Tools', 'Image Generation', 'Data Analysis', 'Automation Tools', 'Chatbots & Conversational AI', 'Research Tools', 'Business Intelligence'})
+AI_INTEGRATION_TYPE = frozenset({'API', 'Plugin', 'Native', 'Webhook'})
+AI_TOOL_STATUS = frozenset({'Active', 'Beta', 'Preview', 'Deprecated', 'Coming Soon'})
+AI_USE_CASE_COMPLEXITY = frozenset({'Beginner', 'Intermediate', 'Advanced', 'Expert'})
+RESOURCE_DIFFICULTY = frozenset({'Beginner', 'Intermediate', 'Advanced'})
+RESOURCE_TYPE = frozenset({'Article', 'Video', 'Course', 'Book', 'Documentation', 'Tutorial', 'Blog', 'Paper'})
+
+
+class AITool(_Record):
+    """AITool from aiTools.ts"""
+
+    __slots__ = ('id', 'name', 'company', 'category', 'subCategory', 'description', 'longDescription', 'coreFeatures', 'uniqueSellingPoints', 'features', 'modelType', 'contextWindow', 'languages', 'platforms', 'pricing', 'apiAccess', 'freeTrialAvailable', 'pricingDetails', 'capabilities', 'useCases', 'limitations', 'performance', 'integrations', 'sdks', 'installation', 'officialWebsite', 'documentation', 'apiDocs', 'githubRepo', 'communityForum', 'communityResources', 'tutorials', 'releaseDate', 'lastUpdated', 'version', 'popularity', 'status', 'userCount', 'tags')
+    REQUIRED = ('id', 'name', 'company', 'category', 'description', 'longDescription', 'coreFeatures', 'uniqueSellingPoints', 'features', 'pricing', 'apiAccess', 'freeTrialAvailable', 'capabilities', 'useCases', 'integrations', 'installation', 'officialWebsite', 'releaseDate', 'lastUpdated', 'popularity', 'status', 'userCount', 'tags')
+
+
+class AIFeature(_Record):
+    """AIFeature from aiTools.ts"""
+
+    __slots__ = ('name', 'description', 'available')
+    REQUIRED = ('name', 'description', 'available')
+
+
+class AICapability(_Record):
+    """AICapability from aiTools.ts"""
+
+    __slots__ = ('name', 'description', 'level')
+    REQUIRED = ('name', 'description')
+
+
+class AIUseCase(_Record):
+    """AIUseCase from aiTools.ts"""
+
+    __slots__ = ('title', 'description', 'industry', 'scenario', 'benefits', 'example', 'examples', 'complexity')
+    REQUIRED = ('title', 'description')
+
+
+class PerformanceMetrics(_Record):
+    """PerformanceMetrics from aiTools.ts"""
+
+    __slots__ = ('accuracy', 'speed', 'reliability', 'latency', 'uptime', 'benchmark')
+    REQUIRED = ('accuracy', 'speed', 'reliability')
+
+
+class AIIntegration(_Record):
+    """AIIntegration from aiTools.ts"""
+
+    __slots__ = ('name', 'description', 'type', 'available')
+    REQUIRED = ('name', 'description')
+
+
+class Installation(_Record):
+    """Installation from aiTools.ts"""
+
+    __slots__ = ('requirements', 'steps')
+    REQUIRED = ('steps',)
+
+
+class InstallationStep(_Record):
+    """InstallationStep from aiTools.ts"""
+
+    __slots__ = ('title', 'description', 'code')
+    REQUIRED = ('title', 'description')
+
+
+class Resource(_Record):
+    """Resource from aiTools.ts"""
+
+    __slots__ = ('title', 'url', 'type', 'author', 'description', 'difficulty')
+    REQUIRED = ('title', 'url', 'type')
+
+
+class PopularityMetrics(_Record):
+    """PopularityMetrics from aiTools.ts"""
+
+    __slots__ = ('githubStars', 'userCount', 'monthlyActiveUsers', 'communitySize', 'trendingScore', 'marketShare', 'weeklyDownloads')
+    REQUIRED = ('trendingScore',)
+
+
+AITool._converters = {'features': _list_of(_record(AIFeature)), 'capabilities': _list_of(_record(AICapability)), 'useCases': _list_of(_record(AIUseCase)), 'performance': _record(PerformanceMetrics), 'integrations': _list_of(_record(AIIntegration)), 'installation': _record(Installation), 'communityResources': _list_of(_record(Resource)), 'tutorials': _list_of(_record(Resource)), 'popularity': _record(PopularityMetrics)}
+AIFeature._converters = {}
+AICapability._converters = {}
+AIUseCase._converters = {}
+PerformanceMetrics._converters = {}
+AIIntegration._converters = {}
+Installation._converters = {'steps': _list_of(_record(InstallationStep))}
+InstallationStep._converters = {}
+Resource._converters = {}
+PopularityMetrics._converters = {}
+
+
+_AITOOL_FIELDS = frozenset({'id', 'name', 'company', 'category', 'subCategory', 'description', 'longDescription', 'coreFeatures', 'uniqueSellingPoints', 'features', 'modelType', 'contextWindow', 'languages', 'platforms', 'pricing', 'apiAccess', 'freeTrialAvailable', 'pricingDetails', 'capabilities', 'useCases', 'limitations', 'performance', 'integrations', 'sdks', 'installation', 'officialWebsite', 'documentation', 'apiDocs', 'githubRepo', 'communityForum', 'communityResources', 'tutorials', 'releaseDate', 'lastUpdated', 'version', 'popularity', 'status', 'userCount', 'tags'})
+
+
+def _check_AITool(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected AITool, got {type(data).__name__}")
+        return
+    value = data.get('id', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.id: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.id: expected string, got {_type_name(value)}")
+    value = data.get('name', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.name: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.name: expected string, got {_type_name(value)}")
+    value = data.get('company', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.company: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.company: expected string, got {_type_name(value)}")
+    value = data.get('category', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.category: required")
+    else:
+        if not isinstance(value, str) or value not in AI_CATEGORY:
+            errors.append(f"{path}.category: {value!r} is not one of AI_CATEGORY")
+    value = data.get('subCategory', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.subCategory: expected string, got {_type_name(value)}")
+    value = data.get('description', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.description: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.description: expected string, got {_type_name(value)}")
+    value = data.get('longDescription', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.longDescription: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.longDescription: expected string, got {_type_name(value)}")
+    value = data.get('coreFeatures', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.coreFeatures: required")
+    else:
+        if not isinstance(value, list):
+            errors.append(f"{path}.coreFeatures: expected list of string, got {_type_name(value)}")
+        else:
+            for i1, item2 in enumerate(value):
+                if not isinstance(item2, str):
+                    errors.append(f"{path}.coreFeatures[{i1}]: expected string, got {_type_name(item2)}")
+    value = data.get('uniqueSellingPoints', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.uniqueSellingPoints: required")
+    else:
+        if not isinstance(value, list):
+            errors.append(f"{path}.uniqueSellingPoints: expected list of string, got {_type_name(value)}")
+        else:
+            for i3, item4 in enumerate(value):
+                if not isinstance(item4, str):
+                    errors.append(f"{path}.uniqueSellingPoints[{i3}]: expected string, got {_type_name(item4)}")
+    value = data.get('features', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.features: required")
+    else:
+        if not isinstance(value, list):
+            errors.append(f"{path}.features: expected list of AIFeature, got {_type_name(value)}")
+        else:
+            for i5, item6 in enumerate(value):
+                _check_AIFeature(item6, f"{path}.features[{i5}]", errors)
+    value = data.get('modelType', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.modelType: expected string, got {_type_name(value)}")
+    value = data.get('contextWindow', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.contextWindow: expected string, got {_type_name(value)}")
+    value = data.get('languages', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.languages: expected list of string, got {_type_name(value)}")
+        else:
+            for i7, item8 in enumerate(value):
+                if not isinstance(item8, str):
+                    errors.append(f"{path}.languages[{i7}]: expected string, got {_type_name(item8)}")
+    value = data.get('platforms', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.platforms: expected list of string, got {_type_name(value)}")
+        else:
+            for i9, item10 in enumerate(value):
+                if not isinstance(item10, str):
+                    errors.append(f"{path}.platforms[{i9}]: expected string, got {_type_name(item10)}")
+    value = data.get('pricing', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.pricing: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.pricing: expected string, got {_type_name(value)}")
+    value = data.get('apiAccess', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.apiAccess: required")
+    else:
+        if not isinstance(value, bool):
+            errors.append(f"{path}.apiAccess: expected boolean, got {_type_name(value)}")
+    value = data.get('freeTrialAvailable', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.freeTrialAvailable: required")
+    else:
+        if not isinstance(value, bool):
+            errors.append(f"{path}.freeTrialAvailable: expected boolean, got {_type_name(value)}")
+    value = data.get('pricingDetails', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, dict):
+            errors.append(f"{path}.pricingDetails: expected object of string, got {_type_name(value)}")
+        else:
+            for key11, item12 in value.items():
+                if not isinstance(item12, str):
+                    errors.append(f"{path}.pricingDetails.{key11}: expected string, got {_type_name(item12)}")
+    value = data.get('capabilities', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.capabilities: required")
+    else:
+        if not isinstance(value, list):
+            errors.append(f"{path}.capabilities: expected list of AICapability, got {_type_name(value)}")
+        else:
+            for i13, item14 in enumerate(value):
+                _check_AICapability(item14, f"{path}.capabilities[{i13}]", errors)
+    value = data.get('useCases', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.useCases: required")
+    else:
+        if not isinstance(value, list):
+            errors.append(f"{path}.useCases: expected list of AIUseCase, got {_type_name(value)}")
+        else:
+            for i15, item16 in enumerate(value):
+                _check_AIUseCase(item16, f"{path}.useCases[{i15}]", errors)
+    value = data.get('limitations', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.limitations: expected list of string, got {_type_name(value)}")
+        else:
+            for i17, item18 in enumerate(value):
+                if not isinstance(item18, str):
+                    errors.append(f"{path}.limitations[{i17}]: expected string, got {_type_name(item18)}")
+    value = data.get('performance', _MISSING)
+    if value is not _MISSING and value is not None:
+        _check_PerformanceMetrics(value, f"{path}.performance", errors)
+    value = data.get('integrations', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.integrations: required")
+    else:
+        if not isinstance(value, list):
+            errors.append(f"{path}.integrations: expected list of AIIntegration, got {_type_name(value)}")
+        else:
+            for i19, item20 in enumerate(value):
+                _check_AIIntegration(item20, f"{path}.integrations[{i19}]", errors)
+    value = data.get('sdks', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.sdks: expected list of string, got {_type_name(value)}")
+        else:
+            for i21, item22 in enumerate(value):
+                if not isinstance(item22, str):
+                    errors.append(f"{path}.sdks[{i21}]: expected string, got {_type_name(item22)}")
+    value = data.get('installation', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.installation: required")
+    else:
+        _check_Installation(value, f"{path}.installation", errors)
+    value = data.get('officialWebsite', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.officialWebsite: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.officialWebsite: expected string, got {_type_name(value)}")
+    value = data.get('documentation', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.documentation: expected string, got {_type_name(value)}")
+    value = data.get('apiDocs', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.apiDocs: expected string, got {_type_name(value)}")
+    value = data.get('githubRepo', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.githubRepo: expected string, got {_type_name(value)}")
+    value = data.get('communityForum', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.communityForum: expected string, got {_type_name(value)}")
+    value = data.get('communityResources', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.communityResources: expected list of Resource, got {_type_name(value)}")
+        else:
+            for i23, item24 in enumerate(value):
+                _check_Resource(item24, f"{path}.communityResources[{i23}]", errors)
+    value = data.get('tutorials', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.tutorials: expected list of Resource, got {_type_name(value)}")
+        else:
+            for i25, item26 in enumerate(value):
+                _check_Resource(item26, f"{path}.tutorials[{i25}]", errors)
+    value = data.get('releaseDate', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.releaseDate: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.releaseDate: expected string, got {_type_name(value)}")
+    value = data.get('lastUpdated', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.lastUpdated: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.lastUpdated: expected string, got {_type_name(value)}")
+    value = data.get('version', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.version: expected string, got {_type_name(value)}")
+    value = data.get('popularity', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.popularity: required")
+    else:
+        _check_PopularityMetrics(value, f"{path}.popularity", errors)
+    value = data.get('status', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.status: required")
+    else:
+        if not isinstance(value, str) or value not in AI_TOOL_STATUS:
+            errors.append(f"{path}.status: {value!r} is not one of AI_TOOL_STATUS")
+    value = data.get('userCount', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.userCount: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.userCount: expected string, got {_type_name(value)}")
+    value = data.get('tags', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.tags: required")
+    else:
+        if not isinstance(value, list):
+            errors.append(f"{path}.tags: expected list of string, got {_type_name(value)}")
+        else:
+            for i27, item28 in enumerate(value):
+                if not isinstance(item28, str):
+                    errors.append(f"{path}.tags[{i27}]: expected string, got {_type_name(item28)}")
+    for key in data:
+        if key not in _AITOOL_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_AIFEATURE_FIELDS = frozenset({'name', 'description', 'available'})
+
+
+def _check_AIFeature(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected AIFeature, got {type(data).__name__}")
+        return
+    value = data.get('name', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.name: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.name: expected string, got {_type_name(value)}")
+    value = data.get('description', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.description: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.description: expected string, got {_type_name(value)}")
+    value = data.get('available', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.available: required")
+    else:
+        if not isinstance(value, bool):
+            errors.append(f"{path}.available: expected boolean, got {_type_name(value)}")
+    for key in data:
+        if key not in _AIFEATURE_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_AICAPABILITY_FIELDS = frozenset({'name', 'description', 'level'})
+
+
+def _check_AICapability(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected AICapability, got {type(data).__name__}")
+        return
+    value = data.get('name', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.name: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.name: expected string, got {_type_name(value)}")
+    value = data.get('description', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.description: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.description: expected string, got {_type_name(value)}")
+    value = data.get('level', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str) or value not in AI_CAPABILITY_LEVEL:
+            errors.append(f"{path}.level: {value!r} is not one of AI_CAPABILITY_LEVEL")
+    for key in data:
+        if key not in _AICAPABILITY_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_AIUSECASE_FIELDS = frozenset({'title', 'description', 'industry', 'scenario', 'benefits', 'example', 'examples', 'complexity'})
+
+
+def _check_AIUseCase(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected AIUseCase, got {type(data).__name__}")
+        return
+    value = data.get('title', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.title: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.title: expected string, got {_type_name(value)}")
+    value = data.get('description', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.description: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.description: expected string, got {_type_name(value)}")
+    value = data.get('industry', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.industry: expected string, got {_type_name(value)}")
+    value = data.get('scenario', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.scenario: expected string, got {_type_name(value)}")
+    value = data.get('benefits', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.benefits: expected list of string, got {_type_name(value)}")
+        else:
+            for i1, item2 in enumerate(value):
+                if not isinstance(item2, str):
+                    errors.append(f"{path}.benefits[{i1}]: expected string, got {_type_name(item2)}")
+    value = data.get('example', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.example: expected string, got {_type_name(value)}")
+    value = data.get('examples', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.examples: expected list of string, got {_type_name(value)}")
+        else:
+            for i3, item4 in enumerate(value):
+                if not isinstance(item4, str):
+                    errors.append(f"{path}.examples[{i3}]: expected string, got {_type_name(item4)}")
+    value = data.get('complexity', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str) or value not in AI_USE_CASE_COMPLEXITY:
+            errors.append(f"{path}.complexity: {value!r} is not one of AI_USE_CASE_COMPLEXITY")
+    for key in data:
+        if key not in _AIUSECASE_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_PERFORMANCEMETRICS_FIELDS = frozenset({'accuracy', 'speed', 'reliability', 'latency', 'uptime', 'benchmark'})
+
+
+def _check_PerformanceMetrics(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected PerformanceMetrics, got {type(data).__name__}")
+        return
+    value = data.get('accuracy', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.accuracy: required")
+    else:
+        if not _is_number(value):
+            errors.append(f"{path}.accuracy: expected number, got {_type_name(value)}")
+    value = data.get('speed', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.speed: required")
+    else:
+        if not _is_number(value):
+            errors.append(f"{path}.speed: expected number, got {_type_name(value)}")
+    value = data.get('reliability', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.reliability: required")
+    else:
+        if not _is_number(value):
+            errors.append(f"{path}.reliability: expected number, got {_type_name(value)}")
+    value = data.get('latency', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.latency: expected string, got {_type_name(value)}")
+    value = data.get('uptime', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.uptime: expected string, got {_type_name(value)}")
+    value = data.get('benchmark', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.benchmark: expected string, got {_type_name(value)}")
+    for key in data:
+        if key not in _PERFORMANCEMETRICS_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_AIINTEGRATION_FIELDS = frozenset({'name', 'description', 'type', 'available'})
+
+
+def _check_AIIntegration(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected AIIntegration, got {type(data).__name__}")
+        return
+    value = data.get('name', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.name: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.name: expected string, got {_type_name(value)}")
+    value = data.get('description', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.description: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.description: expected string, got {_type_name(value)}")
+    value = data.get('type', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str) or value not in AI_INTEGRATION_TYPE:
+            errors.append(f"{path}.type: {value!r} is not one of AI_INTEGRATION_TYPE")
+    value = data.get('available', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, bool):
+            errors.append(f"{path}.available: expected boolean, got {_type_name(value)}")
+    for key in data:
+        if key not in _AIINTEGRATION_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_INSTALLATION_FIELDS = frozenset({'requirements', 'steps'})
+
+
+def _check_Installation(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected Installation, got {type(data).__name__}")
+        return
+    value = data.get('requirements', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, list):
+            errors.append(f"{path}.requirements: expected list of string, got {_type_name(value)}")
+        else:
+            for i1, item2 in enumerate(value):
+                if not isinstance(item2, str):
+                    errors.append(f"{path}.requirements[{i1}]: expected string, got {_type_name(item2)}")
+    value = data.get('steps', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.steps: required")
+    else:
+        trial3 = []
+        if not isinstance(value, list):
+            trial3.append(f"{path}.steps: expected list of string, got {_type_name(value)}")
+        else:
+            for i4, item5 in enumerate(value):
+                if not isinstance(item5, str):
+                    trial3.append(f"{path}.steps[{i4}]: expected string, got {_type_name(item5)}")
+        if trial3:
+            trial6 = []
+            if not isinstance(value, list):
+                trial6.append(f"{path}.steps: expected list of InstallationStep, got {_type_name(value)}")
+            else:
+                for i7, item8 in enumerate(value):
+                    _check_InstallationStep(item8, f"{path}.steps[{i7}]", trial6)
+            if trial6:
+                errors.append(f"{path}.steps: expected list of string or list of InstallationStep")
+    for key in data:
+        if key not in _INSTALLATION_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_INSTALLATIONSTEP_FIELDS = frozenset({'title', 'description', 'code'})
+
+
+def _check_InstallationStep(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected InstallationStep, got {type(data).__name__}")
+        return
+    value = data.get('title', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.title: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.title: expected string, got {_type_name(value)}")
+    value = data.get('description', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.description: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.description: expected string, got {_type_name(value)}")
+    value = data.get('code', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.code: expected string, got {_type_name(value)}")
+    for key in data:
+        if key not in _INSTALLATIONSTEP_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_RESOURCE_FIELDS = frozenset({'title', 'url', 'type', 'author', 'description', 'difficulty'})
+
+
+def _check_Resource(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected Resource, got {type(data).__name__}")
+        return
+    value = data.get('title', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.title: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.title: expected string, got {_type_name(value)}")
+    value = data.get('url', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.url: required")
+    else:
+        if not isinstance(value, str):
+            errors.append(f"{path}.url: expected string, got {_type_name(value)}")
+    value = data.get('type', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.type: required")
+    else:
+        if not isinstance(value, str) or value not in RESOURCE_TYPE:
+            errors.append(f"{path}.type: {value!r} is not one of RESOURCE_TYPE")
+    value = data.get('author', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.author: expected string, got {_type_name(value)}")
+    value = data.get('description', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str):
+            errors.append(f"{path}.description: expected string, got {_type_name(value)}")
+    value = data.get('difficulty', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not isinstance(value, str) or value not in RESOURCE_DIFFICULTY:
+            errors.append(f"{path}.difficulty: {value!r} is not one of RESOURCE_DIFFICULTY")
+    for key in data:
+        if key not in _RESOURCE_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+_POPULARITYMETRICS_FIELDS = frozenset({'githubStars', 'userCount', 'monthlyActiveUsers', 'communitySize', 'trendingScore', 'marketShare', 'weeklyDownloads'})
+
+
+def _check_PopularityMetrics(data: Any, path: str, errors: List[str], partial: bool = False):
+    if not isinstance(data, dict):
+        errors.append(f"{path}: expected PopularityMetrics, got {type(data).__name__}")
+        return
+    value = data.get('githubStars', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not _is_number(value):
+            errors.append(f"{path}.githubStars: expected number, got {_type_name(value)}")
+    value = data.get('userCount', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not _is_number(value):
+            errors.append(f"{path}.userCount: expected number, got {_type_name(value)}")
+    value = data.get('monthlyActiveUsers', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not _is_number(value):
+            errors.append(f"{path}.monthlyActiveUsers: expected number, got {_type_name(value)}")
+    value = data.get('communitySize', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not _is_number(value):
+            errors.append(f"{path}.communitySize: expected number, got {_type_name(value)}")
+    value = data.get('trendingScore', _MISSING)
+    if value is _MISSING:
+        if not partial:
+            errors.append(f"{path}.trendingScore: required")
+    else:
+        if not _is_number(value):
+            errors.append(f"{path}.trendingScore: expected number, got {_type_name(value)}")
+    value = data.get('marketShare', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not _is_number(value):
+            errors.append(f"{path}.marketShare: expected number, got {_type_name(value)}")
+    value = data.get('weeklyDownloads', _MISSING)
+    if value is not _MISSING and value is not None:
+        if not _is_number(value):
+            errors.append(f"{path}.weeklyDownloads: expected number, got {_type_name(value)}")
+    for key in data:
+        if key not in _POPULARITYMETRICS_FIELDS:
+            errors.append(f"{path}.{key}: unknown field")
+
+
+VALIDATORS = {'AITool': _check_AITool, 'AIFeature': _check_AIFeature, 'AICapability': _check_AICapability, 'AIUseCase': _check_AIUseCase, 'PerformanceMetrics': _check_PerformanceMetrics, 'AIIntegration': _check_AIIntegration, 'Installation': _check_Installation, 'InstallationStep': _check_InstallationStep, 'Resource': _check_Resource, 'PopularityMetrics': _check_PopularityMetrics}
+
+
+def validate(data: Any, interface: str = 'AITool', partial: bool = False) -> List[str]:
+    """
+    Every problem with data as an instance of interface, in one pass.
+
+    partial=True skips the required-field check at the top level, for
+    updates that only carry some fields.
+    """
+    errors: List[str] = []
+    VALIDATORS[interface](data, interface, errors, partial)
+    return errors
+
+
+def is_valid(data: Any, interface: str = 'AITool') -> bool:
+    """True if validate() finds nothing"""
+    return not validate(data, interface)
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Tool Schema Generator
+
+Reads the AITool interface (and everything it references) from
+src/types/aiTools.ts and writes tool_schema.py, which contains:
+
+- one compact record class per interface, with __slots__ instead of a
+  per-instance dict, plus from_dict() / to_dict()
+- the string-literal unions as frozensets (AI_CATEGORY, AI_TOOL_STATUS,
+  and inline ones such as AI_CAPABILITY_LEVEL)
+- a validator compiled to straight-line checks per interface, which walks
+  a record once and returns every problem it finds (missing required
+  fields, wrong types, values outside an enum, unknown fields)
+
+Run it again whenever aiTools.ts changes; --check fails if tool_schema.py
+is out of date, and --validate checks a catalog against it.
+
+Usage:
+    python tool_schema_gen.py
+    python tool_schema_gen.py --check
+    python tool_schema_gen.py --validate ../src/data/aiToolsData.ts
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TYPES_FILE = PROJECT_ROOT / 'src' / 'types' / 'aiTools.ts'
+OUTPUT_FILE = Path(__file__).parent / 'tool_schema.py'
+ROOT_INTERFACE = 'AITool'
+
+_INTERFACE_RE = re.compile(r'export interface (\w+)\s*\{(.*?)\n\}', re.S)
+_ALIAS_RE = re.compile(r"export type (\w+)\s*=\s*((?:\s*\|?\s*'[^']*')+)")
+_FIELD_RE = re.compile(r'^\s*(\w+)(\?)?\s*:\s*(.+?)\s*$')
+_LITERAL_RE = re.compile(r"'([^']*)'")
+
+PRIMITIVES = {'string': 'str', 'number': 'number', 'boolean': 'bool', 'any': 'any'}
+
+# A parsed type: ('str',), ('number',), ('bool',), ('any',), ('list', T), ('dict', T),
+# ('enum', CONSTANT_NAME), ('ref', InterfaceName) or ('union', (T, ...))
+TypeSpec = Tuple
+
+
+def constant_name(name: str) -> str:
+    """AIToolStatus -> AI_TOOL_STATUS"""
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', '_', name).upper()
+
+
+def _split_top_level(text: str, separator: str) -> List[str]:
+    parts, depth, current = [], 0, ''
+    for ch in text:
+        if ch in '<([{':
+            depth += 1
+        elif ch in '>)]}':
+            depth -= 1
+        if ch == separator and depth == 0:
+            parts.append(current.strip())
+            current = ''
+        else:
+            current += ch
+    parts.append(current.strip())
+    return [part for part in parts if part]
+
+
+class SchemaParser:
+    """Interfaces and literal unions of a TypeScript types file"""
+
+    def __init__(self, source: str):
+        self.aliases: Dict[str, List[str]] = {}
+        for name, body in _ALIAS_RE.findall(source):
+            self.aliases[name] = _LITERAL_RE.findall(body)
+        self.enums: Dict[str, List[str]] = {constant_name(name): values for name, values in self.aliases.items()}
+        self.raw_interfaces = {name: body for name, body in _INTERFACE_RE.findall(source)}
+        self.interfaces: Dict[str, List[Tuple[str, bool, TypeSpec]]] = {}
+
+    def parse_type(self, text: str, owner: str, field: str) -> TypeSpec:
+        alternatives = _split_top_level(text, '|')
+        if len(alternatives) > 1:
+            if all(_LITERAL_RE.fullmatch(alt) for alt in alternatives):
+                name = constant_name(owner) + '_' + constant_name(field[0].upper() + field[1:])
+                self.enums[name] = [_LITERAL_RE.fullmatch(alt).group(1) for alt in alternatives]
+                return ('enum', name)
+            return ('union', tuple(self.parse_type(alt, owner, field) for alt in alternatives))
+
+        text = alternatives[0]
+        if text.endswith('[]'):
+            return ('list', self.parse_type(text[:-2], owner, field))
+        record = re.fullmatch(r'Record<\s*string\s*,\s*(.+)>', text)
+        if record:
+            return ('dict', self.parse_type(record.group(1), owner, field))
+        if text in PRIMITIVES:
+            return (PRIMITIVES[text],)
+        if text in self.aliases:
+            return ('enum', constant_name(text))
+        if text in self.raw_interfaces:
+            self.parse_interface(text)
+            return ('ref', text)
+        raise ValueError(f"Unsupported type {text!r} for {owner}.{field}")
+
+    def parse_interface(self, name: str):
+        if name in self.interfaces:
+            return
+        self.interfaces[name] = []  # Placeholder so recursive references terminate
+        fields = []
+        for line in self.raw_interfaces[name].splitlines():
+            line = line.split('//', 1)[0]
+            match = _FIELD_RE.match(line)
+            if match:
+                field, optional, type_text = match.groups()
+                fields.append((field, not optional, self.parse_type(type_text, name, field)))
+        self.interfaces[name] = fields
+
+
+def describe(spec: TypeSpec) -> str:
+    """Human-readable type for error messages"""
+    kind = spec[0]
+    if kind == 'list':
+        return f'list of {describe(spec[1])}'
+    if kind == 'dict':
+        return f'object of {describe(spec[1])}'
+    if kind == 'enum':
+        return f'one of {spec[1]}'
+    if kind == 'ref':
+        return spec[1]
+    if kind == 'union':
+        return ' or '.join(describe(alt) for alt in spec[1])
+    return {'str': 'string', 'number': 'number', 'bool': 'boolean', 'any': 'any value'}[kind]
+
+
+class ValidatorEmitter:
+    """Straight-line Python that checks one value against a TypeSpec"""
+
+    def __init__(self):
+        self.counter = 0
+
+    def _var(self, prefix: str) -> str:
+        self.counter += 1
+        return f'{prefix}{self.counter}'
+
+    def emit(self, spec: TypeSpec, value: str, path: str, errors: str, indent: str) -> List[str]:
+        """Lines appending to `errors` if `value` doesn't match spec; path is an f-string body"""
+        kind = spec[0]
+        fail = f'{indent}    {errors}.append(f"{path}: expected {describe(spec)}, got {{_type_name({value})}}")'
+        if kind == 'any':
+            return []
+        if kind == 'str':
+            return [f'{indent}if not isinstance({value}, str):', fail]
+        if kind == 'bool':
+            return [f'{indent}if not isinstance({value}, bool):', fail]
+        if kind == 'number':
+            return [f'{indent}if not _is_number({value}):', fail]
+        if kind == 'enum':
+            return [
+                f'{indent}if not isinstance({value}, str) or {value} not in {spec[1]}:',
+                f'{indent}    {errors}.append(f"{path}: {{{value}!r}} is not one of {spec[1]}")',
+            ]
+        if kind == 'ref':
+            return [f'{indent}_check_{spec[1]}({value}, f"{path}", {errors})']
+        if kind == 'list':
+            index, item = self._var('i'), self._var('item')
+            return [
+                f'{indent}if not isinstance({value}, list):', fail,
+                f'{indent}else:',
+                f'{indent}    for {index}, {item} in enumerate({value}):',
+                *(self.emit(spec[1], item, f'{path}[{{{index}}}]', errors, indent + '        ')
+                  or [f'{indent}        pass']),
+            ]
+        if kind == 'dict':
+            key, item = self._var('key'), self._var('item')
+            return [
+                f'{indent}if not isinstance({value}, dict):', fail,
+                f'{indent}else:',
+                f'{indent}    for {key}, {item} in {value}.items():',
+                *(self.emit(spec[1], item, f'{path}.{{{key}}}', errors, indent + '        ')
+                  or [f'{indent}        pass']),
+            ]
+        # union: each alternative is tried only if the previous ones reported problems
+        lines = []
+        for alt in spec[1]:
+            trial = self._var('trial')
+            lines.append(f'{indent}{trial} = []')
+            lines.extend(self.emit(alt, value, path, trial, indent))
+            lines.append(f'{indent}if {trial}:')
+            indent += '    '
+        lines.append(f'{indent}{errors}.append(f"{path}: expected {describe(spec)}")')
+        return lines
+
+
+def _tuple(names) -> str:
+    items = [repr(name) for name in names]
+    if len(items) == 1:
+        return f'({items[0]},)'
+    return '(' + ', '.join(items) + ')'
+
+
+def _converter(spec: TypeSpec) -> Optional[str]:
+    """Expression turning a plain value into records, if spec contains any"""
+    kind = spec[0]
+    if kind == 'ref':
+        return f'_record({spec[1]})'
+    if kind == 'list':
+        inner = _converter(spec[1])
+        return f'_list_of({inner})' if inner else None
+    if kind == 'union':
+        refs = [alt for alt in spec[1] if _converter(alt)]
+        return _converter(refs[0]) if len(refs) == 1 else None
+    return None
+
+
+HEADER = '''#!/usr/bin/env python3
+"""
+Tool Records and Validator
+
+GENERATED by tool_schema_gen.py from src/types/aiTools.ts; do not edit.
+Rerun `python tool_schema_gen.py` after changing the TypeScript types.
+
+Usage:
+    errors = validate(tool)                  # [] when tool is a valid AITool
+    errors = validate(update, partial=True)  # don't require missing fields
+    record = AITool.from_dict(tool)
+"""
+
+from typing import Any, Dict, List
+
+
+def _type_name(value: Any) -> str:
+    return 'missing' if value is _MISSING else type(value).__name__
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _record(cls):
+    return lambda value: cls.from_dict(value) if isinstance(value, dict) else value
+
+
+def _list_of(convert):
+    return lambda value: [convert(item) for item in value] if isinstance(value, list) else value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, _Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+_MISSING = object()
+
+
+class _Record:
+    """Fixed-field record; unset optional fields are None and left out of to_dict()"""
+
+    __slots__ = ()
+    REQUIRED: tuple = ()
+    _converters: Dict[str, Any] = {}
+
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"{type(self).__name__} has no field(s) {', '.join(sorted(fields))}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_Record':
+        """Record from a plain dict; unknown keys are dropped"""
+        converters = cls._converters
+        return cls(**{
+            name: converters[name](data[name]) if name in converters else data[name]
+            for name in cls.__slots__ if name in data
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in interface field order"""
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = _plain(value)
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__
+                           if getattr(self, name) is not None)
+        return f'{type(self).__name__}({fields})'
+'''
+
+FOOTER = '''
+
+VALIDATORS = {names}
+
+
+def validate(data: Any, interface: str = '{root}', partial: bool = False) -> List[str]:
+    """
+    Every problem with data as an instance of interface, in one pass.
+
+    partial=True skips the required-field check at the top level, for
+    updates that only carry some fields.
+    """
+    errors: List[str] = []
+    VALIDATORS[interface](data, interface, errors, partial)
+    return errors
+
+
+def is_valid(data: Any, interface: str = '{root}') -> bool:
+    """True if validate() finds nothing"""
+    return not validate(data, interface)
+'''
+
+
+def generate(source: str, root: str = ROOT_INTERFACE) -> str:
+    """The text of tool_schema.py for the types in source"""
+    parser = SchemaParser(source)
+    parser.parse_interface(root)
+    emitter = ValidatorEmitter()
+    out = [HEADER]
+
+    out.append('')
+    for name, values in sorted(parser.enums.items()):
+        items = ', '.join(repr(value) for value in values)
+        out.append(f'{name} = frozenset({{{items}}})')
+
+    for name, fields in parser.interfaces.items():
+        out.append(f'\n\nclass {name}(_Record):')
+        out.append(f'    """{name} from aiTools.ts"""\n')
+        out.append(f'    __slots__ = {_tuple(field for field, _, _ in fields)}')
+        out.append(f'    REQUIRED = {_tuple(field for field, is_required, _ in fields if is_required)}')
+
+    # Converters reference classes, so they are attached once every class exists
+    out.append('\n')
+    for name, fields in parser.interfaces.items():
+        converters = [(field, _converter(spec)) for field, _, spec in fields]
+        converters = [(field, conv) for field, conv in converters if conv]
+        body = ', '.join(f'{field!r}: {conv}' for field, conv in converters)
+        out.append(f'{name}._converters = {{{body}}}')
+
+    for name, fields in parser.interfaces.items():
+        emitter.counter = 0
+        known = ', '.join(repr(field) for field, _, _ in fields)
+        lines = [
+            f'\n\n_{name.upper()}_FIELDS = frozenset({{{known}}})',
+            f'\n\ndef _check_{name}(data: Any, path: str, errors: List[str], partial: bool = False):',
+            '    if not isinstance(data, dict):',
+            f'        errors.append(f"{{path}}: expected {name}, got {{type(data).__name__}}")',
+            '        return',
+        ]
+        for field, is_required, spec in fields:
+            lines.append(f'    value = data.get({field!r}, _MISSING)')
+            if is_required:
+                lines.append('    if value is _MISSING:')
+                lines.append('        if not partial:')
+                lines.append(f'            errors.append(f"{{path}}.{field}: required")')
+                lines.append('    else:')
+            else:
+                lines.append('    if value is not _MISSING and value is not None:')
+            lines.extend(emitter.emit(spec, 'value', f'{{path}}.{field}', 'errors', '        '))
+        lines.append('    for key in data:')
+        lines.append(f'        if key not in _{name.upper()}_FIELDS:')
+        lines.append('            errors.append(f"{path}.{key}: unknown field")')
+        out.append('\n'.join(lines))
+
+    names = '{' + ', '.join(f'{name!r}: _check_{name}' for name in parser.interfaces) + '}'
+    out.append(FOOTER.format(names=names, root=root))
+    return '\n'.join(out)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line: regenerate, check freshness, or validate a catalog"""
+    parser = argparse.ArgumentParser(description="Generate tool_schema.py from src/types/aiTools.ts")
+    parser.add_argument('--check', action='store_true', help="Fail if tool_schema.py is out of date")
+    parser.add_argument('--validate', type=Path, metavar='CATALOG',
+                        help="Validate the tools in a catalog JSON or aiToolsData.ts")
+    args = parser.parse_args(argv)
+
+    if args.validate:
+        from search_index import load_catalog
+        from tool_schema import validate
+
+        tools, _ = load_catalog(args.validate)
+        started = time.perf_counter()
+        problems = {tool.get('id') or tool.get('name'): validate(tool) for tool in tools}
+        elapsed = time.perf_counter() - started
+        for ident, errors in problems.items():
+            for error in errors:
+                print(f"{ident}: {error}")
+        invalid = sum(1 for errors in problems.values() if errors)
+        print(f"{len(tools) - invalid}/{len(tools)} tools valid ({elapsed * 1000:.1f} ms)")
+        return 1 if invalid else 0
+
+    text = generate(TYPES_FILE.read_text(encoding='utf-8'))
+    if args.check:
+        current = OUTPUT_FILE.read_text(encoding='utf-8') if OUTPUT_FILE.exists() else ''
+        if current != text:
+            print(f"❌ {OUTPUT_FILE.name} is out of date; run python tool_schema_gen.py")
+            return 1
+        print(f"✅ {OUTPUT_FILE.name} is up to date")
+        return 0
+
+    from atomic_io import atomic_write_text
+    atomic_write_text(OUTPUT_FILE, text)
+    print(f"✅ Wrote {OUTPUT_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Per-Tool JSON Shards
+
+src/app/api/tools used to read and JSON.parse the whole
+aiToolsData_updated.json on every request. Alongside that file the updater
+now writes src/data/tools/:
+
+- <id>.json: one tool per file, so the route can serve ?id=... directly
+- manifest.json: id, name, category, lastUpdated and hash of every tool,
+  which is all the listing needs
+- .gz and .br variants of each of those, so the route can hand back the
+  precompressed bytes. Brotli needs the optional `brotli` package; without
+  it only .gz files are written.
+
+Shards whose content hash is unchanged since the last manifest are not
+rewritten, shards of tools that left the catalog are deleted along with any
+.gz/.br file whose .json is gone, and the manifest is written last, so it
+never lists a shard that isn't there yet.
+
+Usage:
+    write_shards(Path('src/data/tools'), tools, last_updated)
+
+    python tool_shards.py                     # rebuild from aiToolsData_updated.json
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from atomic_io import atomic_write_bytes
+
+try:
+    import brotli
+except ImportError:  # Optional: only .gz variants are written
+    brotli = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CATALOG = PROJECT_ROOT / 'src' / 'data' / 'aiToolsData_updated.json'
+DEFAULT_SHARD_DIR = PROJECT_ROOT / 'src' / 'data' / 'tools'
+MANIFEST_NAME = 'manifest.json'
+
+MANIFEST_FIELDS = ('id', 'name', 'category', 'lastUpdated')
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+
+# The ids the api/tools route accepts; anything else is slugified, so an id
+# can never name a file outside the shard directory
+ID_RE = re.compile(r'[a-z0-9-]+')
+
+
+def slugify(text: str) -> str:
+    """Lowercase letters, digits and single dashes"""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def tool_id(tool: Dict[str, Any]) -> str:
+    """
+    The tool's catalog id, or a slug of its name for records without one.
+
+    An id that doesn't match ID_RE is slugified rather than trusted; the
+    result may be empty, in which case the record has no usable id.
+    """
+    ident = tool.get('id')
+    if isinstance(ident, str) and ID_RE.fullmatch(ident):
+        return ident
+    return slugify(str(ident or tool.get('name') or ''))
+
+
+def _encode(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_variants(path: Path, data: bytes):
+    """path plus its precompressed variants, compressed ones first"""
+    # mtime=0 keeps the .gz bytes identical for identical input
+    atomic_write_bytes(path.with_name(path.name + '.gz'), gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        atomic_write_bytes(path.with_name(path.name + '.br'), brotli.compress(data))
+    else:
+        # A .br left by an earlier run with brotli would serve the old content
+        _unlink(path.with_name(path.name + '.br'))
+    atomic_write_bytes(path, data)
+
+
+def _unlink(path: Path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _remove_variants(path: Path):
+    for candidate in [path] + [path.with_name(path.name + suffix) for suffix in COMPRESSED_SUFFIXES]:
+        _unlink(candidate)
+
+
+def _prune_orphan_variants(shard_dir: Path) -> int:
+    """Delete .gz/.br files whose .json is gone (e.g. left by an interrupted removal)"""
+    pruned = 0
+    for suffix in COMPRESSED_SUFFIXES:
+        for variant in shard_dir.glob(f'*.json{suffix}'):
+            if not variant.with_name(variant.name[:-len(suffix)]).exists():
+                _unlink(variant)
+                pruned += 1
+    return pruned
+
+
+def read_manifest(shard_dir: Path) -> Optional[Dict[str, Any]]:
+    """The current manifest, or None if missing or unreadable"""
+    try:
+        with open(Path(shard_dir) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_shards(shard_dir: Path, tools: List[Dict[str, Any]],
+                 last_updated: str) -> Dict[str, int]:
+    """
+    Write per-tool shards and the manifest for tools.
+
+    Returns counts of written, unchanged and removed shards.
+    """
+    shard_dir = Path(shard_dir)
+    previous = read_manifest(shard_dir) or {}
+    previous_hashes = {entry['id']: entry.get('hash') for entry in previous.get('tools', [])}
+
+    entries = []
+    written = unchanged = 0
+    for tool in tools:
+        ident = tool_id(tool)
+        if not ident:
+            continue
+        data = _encode(tool)
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        shard_path = shard_dir / f'{ident}.json'
+        if previous_hashes.get(ident) == digest and shard_path.exists():
+            unchanged += 1
+        else:
+            _write_variants(shard_path, data)
+            written += 1
+        entry = {field: tool.get(field) for field in MANIFEST_FIELDS}
+        entry['id'] = ident
+        entry['hash'] = digest
+        entries.append(entry)
+
+    manifest = {
+        'lastUpdated': last_updated,
+        'totalTools': len(entries),
+        'tools': entries,
+    }
+    _write_variants(shard_dir / MANIFEST_NAME, _encode(manifest))
+
+    current = {entry['id'] for entry in entries}
+    removed = 0
+    for ident in previous_hashes:
+        if ident not in current:
+            _remove_variants(shard_dir / f'{ident}.json')
+            removed += 1
+    _prune_orphan_variants(shard_dir)
+
+    return {'written': written, 'unchanged': unchanged, 'removed': removed}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line: rebuild shards from an existing catalog file"""
+    parser = argparse.ArgumentParser(description="Write per-tool JSON shards for the api/tools route")
+    parser.add_argument('catalog', nargs='?', type=Path, default=DEFAULT_CATALOG,
+                        help="Catalog JSON with a 'tools' list (default: aiToolsData_updated.json)")
+    parser.add_argument('--out', type=Path, default=DEFAULT_SHARD_DIR, help="Shard directory")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.catalog, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read {args.catalog}: {e}")
+        return 1
+
+    counts = write_shards(args.out, catalog.get('tools', []), catalog.get('lastUpdated', ''))
+    print(f"✅ Shards in {args.out}: {counts['written']} written, "
+          f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+    if brotli is None:
+        print("ℹ️  brotli not installed; only .gz variants were written")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+TypeScript Data Parser
+
+Reads the object-literal subset of TypeScript used by src/data/aiToolsData.ts
+(strings, numbers, booleans, arrays, objects, comments, trailing commas) in a
+single linear pass, and builds an index of tool id -> (span, parsed fields).
+
+Spans are character offsets into the decoded file text, so
+text[start:end] is exactly the tool's object literal, braces included.
+
+The index is cached next to the data file (.aiToolsData.ts.index.json) and
+keyed on the file's mtime, size and SHA-256, so repeated runs skip parsing.
+
+Usage:
+    index = ToolIndex.load(Path('src/data/aiToolsData.ts'))
+    entry = index.get('gpt-4')
+    print(entry['start'], entry['end'], entry['fields']['name'])
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tool_shards import slugify
+
+INDEX_VERSION = 3
+
+# Bookkeeping fields left out of content hashes, so a refreshed timestamp
+# alone does not count as a change
+HASH_IGNORED_FIELDS = ('lastUpdated',)
+
+_WHITESPACE = ' \t\r\n\ufeff\u00a0\u2028\u2029'
+_IDENT_RE = re.compile(r'[A-Za-z_$][A-Za-z0-9_$]*')
+_NUMBER_RE = re.compile(r'-?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)')
+_KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+}
+
+
+class TSParseError(ValueError):
+    """Raised when the data file is not in the supported literal subset"""
+
+    def __init__(self, message: str, text: str, pos: int):
+        line = text.count('\n', 0, pos) + 1
+        column = pos - (text.rfind('\n', 0, pos) + 1) + 1
+        super().__init__(f"{message} at line {line}, column {column}")
+        self.pos = pos
+
+
+class _LiteralParser:
+    """Recursive-descent reader over a TypeScript object literal"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.length = len(text)
+
+    def skip_trivia(self, pos: int) -> int:
+        """Skip whitespace and comments, returning the next significant position"""
+        text = self.text
+        while pos < self.length:
+            char = text[pos]
+            if char in _WHITESPACE:
+                pos += 1
+            elif text.startswith('//', pos):
+                newline = text.find('\n', pos)
+                pos = self.length if newline == -1 else newline + 1
+            elif text.startswith('/*', pos):
+                close = text.find('*/', pos + 2)
+                if close == -1:
+                    raise TSParseError("Unterminated comment", text, pos)
+                pos = close + 2
+            else:
+                break
+        return pos
+
+    def parse_value(self, pos: int) -> Tuple[Any, int]:
+        """Parse any literal value starting at pos"""
+        pos = self.skip_trivia(pos)
+        if pos >= self.length:
+            raise TSParseError("Unexpected end of input", self.text, pos)
+
+        char = self.text[pos]
+        if char == '{':
+            return self.parse_object(pos)
+        if char == '[':
+            return self.parse_array(pos)
+        if char in '\'"`':
+            return self.parse_string(pos)
+
+        match = _NUMBER_RE.match(self.text, pos)
+        if match:
+            literal = match.group(0)
+            if literal.lstrip('-')[:2] in ('0x', '0X'):
+                return int(literal, 16), match.end()
+            if any(marker in literal for marker in '.eE'):
+                return float(literal), match.end()
+            return int(literal), match.end()
+
+        match = _IDENT_RE.match(self.text, pos)
+        if match and match.group(0) in _KEYWORDS:
+            return _KEYWORDS[match.group(0)], match.end()
+
+        raise TSParseError(f"Unexpected token {char!r}", self.text, pos)
+
+    def parse_string(self, pos: int) -> Tuple[str, int]:
+        """Parse a quoted string, decoding escapes"""
+        text = self.text
+        quote = text[pos]
+        pos += 1
+        chunks = []
+        run_start = pos
+        while pos < self.length:
+            char = text[pos]
+            if char == quote:
+                chunks.append(text[run_start:pos])
+                return ''.join(chunks), pos + 1
+            if char == '\\':
+                chunks.append(text[run_start:pos])
+                decoded, pos = self._parse_escape(pos + 1)
+                chunks.append(decoded)
+                run_start = pos
+                continue
+            if char == '\n' and quote != '`':
+                raise TSParseError("Unterminated string", text, pos)
+            pos += 1
+        raise TSParseError("Unterminated string", text, pos)
+
+    def _parse_escape(self, pos: int) -> Tuple[str, int]:
+        text = self.text
+        if pos >= self.length:
+            raise TSParseError("Unterminated escape", text, pos)
+        char = text[pos]
+        if char in _SIMPLE_ESCAPES and not (char == '0' and pos + 1 < self.length and text[pos + 1].isdigit()):
+            return _SIMPLE_ESCAPES[char], pos + 1
+        if char == 'x':
+            return chr(int(text[pos + 1:pos + 3], 16)), pos + 3
+        if char == 'u':
+            if text.startswith('{', pos + 1):
+                close = text.index('}', pos + 2)
+                return chr(int(text[pos + 2:close], 16)), close + 1
+            return chr(int(text[pos + 1:pos + 5], 16)), pos + 5
+        if char == '\r' and text.startswith('\n', pos + 1):
+            return '', pos + 2
+        if char in '\n\u2028\u2029':
+            return '', pos + 1
+        return char, pos + 1
+
+    def parse_key(self, pos: int) -> Tuple[str, int]:
+        """Parse an object key: identifier, quoted string or number"""
+        char = self.text[pos]
+        if char in '\'"':
+            return self.parse_string(pos)
+        match = _IDENT_RE.match(self.text, pos) or _NUMBER_RE.match(self.text, pos)
+        if not match:
+            raise TSParseError(f"Expected property name, found {char!r}", self.text, pos)
+        return match.group(0), match.end()
+
+    def parse_object(self, pos: int, spans: Optional[Dict[str, Tuple[int, int]]] = None) -> Tuple[Dict[str, Any], int]:
+        """Parse {...} starting at the opening brace
+
+        If spans is given, it receives key -> (start, end) of each value.
+        """
+        result: Dict[str, Any] = {}
+        pos = self.skip_trivia(pos + 1)
+        while True:
+            if pos >= self.length:
+                raise TSParseError("Unterminated object", self.text, pos)
+            if self.text[pos] == '}':
+                return result, pos + 1
+
+            key, pos = self.parse_key(pos)
+            pos = self.skip_trivia(pos)
+            if pos >= self.length or self.text[pos] != ':':
+                raise TSParseError(f"Expected ':' after {key!r}", self.text, pos)
+            value_start = self.skip_trivia(pos + 1)
+            result[key], pos = self.parse_value(value_start)
+            if spans is not None:
+                spans[key] = (value_start, pos)
+
+            pos = self.skip_trivia(pos)
+            if pos < self.length and self.text[pos] == ',':
+                pos = self.skip_trivia(pos + 1)
+            elif pos < self.length and self.text[pos] != '}':
+                raise TSParseError("Expected ',' or '}'", self.text, pos)
+
+    def parse_array(self, pos: int) -> Tuple[List[Any], int]:
+        """Parse [...] starting at the opening bracket"""
+        result: List[Any] = []
+        pos = self.skip_trivia(pos + 1)
+        while True:
+            if pos >= self.length:
+                raise TSParseError("Unterminated array", self.text, pos)
+            if self.text[pos] == ']':
+                return result, pos + 1
+
+            value, pos = self.parse_value(pos)
+            result.append(value)
+
+            pos = self.skip_trivia(pos)
+            if pos < self.length and self.text[pos] == ',':
+                pos = self.skip_trivia(pos + 1)
+            elif pos < self.length and self.text[pos] != ']':
+                raise TSParseError("Expected ',' or ']'", self.text, pos)
+
+
+def parse_ts_literal(text: str, pos: int = 0) -> Tuple[Any, int]:
+    """Parse one literal value at pos, returning (value, end position)"""
+    return _LiteralParser(text).parse_value(pos)
+
+
+def parse_object_fields(text: str, pos: int = 0) -> Tuple[Dict[str, Any], Dict[str, Tuple[int, int]], int]:
+    """Parse the object literal at pos, returning (fields, value spans, end)"""
+    parser = _LiteralParser(text)
+    pos = parser.skip_trivia(pos)
+    if pos >= parser.length or text[pos] != '{':
+        raise TSParseError("Expected an object literal", text, pos)
+    spans: Dict[str, Tuple[int, int]] = {}
+    fields, end = parser.parse_object(pos, spans)
+    return fields, spans, end
+
+
+def splice(text: str, edits: List[Tuple[int, int, str]]) -> str:
+    """
+    Apply (start, end, replacement) edits to text in one pass.
+
+    Edits may be given in any order but must not overlap. The output is
+    assembled from a list of chunks and joined once, so the cost is linear
+    in the size of the text regardless of how many edits there are.
+    """
+    chunks = []
+    cursor = 0
+    for start, end, replacement in sorted(edits, key=lambda edit: (edit[0], edit[1])):
+        if start < cursor:
+            raise ValueError(f"Overlapping edit at offset {start}")
+        chunks.append(text[cursor:start])
+        chunks.append(replacement)
+        cursor = end
+    chunks.append(text[cursor:])
+    return ''.join(chunks)
+
+
+def tool_hash(fields: Dict[str, Any]) -> str:
+    """SHA-256 of a tool's normalized fields (key order and timestamps ignored)"""
+    normalized = {key: value for key, value in fields.items() if key not in HASH_IGNORED_FIELDS}
+    payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def find_array_start(text: str, array_name: str = 'aiToolsData') -> int:
+    """Position of the '[' that opens `export const <array_name>... = [`"""
+    match = re.search(rf'export\s+const\s+{re.escape(array_name)}\b[^=]*=\s*\[', text)
+    if not match:
+        raise TSParseError(f'Could not find "export const {array_name}" array', text, 0)
+    return match.end() - 1
+
+
+def parse_tools_array(text: str, array_name: str = 'aiToolsData') -> List[Dict[str, Any]]:
+    """
+    Parse the exported tools array in one pass.
+
+    Returns one entry per object: {'id', 'start', 'end', 'fields', 'spans',
+    'hash'}, where text[start:end] is the object literal, fields is its parsed
+    value, spans maps each top-level key to the (start, end) of its value and
+    hash is tool_hash(fields).
+    """
+    parser = _LiteralParser(text)
+    pos = parser.skip_trivia(find_array_start(text, array_name) + 1)
+    entries = []
+    while True:
+        if pos >= parser.length:
+            raise TSParseError("Unterminated tools array", text, pos)
+        if text[pos] == ']':
+            return entries
+        if text[pos] != '{':
+            raise TSParseError("Expected a tool object", text, pos)
+
+        spans: Dict[str, Tuple[int, int]] = {}
+        fields, end = parser.parse_object(pos, spans)
+        entries.append({
+            'id': fields.get('id'),
+            'start': pos,
+            'end': end,
+            'fields': fields,
+            'spans': spans,
+            'hash': tool_hash(fields),
+        })
+
+        pos = parser.skip_trivia(end)
+        if pos < parser.length and text[pos] == ',':
+            pos = parser.skip_trivia(pos + 1)
+
+
+class ToolIndex:
+    """Parsed view of a tools data file with O(1) lookup by tool id"""
+
+    def __init__(self, path: Path, text: str, entries: List[Dict[str, Any]]):
+        self.path = Path(path)
+        self.text = text
+        self.entries = entries
+        self.by_id = {entry['id']: entry for entry in entries if entry['id']}
+        self._ids_by_name: Optional[Dict[str, str]] = None
+
+    @staticmethod
+    def cache_path_for(path: Path) -> Path:
+        """Where the index for a data file is cached"""
+        path = Path(path)
+        return path.with_name(f'.{path.name}.index.json')
+
+    @classmethod
+    def from_text(cls, text: str, path: Path = Path('<memory>'),
+                  array_name: str = 'aiToolsData') -> 'ToolIndex':
+        """Build an index from text that is not (or not yet) on disk"""
+        return cls(path, text, parse_tools_array(text, array_name))
+
+    @classmethod
+    def load(cls, path: Path, array_name: str = 'aiToolsData', use_cache: bool = True) -> 'ToolIndex':
+        """Read a data file, reusing the cached index when the file is unchanged"""
+        path = Path(path)
+        raw = path.read_bytes()
+        text = raw.decode('utf-8')
+        stat = path.stat()
+        cache_file = cls.cache_path_for(path)
+
+        cached = cls._read_cache(cache_file) if use_cache else None
+        if cached and cached.get('array') == array_name:
+            same_stat = cached.get('mtime_ns') == stat.st_mtime_ns and cached.get('size') == stat.st_size
+            if same_stat or cached.get('sha256') == hashlib.sha256(raw).hexdigest():
+                return cls(path, text, cached['entries'])
+
+        entries = parse_tools_array(text, array_name)
+        if use_cache:
+            cls._write_cache(cache_file, {
+                'version': INDEX_VERSION,
+                'array': array_name,
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': hashlib.sha256(raw).hexdigest(),
+                'entries': entries,
+            })
+        return cls(path, text, entries)
+
+    @staticmethod
+    def _read_cache(cache_file: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cached if cached.get('version') == INDEX_VERSION else None
+
+    @staticmethod
+    def _write_cache(cache_file: Path, payload: Dict[str, Any]):
+        # Best effort: a read-only checkout simply parses on every run
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    def get(self, tool_id: str) -> Optional[Dict[str, Any]]:
+        """Entry for a tool id, or None"""
+        return self.by_id.get(tool_id)
+
+    def resolve(self, record: Dict[str, Any]) -> Optional[str]:
+        """
+        The id of the tool a fetched record belongs to, or None.
+
+        The updater stamps the catalog id on every record it fetches, and
+        that id is used as it is. Records saved before ids were stamped are
+        matched by name (ignoring case), then by a slug of the name.
+        """
+        if record.get('id'):
+            return record['id']
+        if self._ids_by_name is None:
+            self._ids_by_name = {
+                str(entry['fields'].get('name', '')).lower(): entry['id'] for entry in self.entries if entry['id']
+            }
+        name = str(record.get('name') or '')
+        tool_id = self._ids_by_name.get(name.lower())
+        if tool_id is None and slugify(name) in self.by_id:
+            tool_id = slugify(name)
+        return tool_id
+
+    def content(self, entry: Dict[str, Any]) -> str:
+        """Source text of an entry's object literal"""
+        return self.text[entry['start']:entry['end']]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+TypeScript Literal Emitter
+
+Writes Python values as TypeScript object literals in the layout of
+src/data/aiToolsData.ts. Both integration scripts use it: careful_integration
+for whole tool objects, integrate_updates for single field values.
+
+- the value tree is walked with an explicit stack of iterators and every
+  token is appended to one output buffer, so nothing is formatted twice
+  and deep nesting cannot hit the recursion limit
+- indentation strings are built once per depth and reused
+- strings are escaped through one table: backslashes, quotes, control
+  characters and U+2028/U+2029 (which end a line in older JavaScript
+  engines) all come out as escapes. One regex scan skips the table for
+  the common string that needs no escaping, and object keys are cached
+- output depends only on the value (dict order included), so the same
+  input always produces byte-identical text
+
+Layout: objects put one key per line; arrays of plain values stay on one
+line unless expand_arrays is set; arrays holding objects or arrays put
+one item per line. Empty containers are written as {} and [].
+
+Usage:
+    text = emit_ts(tool, depth=1)                      # a tool inside aiToolsData
+    text = emit_ts(features, depth=2, expand_arrays=True)
+
+    python ts_emitter.py ../src/data/aiToolsData.ts    # re-emit and time the catalog
+"""
+
+import argparse
+import math
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+INDENT = '  '
+
+_IDENT_RE = re.compile(r'[A-Za-z_$][A-Za-z0-9_$]*')
+
+# Every character that may not appear as-is inside a single-quoted literal
+_ESCAPES = {code: f'\\x{code:02x}' for code in range(0x20)}
+_ESCAPES.update({
+    ord('\\'): '\\\\',
+    ord("'"): "\\'",
+    ord('\n'): '\\n',
+    ord('\r'): '\\r',
+    ord('\t'): '\\t',
+    ord('\b'): '\\b',
+    ord('\f'): '\\f',
+    ord('\v'): '\\v',
+    0x7f: '\\x7f',
+    0x2028: '\\u2028',
+    0x2029: '\\u2029',
+})
+
+_NEEDS_ESCAPE_RE = re.compile('[' + ''.join(f'\\u{code:04x}' for code in sorted(_ESCAPES)) + ']')
+
+_indents: List[str] = ['']
+_separators: List[Tuple[str, str]] = []
+_keys: Dict[Any, str] = {}
+
+_END = object()
+
+
+def _escape_match(match: 're.Match') -> str:
+    return _ESCAPES[ord(match.group())]
+
+
+def escape_string(value: str) -> str:
+    """The body of a single-quoted TypeScript string literal for value"""
+    if _NEEDS_ESCAPE_RE.search(value) is None:
+        return value
+    return _NEEDS_ESCAPE_RE.sub(_escape_match, value)
+
+
+def quote_string(value: str) -> str:
+    """value as a single-quoted TypeScript string literal"""
+    return "'" + escape_string(value) + "'"
+
+
+def format_key(key: Any) -> str:
+    """An object key: bare when it is an identifier, quoted otherwise ('Free plan')"""
+    formatted = _keys.get(key)
+    if formatted is None:
+        text = str(key)
+        formatted = text if _IDENT_RE.fullmatch(text) else quote_string(text)
+        if len(_keys) < 4096:
+            _keys[key] = formatted
+    return formatted
+
+
+def format_scalar(value: Any) -> str:
+    """A value that is not a non-empty list or dict"""
+    if value.__class__ is str:
+        return "'" + escape_string(value) + "'"
+    if isinstance(value, str):
+        return quote_string(value)
+    if value is None:
+        return 'undefined'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return 'NaN'
+        if math.isinf(value):
+            return 'Infinity' if value > 0 else '-Infinity'
+        return repr(value)
+    if isinstance(value, dict):
+        return '{}'
+    if isinstance(value, (list, tuple)):
+        return '[]'
+    return quote_string(str(value))
+
+
+def _indent(depth: int) -> str:
+    while len(_indents) <= depth:
+        _indents.append(_indents[-1] + INDENT)
+    return _indents[depth]
+
+
+def _is_container(value: Any) -> bool:
+    return isinstance(value, (dict, list, tuple)) and len(value) > 0
+
+
+def _newlines(depth: int) -> Tuple[str, str]:
+    """The text that starts the first and the following items at depth"""
+    while len(_separators) <= depth:
+        indent = _indent(len(_separators))
+        _separators.append(('\n' + indent, ',\n' + indent))
+    return _separators[depth]
+
+
+def write_ts(write: Callable[[str], Any], value: Any, depth: int = 0, expand_arrays: bool = False):
+    """
+    Write value as a TypeScript literal through write (list.append, file.write, ...).
+
+    depth is the indentation level of the line value starts on; nested
+    lines are indented one level further.
+    """
+    # Open containers: [items iterator, closing text, is_object, text before this item, before later items]
+    stack: List[list] = []
+    needs_escape = _NEEDS_ESCAPE_RE.search
+    keys = _keys
+    base = depth
+    while True:
+        if value.__class__ is str:
+            write("'" + (value if needs_escape(value) is None else escape_string(value)) + "'")
+        elif isinstance(value, dict) and value:
+            write('{')
+            stack.append([iter(value.items()), '\n' + _indent(depth) + '}', True, *_newlines(depth + 1)])
+        elif isinstance(value, (list, tuple)) and value:
+            if expand_arrays or any(_is_container(item) for item in value):
+                write('[')
+                stack.append([iter(value), '\n' + _indent(depth) + ']', False, *_newlines(depth + 1)])
+            else:
+                write('[' + ', '.join(format_scalar(item) for item in value) + ']')
+        else:
+            write(format_scalar(value))
+
+        # Find the next value to write, closing every container that is finished
+        while stack:
+            frame = stack[-1]
+            item = next(frame[0], _END)
+            if item is _END:
+                stack.pop()
+                write(frame[1])
+                continue
+            if frame[2]:
+                key, value = item
+                write(frame[3] + (keys.get(key) or format_key(key)) + ': ')
+            else:
+                value = item
+                write(frame[3])
+            frame[3] = frame[4]
+            # Each open container is one level deeper than the one holding it
+            depth = base + len(stack)
+            break
+        else:
+            return
+
+
+def emit_ts(value: Any, depth: int = 0, expand_arrays: bool = False) -> str:
+    """value as TypeScript literal text; see write_ts()"""
+    out: List[str] = []
+    write_ts(out.append, value, depth, expand_arrays)
+    return ''.join(out)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line: re-emit every tool of a data file and report the time taken"""
+    from ts_data_parser import ToolIndex, TSParseError, parse_ts_literal
+
+    parser = argparse.ArgumentParser(description="Re-emit the aiToolsData array and time it")
+    parser.add_argument('ts_file', type=Path, nargs='?',
+                        default=Path(__file__).parent.parent / 'src' / 'data' / 'aiToolsData.ts')
+    parser.add_argument('--rounds', type=int, default=20, help="Emit the catalog this many times")
+    args = parser.parse_args(argv)
+
+    try:
+        tools = [entry['fields'] for entry in ToolIndex.load(args.ts_file).entries]
+    except (OSError, TSParseError) as e:
+        print(f"❌ Could not read {args.ts_file}: {e}")
+        return 1
+
+    started = time.perf_counter()
+    for _ in range(max(1, args.rounds)):
+        text = emit_ts(tools)
+    elapsed = (time.perf_counter() - started) / max(1, args.rounds)
+
+    round_trip = parse_ts_literal(text)[0] == tools
+    print(f"{len(tools)} tools, {len(text.encode('utf-8')):,} bytes in {elapsed * 1000:.2f} ms per run; "
+          f"round trip {'ok' if round_trip else 'FAILED'}")
+    return 0 if round_trip else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
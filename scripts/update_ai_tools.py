@@ -9,7 +9,7 @@ Requirements:
 - pip install python-dotenv requests google-generativeai
 
 Usage:
-    python update_ai_tools.py
+    python update_ai_tools.py [--sequential] [--workers N] [--prompt-batch N] [--max-age SECONDS] [--resume] [--dry-run]
 
 Author: AI Tools Directory
 Date: October 2025
@@ -17,22 +17,33 @@ Date: October 2025
 
 import os
 import json
-import logging
 import time
 import sys
+import argparse
+import configparser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from pathlib import Path
 
-# Third-party imports
-try:
-    from dotenv import load_dotenv
-    import google.generativeai as genai
-    import requests
-except ImportError as e:
-    print(f"Error: Missing required packages. Please install them using:")
-    print("pip install python-dotenv google-generativeai requests")
-    sys.exit(1)
+# Third-party packages (python-dotenv, google-generativeai) are imported
+# lazily by gemini_client, on the first real API call
+from atomic_io import atomic_write_json, file_lock
+from delta_refresh import VOLATILE_FIELDS, can_delta, delta_batch_prompt, delta_prompt, merge_delta, parse_field_list
+from backup_store import BackupStore
+from log_setup import configure_logging
+from gemini_client import INSTALL_HINT, LazyGeminiModel, gemini_available, load_env_file
+from rate_limiter import TokenBucketLimiter
+from response_cache import CachedModel, ResponseCache
+from json_extract import JSONExtractionError, extract_json
+from refresh_scheduler import RefreshScheduler, load_priority_weights, parse_date
+from retry_policy import MalformedResponseError, RetryPolicy
+from run_journal import RunJournal
+from run_metrics import RunMetrics
+from search_index import write_search_index
+from tool_aggregates import update_aggregates
+from tool_shards import tool_id, write_shards
+from ts_data_parser import ToolIndex, TSParseError
 
 # Configuration
 class Config:
@@ -42,45 +53,166 @@ class Config:
     PROJECT_ROOT = Path(__file__).parent.parent  # Go up one level to project root
     ENV_FILE = PROJECT_ROOT / '.env.local'
     DATA_DIR = PROJECT_ROOT / 'src' / 'data'
+    TS_DATA_FILE = DATA_DIR / 'aiToolsData.ts'
     OUTPUT_FILE = DATA_DIR / 'aiToolsData_updated.json'
+    SHARD_DIR = DATA_DIR / 'tools'  # Per-tool shards and manifest for the api/tools route
+    SEARCH_INDEX_FILE = DATA_DIR / 'aiToolsSearchIndex.json'
+    AGGREGATES_FILE = DATA_DIR / 'aiToolsAggregates.json'
     BACKUP_DIR = PROJECT_ROOT / 'scripts' / 'backups'
     LOG_FILE = PROJECT_ROOT / 'scripts' / 'logs' / 'ai_tools_update.log'
+    CONFIG_FILE = PROJECT_ROOT / 'scripts' / 'config.ini'
+    CACHE_FILE = PROJECT_ROOT / 'scripts' / 'cache' / 'gemini_responses.sqlite3'
+    JOURNAL_FILE = PROJECT_ROOT / 'scripts' / 'cache' / 'update_run.jsonl'
+    METRICS_FILE = PROJECT_ROOT / 'scripts' / 'logs' / 'update_metrics.json'
+    PROMETHEUS_FILE = None  # Optional Prometheus textfile-collector output
+    LOCK_WRITES = True  # Hold an advisory lock on OUTPUT_FILE for the whole run
+    LOCK_TIMEOUT = 60  # seconds to wait for another run's lock
+    WRITE_SHARDS = True  # Also write SHARD_DIR (see tool_shards.py)
+    WRITE_SEARCH_INDEX = True  # Also write SEARCH_INDEX_FILE (see search_index.py)
+    WRITE_AGGREGATES = True  # Also update AGGREGATES_FILE (see tool_aggregates.py)
+    TRENDING_TOP_N = 12  # Length of the precomputed trending list
     
     # API settings
+    MODEL_NAME = 'gemini-2.5-flash'
     REQUEST_TIMEOUT = 30
     RATE_LIMIT_DELAY = 2  # seconds between API calls
     MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 2  # seconds; doubled on each retry, with jitter
+    RETRY_MAX_DELAY = 60  # cap on any single backoff, including server-requested waits
+    REQUESTS_PER_MINUTE = 30  # Shared limit across all workers
+    MAX_CONCURRENT_REQUESTS = 4  # Requests in flight at once
     
     # Update settings
     BATCH_SIZE = 5  # Process tools in batches
-    MAX_TOOLS_PER_RUN = 50  # Limit to prevent API quota exhaustion
+    MAX_TOOLS_PER_RUN = 50  # Limit to prevent API quota exhaustion; spent on the stalest tools first
+    MIN_REFRESH_AGE_DAYS = 1  # Tools updated more recently than this are not refetched
+    PRIORITY_WEIGHTS: Dict[str, float] = {}  # category -> weight, from [priority_categories]
+    CONCURRENT = True  # Fetch tools in parallel instead of batch-by-batch
+    REFRESH_MODE = 'full'  # 'delta' asks only for changes to VOLATILE_FIELDS (see delta_refresh.py)
+    VOLATILE_FIELDS = VOLATILE_FIELDS
+    PROMPT_BATCH_SIZE = 1  # Tools per API request in concurrent mode
+    
+    # Response cache settings
+    CACHE_ENABLED = True
+    CACHE_TTL_HOURS = 24
+    CACHE_MAX_SIZE_MB = 50
+    CACHE_MAX_AGE = None  # seconds; set by --max-age to force a refresh
+    
+    # Logging settings
+    LOG_LEVEL = 'INFO'
+    LOG_TO_FILE = True
+    LOG_TO_CONSOLE = True
+    
+    # Resume settings
+    RESUME = False  # Skip tools already recorded in JOURNAL_FILE
+    DRY_RUN = False  # List what would be fetched without calling the API
+    
+    def __init__(self):
+        self.load_config_file()
+    
+    def load_config_file(self):
+        """Override the defaults above with values from config.ini, if present"""
+        parser = configparser.ConfigParser(inline_comment_prefixes=('#', ';'))
+        if not parser.read(self.CONFIG_FILE, encoding='utf-8'):
+            return
+        
+        self.REQUEST_TIMEOUT = parser.getint('api', 'request_timeout', fallback=self.REQUEST_TIMEOUT)
+        self.RATE_LIMIT_DELAY = parser.getfloat('api', 'rate_limit_delay', fallback=self.RATE_LIMIT_DELAY)
+        self.MAX_RETRIES = parser.getint('api', 'max_retries', fallback=self.MAX_RETRIES)
+        self.RETRY_BASE_DELAY = parser.getfloat('api', 'retry_base_delay', fallback=self.RETRY_BASE_DELAY)
+        self.RETRY_MAX_DELAY = parser.getfloat('api', 'retry_max_delay', fallback=self.RETRY_MAX_DELAY)
+        self.REQUESTS_PER_MINUTE = parser.getfloat('api', 'requests_per_minute', fallback=self.REQUESTS_PER_MINUTE)
+        self.MAX_CONCURRENT_REQUESTS = parser.getint('api', 'max_concurrent_requests', fallback=self.MAX_CONCURRENT_REQUESTS)
+        self.BATCH_SIZE = parser.getint('processing', 'batch_size', fallback=self.BATCH_SIZE)
+        self.MAX_TOOLS_PER_RUN = parser.getint('processing', 'max_tools_per_run', fallback=self.MAX_TOOLS_PER_RUN)
+        self.MIN_REFRESH_AGE_DAYS = parser.getint('processing', 'min_refresh_age_days', fallback=self.MIN_REFRESH_AGE_DAYS)
+        self.PRIORITY_WEIGHTS = load_priority_weights(self.CONFIG_FILE)
+        self.CONCURRENT = parser.getboolean('processing', 'concurrent', fallback=self.CONCURRENT)
+        self.REFRESH_MODE = parser.get('processing', 'refresh_mode', fallback=self.REFRESH_MODE).strip().lower()
+        volatile_fields = parser.get('processing', 'volatile_fields', fallback='')
+        if volatile_fields:
+            self.VOLATILE_FIELDS = parse_field_list(volatile_fields) or self.VOLATILE_FIELDS
+        self.PROMPT_BATCH_SIZE = parser.getint('processing', 'prompt_batch_size', fallback=self.PROMPT_BATCH_SIZE)
+        self.CACHE_ENABLED = parser.getboolean('cache', 'enabled', fallback=self.CACHE_ENABLED)
+        self.CACHE_TTL_HOURS = parser.getfloat('cache', 'ttl_hours', fallback=self.CACHE_TTL_HOURS)
+        self.CACHE_MAX_SIZE_MB = parser.getfloat('cache', 'max_size_mb', fallback=self.CACHE_MAX_SIZE_MB)
+        self.LOG_LEVEL = parser.get('logging', 'log_level', fallback=self.LOG_LEVEL).upper()
+        self.LOG_TO_FILE = parser.getboolean('logging', 'log_to_file', fallback=self.LOG_TO_FILE)
+        self.LOG_TO_CONSOLE = parser.getboolean('logging', 'log_to_console', fallback=self.LOG_TO_CONSOLE)
+        prometheus_file = parser.get('output', 'prometheus_file', fallback='')
+        if prometheus_file:
+            self.PROMETHEUS_FILE = self.PROJECT_ROOT / prometheus_file
+        self.LOCK_WRITES = parser.getboolean('output', 'lock_writes', fallback=self.LOCK_WRITES)
+        self.LOCK_TIMEOUT = parser.getfloat('output', 'lock_timeout', fallback=self.LOCK_TIMEOUT)
+        self.WRITE_SHARDS = parser.getboolean('output', 'write_shards', fallback=self.WRITE_SHARDS)
+        self.WRITE_SEARCH_INDEX = parser.getboolean('output', 'write_search_index', fallback=self.WRITE_SEARCH_INDEX)
+        self.WRITE_AGGREGATES = parser.getboolean('output', 'write_aggregates', fallback=self.WRITE_AGGREGATES)
+        self.TRENDING_TOP_N = parser.getint('output', 'trending_top_n', fallback=self.TRENDING_TOP_N)
 
 class AIToolsUpdater:
     """Main class for updating AI tools information"""
     
-    def __init__(self):
-        """Initialize the updater with configuration and logging"""
-        self.config = Config()
+    # Fields every batched result must carry, with their JSON types
+    REQUIRED_FIELDS = {
+        'name': str,
+        'company': str,
+        'category': str,
+        'description': str,
+        'coreFeatures': list,
+        'officialWebsite': str,
+    }
+    
+    def __init__(self, config: Optional[Config] = None, model: Any = None):
+        """Initialize the updater with configuration and logging
+        
+        model: optional object with a generate_content(prompt) method to use
+        instead of the Gemini API (e.g. fake_gemini.FakeGenerativeModel).
+        """
+        self.config = config or Config()
+        self.metrics = RunMetrics('update_ai_tools')
         self.setup_logging()
         self.setup_directories()
-        self.load_environment()
-        self.setup_gemini_api()
+        self.rate_limiter = TokenBucketLimiter(
+            requests_per_minute=self.config.REQUESTS_PER_MINUTE,
+            max_concurrent=self.config.MAX_CONCURRENT_REQUESTS,
+            sleep=lambda seconds: self.metrics.sleep(seconds, 'rate_limit_wait')
+        )
+        # Shared by all workers, so a 429 pauses the whole pool
+        self.retry_policy = RetryPolicy(
+            max_attempts=self.config.MAX_RETRIES,
+            base_delay=self.config.RETRY_BASE_DELAY,
+            max_delay=self.config.RETRY_MAX_DELAY,
+            logger=self.logger,
+            sleep=lambda seconds: self.metrics.sleep(seconds, 'retry_backoff')
+        )
+        self.setup_response_cache()
+        self.journal = RunJournal(self.config.JOURNAL_FILE)
+        self.scheduler = RefreshScheduler(self.config.PRIORITY_WEIGHTS,
+                                          min_age_days=self.config.MIN_REFRESH_AGE_DAYS)
+        self.previous_output: Optional[List[Dict[str, Any]]] = None
+        # tool id -> everything known about a tool, the base for delta refreshes
+        self.current_records: Dict[str, Dict[str, Any]] = {}
+        # Ids of every tool in the catalog; output records for other ids are dropped
+        self.catalog_ids: Set[str] = set()
+        if model is None and self.config.DRY_RUN:
+            self.model = None
+            self.logger.info("Dry run: the Gemini API will not be used")
+        elif model is None:
+            self.load_environment()
+            self.setup_gemini_api()
+        else:
+            self.model = self.wrap_model(model)
+            self.logger.info(f"Using injected model backend: {type(model).__name__}")
         
     def setup_logging(self):
-        """Setup logging configuration"""
-        # Create logs directory if it doesn't exist
-        self.config.LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.config.LOG_FILE),
-                logging.StreamHandler(sys.stdout)
-            ]
+        """Setup queued logging: JSON lines to LOG_FILE, plain text to the console"""
+        self.logger = configure_logging(
+            __name__,
+            self.config.LOG_FILE,
+            level=self.config.LOG_LEVEL,
+            to_file=self.config.LOG_TO_FILE,
+            to_console=self.config.LOG_TO_CONSOLE
         )
-        self.logger = logging.getLogger(__name__)
         self.logger.info("=== AI Tools Updater Started ===")
     
     def setup_directories(self):
@@ -93,7 +225,7 @@ class AIToolsUpdater:
         
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
-            self.logger.debug(f"Ensured directory exists: {directory}")
+            self.logger.debug("Ensured directory exists: %s", directory)
     
     def load_environment(self):
         """Load environment variables from .env.local"""
@@ -101,7 +233,11 @@ class AIToolsUpdater:
             self.logger.error(f"Environment file not found: {self.config.ENV_FILE}")
             sys.exit(1)
         
-        load_dotenv(self.config.ENV_FILE)
+        try:
+            load_env_file(self.config.ENV_FILE)
+        except ImportError:
+            self.logger.error(f"Missing required packages. Please install them using: {INSTALL_HINT}")
+            sys.exit(1)
         
         # Get API key
         self.gemini_api_key = os.getenv('NEXT_PUBLIC_GEMINI_API_KEY')
@@ -111,37 +247,137 @@ class AIToolsUpdater:
         
         self.logger.info("Environment variables loaded successfully")
     
+    def setup_response_cache(self):
+        """Open the on-disk response cache, if enabled"""
+        self.response_cache = None
+        if not self.config.CACHE_ENABLED:
+            return
+        
+        try:
+            self.response_cache = ResponseCache(
+                self.config.CACHE_FILE,
+                ttl_seconds=self.config.CACHE_TTL_HOURS * 3600,
+                max_bytes=int(self.config.CACHE_MAX_SIZE_MB * 1024 * 1024)
+            )
+            self.logger.info(f"Response cache: {self.config.CACHE_FILE}")
+        except Exception as e:
+            self.logger.warning(f"Response cache unavailable, continuing without it: {e}")
+    
+    def wrap_model(self, model: Any) -> CachedModel:
+        """Put the response cache and shared rate limiter in front of a model"""
+        return CachedModel(
+            model,
+            self.response_cache,
+            self.config.MODEL_NAME,
+            max_age=self.config.CACHE_MAX_AGE,
+            limiter=self.rate_limiter
+        )
+    
     def setup_gemini_api(self):
-        """Initialize Gemini API client"""
+        """Set up the Gemini API client; it is imported and configured on the first request"""
+        if not gemini_available():
+            self.logger.error(f"Missing required packages. Please install them using: {INSTALL_HINT}")
+            sys.exit(1)
+        
         try:
-            genai.configure(api_key=self.gemini_api_key)
-            self.model = genai.GenerativeModel('gemini-2.5-flash')
+            self.model = self.wrap_model(LazyGeminiModel(self.config.MODEL_NAME, self.gemini_api_key))
             self.logger.info("Gemini API initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize Gemini API: {e}")
             sys.exit(1)
     
-    def get_ai_tools_list(self) -> List[Dict[str, Any]]:
+    def get_ai_tools_list(self, index: Optional[ToolIndex] = None) -> List[Dict[str, Any]]:
         """
         Get the list of AI tools to update.
         This can be from existing data or a predefined list.
+        
+        index: the already-parsed aiToolsData.ts, if the caller has one.
         """
         # First, try to load existing tools from the current data file
-        existing_data_file = self.config.DATA_DIR / 'aiToolsData.ts'
+        existing_data_file = self.config.TS_DATA_FILE
         
-        if existing_data_file.exists():
+        tools = []
+        if index is not None or existing_data_file.exists():
             self.logger.info(f"Loading existing tools from: {existing_data_file}")
-            return self.extract_tools_from_typescript()
-        else:
+            tools = self.extract_tools_from_typescript(index)
+        if not tools:
             # Fallback to a predefined list of popular AI tools
             self.logger.info("Using predefined AI tools list")
-            return self.get_predefined_tools_list()
+            tools = self.get_predefined_tools_list()
+        
+        self.catalog_ids = {tool_id(tool) for tool in tools}
+        
+        # A refresh saved to OUTPUT_FILE counts even if it hasn't been integrated
+        # yet. Records are matched by id, since the model may have renamed the tool
+        refreshed = {tool_id(record): record.get('lastUpdated') for record in self.load_previous_output()}
+        for record in self.load_previous_output():
+            if can_delta(record):
+                self.current_records[tool_id(record)] = record
+        for tool in tools:
+            saved = refreshed.get(tool_id(tool))
+            saved_date = parse_date(saved)
+            if saved_date and (parse_date(tool.get('lastUpdated')) or saved_date) <= saved_date:
+                tool['lastUpdated'] = saved
+        return tools
     
-    def extract_tools_from_typescript(self) -> List[Dict[str, Any]]:
-        """Extract tool names from existing TypeScript data file"""
-        # For now, return a simplified list based on popular AI tools
-        # In a production version, you could parse the actual TypeScript file
-        return self.get_predefined_tools_list()
+    def extract_tools_from_typescript(self, index: Optional[ToolIndex] = None) -> List[Dict[str, Any]]:
+        """Name, company, category, lastUpdated and popularity of every tool in aiToolsData.ts"""
+        if index is None:
+            try:
+                index = ToolIndex.load(self.config.TS_DATA_FILE)
+            except (OSError, TSParseError) as e:
+                self.logger.warning(f"Could not parse {self.config.TS_DATA_FILE}: {e}")
+                return []
+        
+        tools = []
+        for entry in index:
+            fields = entry['fields']
+            if not fields.get('name'):
+                continue
+            tools.append({
+                "id": entry['id'],
+                "name": fields['name'],
+                "company": fields.get('company', 'Unknown'),
+                "category": fields.get('category', 'Uncategorized'),
+                "lastUpdated": fields.get('lastUpdated'),
+                "popularity": fields.get('popularity'),
+            })
+            self.current_records[tool_id(tools[-1])] = fields
+        return tools
+    
+    def load_previous_output(self) -> List[Dict[str, Any]]:
+        """Tools saved to OUTPUT_FILE by earlier runs (read once per run)"""
+        if self.previous_output is None:
+            try:
+                with open(self.config.OUTPUT_FILE, 'r', encoding='utf-8') as f:
+                    tools = json.load(f).get('tools', [])
+            except (OSError, ValueError, AttributeError):
+                tools = []
+            self.previous_output = [tool for tool in tools if isinstance(tool, dict)]
+        return self.previous_output
+    
+    def merge_with_previous_output(self, completed: Dict[str, Dict[str, Any]],
+                                   tools_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Earlier runs' output with this run's results laid over it.
+        
+        A run only refreshes the tools the scheduler picked, so the rest keep
+        what earlier runs fetched; a picked tool that failed and was never
+        fetched before keeps its catalog entry. Records are matched by tool
+        id, so one renamed by the model replaces its earlier record, and
+        earlier records whose id is not in the catalog (or repeats) are dropped.
+        """
+        fetched = {tool_id(record): record for record in completed.values()}
+        merged: Dict[str, Dict[str, Any]] = {}
+        for record in self.load_previous_output():
+            ident = tool_id(record)
+            if ident in self.catalog_ids and ident not in merged:
+                merged[ident] = fetched.get(ident, record)
+        for tool in tools_list:
+            ident = tool_id(tool)
+            if ident not in merged:
+                merged[ident] = fetched.get(ident, tool)
+        return list(merged.values())
     
     def get_predefined_tools_list(self) -> List[Dict[str, Any]]:
         """Get a predefined list of AI tools to update"""
@@ -163,15 +399,15 @@ class AIToolsUpdater:
             {"name": "Figma AI", "company": "Figma", "category": "Design Tools"},
         ]
     
-    def generate_update_prompt(self, tool: Dict[str, Any]) -> str:
-        """Generate a prompt for the Gemini API to fetch tool information"""
-        current_date = datetime.now().strftime("%B %Y")
+    def tool_schema(self) -> str:
+        """
+        JSON structure the model is asked to fill in for each tool.
         
-        prompt = f"""
-Please provide the most current and accurate information about the AI tool "{tool['name']}" by {tool['company']} as of {current_date}.
-
-Format your response as a JSON object with the following structure:
-{{
+        Like the prompts, it holds no date: a dated prompt would change its
+        response-cache key every day, so a run resumed after midnight would pay
+        for every call again. lastUpdated is set by stamp_record() instead.
+        """
+        return f"""{{
     "name": "Tool Name",
     "company": "Company Name",
     "category": "Tool Category",
@@ -189,84 +425,217 @@ Format your response as a JSON object with the following structure:
     "officialWebsite": "https://...",
     "githubRepo": "https://github.com/..." (if available),
     "releaseDate": "YYYY-MM",
-    "lastUpdated": "{datetime.now().strftime('%Y-%m-%d')}",
     "popularity": {{
         "trendingScore": 85 (1-100),
         "marketShare": 15 (percentage)
     }}
-}}
+}}"""
+    
+    def uses_delta(self, tools: List[Dict[str, Any]]) -> bool:
+        """Whether tools are refreshed by asking only for changed volatile fields"""
+        return self.config.REFRESH_MODE == 'delta' and all(
+            can_delta(self.current_records.get(tool_id(tool))) for tool in tools
+        )
+    
+    def apply_delta(self, tool: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+        """The tool's current record with the changed volatile fields from delta"""
+        record, changed = merge_delta(self.current_records[tool_id(tool)], delta, self.config.VOLATILE_FIELDS)
+        self.metrics.increment('delta_fields_changed', len(changed))
+        self.logger.debug("Delta for %s: %s", tool['name'], ', '.join(changed) or 'no changes',
+                          extra={'tool': tool['name'], 'stage': 'delta'})
+        return record
+    
+    def generate_update_prompt(self, tool: Dict[str, Any]) -> str:
+        """Generate a prompt for the Gemini API to fetch tool information"""
+        if self.uses_delta([tool]):
+            return delta_prompt(self.current_records[tool_id(tool)], self.config.VOLATILE_FIELDS)
+        
+        prompt = f"""
+Please provide the most current and accurate information about the AI tool "{tool['name']}" by {tool['company']} as of today.
+
+Format your response as a JSON object with the following structure:
+{self.tool_schema()}
 
 Please ensure all information is current, accurate, and factual. If you're unsure about any specific detail, indicate it as "Not available" or provide your best estimate with a note.
 """
         return prompt
     
-    def fetch_tool_info(self, tool: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Fetch updated information for a single AI tool"""
-        self.logger.info(f"Fetching info for: {tool['name']}")
+    def generate_batch_prompt(self, tools: List[Dict[str, Any]]) -> str:
+        """Generate one prompt asking for several tools, answered as a JSON array"""
+        if self.uses_delta(tools):
+            return delta_batch_prompt([self.current_records[tool_id(tool)] for tool in tools],
+                                      self.config.VOLATILE_FIELDS)
+        tool_lines = '\n'.join(
+            f'{ref}. "{tool["name"]}" by {tool["company"]}'
+            for ref, tool in enumerate(tools, 1)
+        )
+        
+        prompt = f"""
+Please provide the most current and accurate information about each of the following AI tools as of today:
+
+{tool_lines}
+
+Format your response as a JSON array with exactly one object per tool, in the same order. Each object must include "ref" set to the tool's number above, and otherwise follow this structure:
+{self.tool_schema()}
+
+Please ensure all information is current, accurate, and factual. If you're unsure about any specific detail, indicate it as "Not available" or provide your best estimate with a note.
+"""
+        return prompt
+    
+    def stamp_record(self, tool: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        record keyed to the tool it was fetched for, and dated today.
+        
+        The model may return a different name (or an id of its own), so the
+        catalog id, or a slug of the listed name, is what shards, the search
+        index, aggregates and integration go by. The prompts carry no date, so
+        lastUpdated is set here rather than taken from the answer.
+        """
+        stamped = {'id': tool_id(tool)}
+        stamped.update((key, value) for key, value in record.items() if key != 'id')
+        stamped['lastUpdated'] = datetime.now().strftime('%Y-%m-%d')
+        return stamped
+    
+    def validate_tool_info(self, data: Any) -> bool:
+        """Check that a fetched record has the required fields with the right types"""
+        if not isinstance(data, dict):
+            return False
+        return all(isinstance(data.get(field), expected) for field, expected in self.REQUIRED_FIELDS.items())
+    
+    def fetch_tool_batch(self, tools: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch several tools with a single request.
+        
+        Elements are matched back to tools by their "ref" number and checked
+        with validate_tool_info(); any tool without a valid element is
+        fetched again on its own with fetch_tool_info().
+        """
+        if len(tools) == 1:
+            return [self.fetch_tool_info(tools[0])]
+        
+        names = ', '.join(tool['name'] for tool in tools)
+        self.logger.info("Fetching info for %d tools in one request: %s", len(tools), names,
+                         extra={'stage': 'fetch_batch'})
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tools)
+        delta = self.uses_delta(tools)
+        
+        with self.metrics.time('prompt'):
+            prompt = self.generate_batch_prompt(tools)
+        self.metrics.increment('batch_requests')
+        try:
+            self.retry_policy.wait_if_paused()
+            with self.metrics.time('api_call'):
+                response = self.model.generate_content(prompt)
+            with self.metrics.time('parse'):
+                items = extract_json(response.text, list) if response and response.text else []
+        except JSONExtractionError as e:
+            self.metrics.increment('parse_failures')
+            self.logger.warning("Could not parse batch response (%s); falling back to single requests", e,
+                                extra={'stage': 'parse'})
+            self.model.invalidate(prompt)
+            items = []
+        except Exception as e:
+            # A 429 here still pauses the pool before the single requests go out
+            kind, _ = self.retry_policy.record_failure(e)
+            self.metrics.increment(f'errors_{kind}')
+            self.logger.warning("Batch request failed (%s: %s); falling back to single requests", kind, e,
+                                extra={'stage': 'api_call'})
+            items = []
         
-        for attempt in range(self.config.MAX_RETRIES):
+        for item in items:
+            if not isinstance(item, dict):
+                continue
             try:
-                prompt = self.generate_update_prompt(tool)
-                
-                # Make API call to Gemini
+                index = int(item.pop('ref')) - 1
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not 0 <= index < len(tools) or results[index] is not None:
+                continue
+            if delta:
+                # Only the changed fields come back, so there is nothing required to check
+                results[index] = self.stamp_record(tools[index], self.apply_delta(tools[index], item))
+            elif self.validate_tool_info(item):
+                results[index] = self.stamp_record(tools[index], item)
+        
+        for index, tool in enumerate(tools):
+            if results[index] is None:
+                self.logger.info("No valid batch result for %s; retrying on its own", tool['name'],
+                                 extra={'tool': tool['name'], 'stage': 'fetch_batch'})
+                self.metrics.increment('batch_fallbacks')
+                results[index] = self.fetch_tool_info(tool)
+            else:
+                self.logger.info("Successfully fetched info for: %s", tool['name'],
+                                 extra={'tool': tool['name'], 'stage': 'fetch_batch'})
+        
+        return results
+    
+    def fetch_tool_info(self, tool: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fetch updated information for a single AI tool, retrying per the shared retry policy"""
+        self.logger.info("Fetching info for: %s", tool['name'], extra={'tool': tool['name'], 'stage': 'fetch'})
+        started = time.perf_counter()
+        delta = self.uses_delta([tool])
+        with self.metrics.time('prompt'):
+            prompt = self.generate_update_prompt(tool)
+        
+        def attempt() -> Dict[str, Any]:
+            # Make API call to Gemini; cache misses wait on the shared limiter
+            with self.metrics.time('api_call'):
                 response = self.model.generate_content(prompt)
-                
-                if response and response.text:
-                    # Try to extract JSON from the response
-                    json_data = self.extract_json_from_response(response.text)
-                    if json_data:
-                        self.logger.info(f"Successfully fetched info for: {tool['name']}")
-                        return json_data
-                    else:
-                        self.logger.warning(f"Could not parse JSON response for: {tool['name']}")
-                        
-            except Exception as e:
-                self.logger.warning(f"Attempt {attempt + 1} failed for {tool['name']}: {e}")
-                if attempt < self.config.MAX_RETRIES - 1:
-                    time.sleep(self.config.RATE_LIMIT_DELAY * (attempt + 1))
-        
-        self.logger.error(f"Failed to fetch info for: {tool['name']} after {self.config.MAX_RETRIES} attempts")
-        return None
+            
+            # Try to extract JSON from the response
+            with self.metrics.time('parse'):
+                json_data = self.extract_json_from_response(response.text) if response and response.text else None
+            # {} is a valid delta answer: nothing changed
+            if json_data is None or not (json_data or delta):
+                self.metrics.increment('parse_failures')
+                self.model.invalidate(prompt)
+                raise MalformedResponseError("Could not parse JSON response")
+            return json_data
+        
+        try:
+            with self.metrics.time('fetch_tool'):
+                json_data = self.retry_policy.call(attempt, description=tool['name'])
+        except Exception as e:
+            self.metrics.increment('tools_failed')
+            self.logger.error("Failed to fetch info for: %s (%s)", tool['name'], e,
+                              extra={'tool': tool['name'], 'stage': 'fetch',
+                                     'duration': time.perf_counter() - started})
+            return None
+        
+        if delta:
+            json_data = self.apply_delta(tool, json_data)
+        json_data = self.stamp_record(tool, json_data)
+        self.logger.info("Successfully fetched info for: %s", tool['name'],
+                         extra={'tool': tool['name'], 'stage': 'fetch', 'duration': time.perf_counter() - started})
+        return json_data
     
     def extract_json_from_response(self, response_text: str) -> Optional[Dict[str, Any]]:
         """Extract JSON data from Gemini API response"""
         try:
-            # Try to find JSON in the response
-            import re
-            
-            # Look for JSON object in the response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-                return json.loads(json_str)
-            
-            # If no JSON found, try parsing the entire response
-            return json.loads(response_text)
-            
-        except json.JSONDecodeError as e:
-            self.logger.warning(f"JSON parsing error: {e}")
+            # First balanced object, skipping code fences and surrounding prose
+            return extract_json(response_text)
+        except JSONExtractionError as e:
+            self.logger.warning("%s", e, extra={'stage': 'parse'})
             return None
     
     def create_backup(self) -> str:
-        """Create a backup of existing data"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = self.config.BACKUP_DIR / f"aiToolsData_backup_{timestamp}.json"
-        
-        # If there's existing data, back it up
-        if self.config.OUTPUT_FILE.exists():
-            try:
-                with open(self.config.OUTPUT_FILE, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-                
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
-                
-                self.logger.info(f"Backup created: {backup_file}")
-                return str(backup_file)
-            except Exception as e:
-                self.logger.warning(f"Failed to create backup: {e}")
+        """Back up existing data to the deduplicated store; returns the backup hash"""
+        # Retention comes from config.ini's [backup] section, as for the integrators
+        store = BackupStore.from_config(
+            self.config.CONFIG_FILE,
+            root=self.config.BACKUP_DIR / 'store',
+            base_dir=self.config.PROJECT_ROOT
+        )
+        try:
+            entry = store.save(self.config.OUTPUT_FILE, label='update_ai_tools')
+        except Exception as e:
+            self.logger.warning(f"Failed to create backup: {e}")
+            return ""
         
-        return ""
+        if entry is None:
+            return ""
+        self.logger.info(f"Backup created: {entry['hash'][:12]} (restore with: python backup_store.py restore {entry['hash'][:12]})")
+        return entry['hash'][:12]
     
     def save_updated_data(self, updated_tools: List[Dict[str, Any]]):
         """Save the updated tools data to JSON file"""
@@ -278,86 +647,330 @@ Please ensure all information is current, accurate, and factual. If you're unsur
                 "tools": updated_tools
             }
             
-            # Save to file
-            with open(self.config.OUTPUT_FILE, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and swap it in, so readers never see a partial file
+            atomic_write_json(self.config.OUTPUT_FILE, output_data, indent=2, ensure_ascii=False)
             
             self.logger.info(f"Updated data saved to: {self.config.OUTPUT_FILE}")
             self.logger.info(f"Total tools updated: {len(updated_tools)}")
             
+            if self.config.WRITE_SHARDS:
+                with self.metrics.time('write_shards'):
+                    counts = write_shards(self.config.SHARD_DIR, updated_tools, output_data['lastUpdated'])
+                self.logger.info(
+                    "Shards saved to %s: %d written, %d unchanged, %d removed",
+                    self.config.SHARD_DIR, counts['written'], counts['unchanged'], counts['removed']
+                )
+            
         except Exception as e:
             self.logger.error(f"Failed to save updated data: {e}")
             raise
     
-    def run_update(self):
-        """Main method to run the update process"""
+    def build_search_index(self, updated_tools: List[Dict[str, Any]]):
+        """Write the prebuilt search index for the saved catalog"""
         try:
-            self.logger.info("Starting AI tools update process")
+            index = write_search_index(self.config.SEARCH_INDEX_FILE, updated_tools,
+                                       datetime.now().isoformat())
+        except Exception as e:
+            # The route falls back to a linear scan without the index
+            self.logger.warning(f"Failed to write search index: {e}")
+            return
+        self.logger.info(
+            "Search index saved to %s: %d tools, %d terms",
+            self.config.SEARCH_INDEX_FILE, len(index['ids']), len(index['terms'])
+        )
+    
+    def update_aggregates(self, updated_tools: List[Dict[str, Any]]):
+        """Bring the precomputed category, tag and trending lists up to date"""
+        try:
+            counts = update_aggregates(self.config.AGGREGATES_FILE, updated_tools,
+                                       datetime.now().isoformat(), self.config.TRENDING_TOP_N)
+        except Exception as e:
+            self.logger.warning(f"Failed to update aggregates: {e}")
+            return
+        self.logger.info(
+            "Aggregates saved to %s: %d changed, %d unchanged, %d removed",
+            self.config.AGGREGATES_FILE, counts['changed'], counts['unchanged'], counts['removed']
+        )
+    
+    def fetch_tools_in_batches(self, tools_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch tools one at a time, pausing between calls and batches"""
+        updated_tools = []
+        
+        for i in range(0, len(tools_list), self.config.BATCH_SIZE):
+            batch = tools_list[i:i + self.config.BATCH_SIZE]
+            self.logger.info(f"Processing batch {i//self.config.BATCH_SIZE + 1}: {len(batch)} tools")
             
-            # Create backup
-            backup_file = self.create_backup()
+            for tool in batch:
+                # Fetch updated info
+                updated_info = self.fetch_tool_info(tool)
+                
+                if updated_info:
+                    with self.metrics.time('journal_write'):
+                        self.journal.append(tool['name'], updated_info)
+                    updated_tools.append(updated_info)
+                else:
+                    # Keep original info if update failed
+                    self.logger.warning("Keeping original info for: %s", tool['name'], extra={'tool': tool['name']})
+                    updated_tools.append(tool)
+                
+                # Rate limiting
+                self.metrics.sleep(self.config.RATE_LIMIT_DELAY)
+            
+            # Batch delay
+            if i + self.config.BATCH_SIZE < len(tools_list):
+                self.logger.info(f"Batch completed. Waiting before next batch...")
+                self.metrics.sleep(5)
+        
+        return updated_tools
+    
+    def fetch_and_journal(self, tools: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        fetch_tool_batch(), journaling each success before returning.
+        
+        Runs on the worker thread, so a result is on disk as soon as it is
+        paid for, even if the main thread is interrupted meanwhile.
+        """
+        results = self.fetch_tool_batch(tools)
+        for tool, result in zip(tools, results):
+            if result:
+                with self.metrics.time('journal_write'):
+                    self.journal.append(tool['name'], result)
+        return results
+    
+    def fetch_tools_concurrently(self, tools_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fetch tools in parallel on a bounded worker pool.
+        
+        Pacing comes from the shared token-bucket limiter rather than fixed
+        sleeps, so the run takes roughly len(tools) / (PROMPT_BATCH_SIZE *
+        REQUESTS_PER_MINUTE) minutes. Results keep the order of tools_list,
+        and each success is journaled by its worker as soon as its request
+        completes. On Ctrl-C the queued requests are cancelled, the ones in
+        flight finish and are journaled, and KeyboardInterrupt is re-raised.
+        """
+        # With PROMPT_BATCH_SIZE > 1 each request covers several tools
+        batch_size = max(1, self.config.PROMPT_BATCH_SIZE)
+        chunks = [
+            list(range(start, min(start + batch_size, len(tools_list))))
+            for start in range(0, len(tools_list), batch_size)
+        ]
+        workers = max(1, min(self.config.MAX_CONCURRENT_REQUESTS, len(chunks)))
+        self.logger.info(
+            f"Fetching {len(tools_list)} tools in {len(chunks)} requests with {workers} workers "
+            f"({self.config.REQUESTS_PER_MINUTE:g} requests/minute)"
+        )
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tools_list)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch') as executor:
+            futures = {
+                executor.submit(self.fetch_and_journal, [tools_list[index] for index in chunk]): chunk
+                for chunk in chunks
+            }
+            try:
+                for future in as_completed(futures):
+                    chunk = futures[future]
+                    try:
+                        for index, result in zip(chunk, future.result()):
+                            results[index] = result
+                    except Exception as e:
+                        names = ', '.join(tools_list[index]['name'] for index in chunk)
+                        self.logger.warning("Worker failed for %s: %s", names, e)
+            except KeyboardInterrupt:
+                # Drop the queued requests; those in flight finish and journal themselves
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        updated_tools = []
+        for tool, updated_info in zip(tools_list, results):
+            if updated_info:
+                updated_tools.append(updated_info)
+            else:
+                # Keep original info if update failed
+                self.logger.warning("Keeping original info for: %s", tool['name'], extra={'tool': tool['name']})
+                updated_tools.append(tool)
+        
+        return updated_tools
+    
+    def report_dry_run(self, pending: List[Dict[str, Any]]):
+        """Log the tools and requests a real run would make, without making them"""
+        batch_size = max(1, self.config.PROMPT_BATCH_SIZE) if self.config.CONCURRENT else 1
+        requests_needed = -(-len(pending) // batch_size)
+        self.logger.info(f"Dry run: {len(pending)} tools would be fetched in {requests_needed} requests")
+        for tool in pending:
+            self.logger.info(
+                f"  - {tool['name']} ({tool.get('category', 'Uncategorized')}, "
+                f"{self.scheduler.staleness_days(tool)} days old, priority {self.scheduler.priority(tool):.2f})"
+            )
+        self.logger.info(f"Dry run: nothing written to {self.config.OUTPUT_FILE}")
+    
+    def run_update(self, index: Optional[ToolIndex] = None) -> Optional[List[Dict[str, Any]]]:
+        """Main method to run the update process
+        
+        index: the already-parsed aiToolsData.ts (pipeline.py passes the one
+        it shares between stages); parsed from TS_DATA_FILE when omitted.
+        Returns the tools saved to OUTPUT_FILE, or None when nothing was saved
+        (dry run or interruption).
+        """
+        try:
+            self.logger.info("Starting AI tools update process")
             
             # Get tools list
-            tools_list = self.get_ai_tools_list()
-            self.logger.info(f"Found {len(tools_list)} tools to update")
+            with self.metrics.time('load_tools'):
+                tools_list = self.get_ai_tools_list(index)
+            self.logger.info(f"Found {len(tools_list)} tools in the catalog")
             
-            # Limit the number of tools to process
-            if len(tools_list) > self.config.MAX_TOOLS_PER_RUN:
-                tools_list = tools_list[:self.config.MAX_TOOLS_PER_RUN]
-                self.logger.info(f"Limited to {self.config.MAX_TOOLS_PER_RUN} tools for this run")
+            # Spend this run's budget on the stalest, highest-priority tools
+            with self.metrics.time('schedule'):
+                tools_list = self.scheduler.schedule(tools_list, self.config.MAX_TOOLS_PER_RUN)
+            self.logger.info(
+                f"Scheduled {len(tools_list)} tools for this run "
+                f"(budget {self.config.MAX_TOOLS_PER_RUN}, stalest and highest priority first)"
+            )
+            if self.config.REFRESH_MODE == 'delta':
+                self.logger.info(f"Delta refresh: asking only for changes to {', '.join(self.config.VOLATILE_FIELDS)}")
             
-            updated_tools = []
+            # Tools finished by an interrupted run are taken from the journal
+            completed = self.journal.load() if self.config.RESUME else {}
+            if self.config.RESUME:
+                self.logger.info(f"Resuming: {len(completed)} tools already in {self.config.JOURNAL_FILE}")
+            pending = [tool for tool in tools_list if tool['name'] not in completed]
             
-            # Process tools in batches
-            for i in range(0, len(tools_list), self.config.BATCH_SIZE):
-                batch = tools_list[i:i + self.config.BATCH_SIZE]
-                self.logger.info(f"Processing batch {i//self.config.BATCH_SIZE + 1}: {len(batch)} tools")
-                
-                for tool in batch:
-                    # Fetch updated info
-                    updated_info = self.fetch_tool_info(tool)
-                    
-                    if updated_info:
-                        updated_tools.append(updated_info)
-                    else:
-                        # Keep original info if update failed
-                        self.logger.warning(f"Keeping original info for: {tool['name']}")
-                        updated_tools.append(tool)
-                    
-                    # Rate limiting
-                    time.sleep(self.config.RATE_LIMIT_DELAY)
-                
-                # Batch delay
-                if i + self.config.BATCH_SIZE < len(tools_list):
-                    self.logger.info(f"Batch completed. Waiting before next batch...")
-                    time.sleep(5)
+            if self.config.DRY_RUN:
+                self.report_dry_run(pending)
+                return None
             
-            # Save updated data
-            self.save_updated_data(updated_tools)
+            if not self.config.RESUME:
+                self.journal.clear()
+            
+            # Create backup
+            with self.metrics.time('backup'):
+                backup_file = self.create_backup()
+            
+            if not pending:
+                self.logger.info("Nothing left to fetch")
+            elif self.config.CONCURRENT:
+                self.fetch_tools_concurrently(pending)
+            else:
+                self.fetch_tools_in_batches(pending)
+            
+            # Compact the journal into the output file, keeping the original
+            # entry for any tool that still failed
+            with self.metrics.time('save_output'):
+                completed = self.journal.load()
+                updated_tools = self.merge_with_previous_output(completed, tools_list)
+                self.save_updated_data(updated_tools)
+                self.previous_output = updated_tools
+                self.journal.clear()
+            if self.config.WRITE_SEARCH_INDEX:
+                with self.metrics.time('search_index'):
+                    self.build_search_index(updated_tools)
+            if self.config.WRITE_AGGREGATES:
+                with self.metrics.time('aggregates'):
+                    self.update_aggregates(updated_tools)
+            self.metrics.set_counter('tools_processed', len(tools_list))
+            self.metrics.set_counter('tools_fetched', len(pending))
+            self.metrics.set_counter('tools_updated', len(completed))
             
             # Summary
             self.logger.info("=== Update Summary ===")
             self.logger.info(f"Tools processed: {len(tools_list)}")
-            self.logger.info(f"Successfully updated: {len(updated_tools)}")
+            self.logger.info(f"Fetched this run: {len(pending)}")
+            self.logger.info(f"Successfully updated: {len(completed)}")
             if backup_file:
                 self.logger.info(f"Backup created: {backup_file}")
             self.logger.info(f"Output file: {self.config.OUTPUT_FILE}")
             self.logger.info("=== Update Complete ===")
+            return updated_tools
             
         except KeyboardInterrupt:
             self.logger.info("Update process interrupted by user")
+            self.logger.info(f"Completed tools are kept in {self.config.JOURNAL_FILE}; rerun with --resume to continue")
+            return None
         except Exception as e:
             self.logger.error(f"Update process failed: {e}")
             raise
+        finally:
+            self.journal.close()
+            if not self.config.DRY_RUN:
+                self.save_metrics()
+    
+    def save_metrics(self):
+        """Write the run's stage timings and counters (and the Prometheus file, if configured)"""
+        self.metrics.set_counter('retries', self.retry_policy.retries)
+        if self.response_cache is not None:
+            self.metrics.set_counter('cache_hits', self.response_cache.hits)
+            self.metrics.set_counter('cache_misses', self.response_cache.misses)
+        try:
+            self.metrics.write_json(self.config.METRICS_FILE)
+            self.metrics.write_prometheus(self.config.PROMETHEUS_FILE)
+            self.logger.info(f"Run metrics saved to: {self.config.METRICS_FILE}")
+        except OSError as e:
+            self.logger.warning(f"Could not save run metrics: {e}")
+
+def add_update_arguments(parser: argparse.ArgumentParser):
+    """The fetch options, shared with pipeline.py"""
+    parser.add_argument('--sequential', action='store_true',
+                        help="Fetch tools one at a time in fixed-delay batches")
+    parser.add_argument('--workers', type=int,
+                        help="Maximum concurrent requests (overrides config.ini)")
+    parser.add_argument('--prompt-batch', type=int, metavar='N',
+                        help="Ask for N tools per API request (overrides config.ini)")
+    parser.add_argument('--max-tools', type=int, metavar='N',
+                        help="Refresh at most N tools this run, stalest first (overrides config.ini)")
+    parser.add_argument('--mode', choices=('full', 'delta'),
+                        help="'delta' asks only for changes to the volatile fields (overrides config.ini)")
+    parser.add_argument('--max-age', type=float, metavar='SECONDS',
+                        help="Ignore cached responses older than this (0 forces a full refresh)")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue an interrupted run, skipping tools already in the journal")
+    parser.add_argument('--prometheus-file', type=Path, metavar='PATH',
+                        help="Also write run metrics in Prometheus text format")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="List the tools that would be fetched without loading the Gemini client")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Update AI tools data using the Gemini API")
+    add_update_arguments(parser)
+    return parser.parse_args(argv)
+
+def config_from_args(args: argparse.Namespace) -> Config:
+    """config.ini settings with the command line overrides applied"""
+    config = Config()
+    if args.sequential:
+        config.CONCURRENT = False
+    if args.workers:
+        config.MAX_CONCURRENT_REQUESTS = args.workers
+    if args.prompt_batch:
+        config.PROMPT_BATCH_SIZE = args.prompt_batch
+    if args.max_tools is not None:
+        config.MAX_TOOLS_PER_RUN = args.max_tools
+    if args.mode:
+        config.REFRESH_MODE = args.mode
+    if args.max_age is not None:
+        config.CACHE_MAX_AGE = args.max_age
+    if args.resume:
+        config.RESUME = True
+    if args.dry_run:
+        config.DRY_RUN = True
+    if args.prometheus_file:
+        config.PROMETHEUS_FILE = args.prometheus_file
+    return config
 
 def main():
     """Main entry point"""
+    args = parse_args()
+    
     print("AI Tools Database Updater")
     print("=" * 50)
     
     try:
-        updater = AIToolsUpdater()
-        updater.run_update()
+        config = config_from_args(args)
+        updater = AIToolsUpdater(config)
+        # Overlapping runs (e.g. from cron) wait here instead of interleaving writes
+        with file_lock(config.OUTPUT_FILE, timeout=config.LOCK_TIMEOUT,
+                       enabled=config.LOCK_WRITES and not config.DRY_RUN):
+            updater.run_update()
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
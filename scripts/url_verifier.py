@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Concurrent URL Verifier
+
+Checks many URLs at once over a shared keep-alive session:
+
+- a thread pool runs checks in parallel, with a per-host concurrency limit
+  so no single site gets hammered
+- HEAD is tried first; servers that reject it (405, 501, ...) get a
+  streamed GET that is closed without reading the body
+- results are cached with a TTL, in memory and in scripts/cache/, so
+  repeated runs only re-check URLs whose result has expired
+
+Usage:
+    verifier = URLVerifier()
+    results = verifier.verify_many(['https://openai.com', 'https://claude.ai'])
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / 'cache' / 'url_checks.json'
+
+# Status codes that usually mean "HEAD not supported here", not "page missing"
+HEAD_REJECTED_STATUSES = {400, 403, 405, 501}
+
+
+class URLVerifier:
+    """Batch URL checker with connection pooling and a TTL result cache"""
+
+    def __init__(self, timeout: float = 10, max_workers: int = 16, per_host_limit: int = 2,
+                 cache_ttl: float = 24 * 3600, cache_path: Optional[Path] = DEFAULT_CACHE_PATH):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.cache_ttl = cache_ttl
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; AIToolsDirectoryLinkChecker/1.0)'
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=per_host_limit)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._results: Dict[str, Tuple[float, bool]] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Tuple[float, bool]]:
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return {url: (checked, ok) for url, (checked, ok) in json.load(f).items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def save_cache(self):
+        """Persist unexpired results for the next run"""
+        if not self.cache_path:
+            return
+        now = time.time()
+        with self._lock:
+            fresh = {url: [checked, ok] for url, (checked, ok) in self._results.items()
+                     if now - checked <= self.cache_ttl}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(fresh, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def cached_result(self, url: str) -> Optional[bool]:
+        """Cached verdict for url, or None if unknown or expired"""
+        with self._lock:
+            entry = self._results.get(url)
+        if entry and time.time() - entry[0] <= self.cache_ttl:
+            return entry[1]
+        return None
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return slot
+
+    def _check(self, url: str) -> bool:
+        """Check one URL: HEAD first, then a streamed GET if HEAD is rejected"""
+        with self._host_slot(url):
+            try:
+                response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+                if 200 <= response.status_code < 300:
+                    return True
+                if response.status_code not in HEAD_REJECTED_STATUSES:
+                    return False
+            except requests.RequestException:
+                pass
+
+            try:
+                with self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True) as response:
+                    return 200 <= response.status_code < 300
+            except requests.RequestException:
+                return False
+
+    def verify(self, url: str) -> bool:
+        """Verify a single URL (cached)"""
+        return self.verify_many([url]).get(url, False)
+
+    def verify_many(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """Verify a batch of URLs concurrently, returning {url: accessible}"""
+        results: Dict[str, bool] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            if not url or not url.startswith(('http://', 'https://')):
+                results[url] = False
+                continue
+            cached = self.cached_result(url)
+            if cached is None:
+                pending.append(url)
+            else:
+                results[url] = cached
+
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='verify') as executor:
+                checked = executor.map(self._check, pending)
+                now = time.time()
+                for url, ok in zip(pending, checked):
+                    results[url] = ok
+                    with self._lock:
+                        self._results[url] = (now, ok)
+            self.save_cache()
+
+        return results
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
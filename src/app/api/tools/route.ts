@@ -1,18 +1,137 @@
 import { NextResponse } from 'next/server'
 import fs from 'fs'
 import path from 'path'
+import { SearchIndex, searchIndex } from '@/utils/searchIndex'
 
-export async function GET() {
+const dataDir = path.join(process.cwd(), 'src', 'data')
+const catalogPath = path.join(dataDir, 'aiToolsData_updated.json')
+// Written next to the catalog by scripts/tool_shards.py
+const shardDir = path.join(dataDir, 'tools')
+// Written by scripts/search_index.py
+const searchIndexPath = path.join(dataDir, 'aiToolsSearchIndex.json')
+// Written by scripts/tool_aggregates.py
+const aggregatesPath = path.join(dataDir, 'aiToolsAggregates.json')
+
+const ID_PATTERN = /^[a-z0-9-]+$/
+
+let cachedIndex: { mtimeMs: number; index: SearchIndex } | null = null
+
+// Parsed once, then again only when the pipeline rewrites the file
+function loadSearchIndex(): SearchIndex | null {
+  if (!fs.existsSync(searchIndexPath)) {
+    return null
+  }
+  const { mtimeMs } = fs.statSync(searchIndexPath)
+  if (!cachedIndex || cachedIndex.mtimeMs !== mtimeMs) {
+    const index = JSON.parse(fs.readFileSync(searchIndexPath, { encoding: 'utf8' }))
+    cachedIndex = { mtimeMs, index }
+  }
+  return cachedIndex.index
+}
+
+// Send a JSON file as-is, preferring a precompressed variant the client accepts
+function serveJsonFile(request: Request, filePath: string) {
+  const accepted = request.headers.get('accept-encoding') || ''
+  const headers: Record<string, string> = {
+    'Content-Type': 'application/json; charset=utf-8',
+    Vary: 'Accept-Encoding',
+  }
+
+  for (const [encoding, suffix] of [['br', '.br'], ['gzip', '.gz']]) {
+    if (accepted.includes(encoding) && fs.existsSync(filePath + suffix)) {
+      headers['Content-Encoding'] = encoding
+      return new NextResponse(fs.readFileSync(filePath + suffix), { headers })
+    }
+  }
+  return new NextResponse(fs.readFileSync(filePath), { headers })
+}
+
+export async function GET(request: Request) {
   try {
-    const filePath = path.join(process.cwd(), 'src', 'data', 'aiToolsData_updated.json')
-    if (!fs.existsSync(filePath)) {
+    const { searchParams } = new URL(request.url)
+    const id = searchParams.get('id')
+    const view = searchParams.get('view')
+    const query = searchParams.get('q')
+
+    if (query !== null) {
+      const index = loadSearchIndex()
+      if (index) {
+        return NextResponse.json({ query, results: searchIndex(index, query) })
+      }
+    }
+
+    if (id !== null) {
+      if (!ID_PATTERN.test(id)) {
+        return NextResponse.json({ error: 'Invalid tool id' }, { status: 400 })
+      }
+      const shardPath = path.join(shardDir, `${id}.json`)
+      if (fs.existsSync(shardPath)) {
+        return serveJsonFile(request, shardPath)
+      }
+    }
+
+    if (view === 'aggregates') {
+      if (!fs.existsSync(aggregatesPath)) {
+        return NextResponse.json({ error: 'Aggregates file not found' }, { status: 404 })
+      }
+      return serveJsonFile(request, aggregatesPath)
+    }
+
+    if (view === 'manifest') {
+      const manifestPath = path.join(shardDir, 'manifest.json')
+      if (fs.existsSync(manifestPath)) {
+        return serveJsonFile(request, manifestPath)
+      }
+    }
+
+    if (!fs.existsSync(catalogPath)) {
       return NextResponse.json({ error: 'Updated tools file not found' }, { status: 404 })
     }
 
-    const raw = fs.readFileSync(filePath, { encoding: 'utf8' })
-    const data = JSON.parse(raw)
+    if (id === null && view === null && query === null) {
+      return serveJsonFile(request, catalogPath)
+    }
+
+    // Shards not generated yet: fall back to parsing the full catalog
+    const data = JSON.parse(fs.readFileSync(catalogPath, { encoding: 'utf8' }))
+    const tools: any[] = data.tools || []
+    const slug = (tool: any) =>
+      tool.id || String(tool.name || '').toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '')
+
+    if (id !== null) {
+      const tool = tools.find((candidate) => slug(candidate) === id)
+      if (!tool) {
+        return NextResponse.json({ error: 'Tool not found' }, { status: 404 })
+      }
+      return NextResponse.json(tool)
+    }
+
+    if (query !== null) {
+      // No index yet: the old linear scan
+      const term = query.toLowerCase().trim()
+      const results = tools
+        .filter((tool) =>
+          term &&
+          [tool.name, tool.description, tool.company].some((value) => String(value || '').toLowerCase().includes(term))
+        )
+        .map((tool) => ({ id: slug(tool), score: 0 }))
+      return NextResponse.json({ query, results })
+    }
+
+    if (view === 'manifest') {
+      return NextResponse.json({
+        lastUpdated: data.lastUpdated,
+        totalTools: tools.length,
+        tools: tools.map((tool) => ({
+          id: slug(tool),
+          name: tool.name,
+          category: tool.category,
+          lastUpdated: tool.lastUpdated,
+        })),
+      })
+    }
 
-    return NextResponse.json(data)
+    return NextResponse.json({ error: `Unknown view: ${view}` }, { status: 400 })
   } catch (err: any) {
     console.error('Error reading updated tools file:', err)
     return NextResponse.json({ error: 'Failed to read tools file' }, { status: 500 })
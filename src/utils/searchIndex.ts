@@ -0,0 +1,79 @@
+// Lookups in the prebuilt index written by scripts/search_index.py
+
+export interface SearchIndex {
+  version: number
+  lastUpdated: string
+  fields: Record<string, number>
+  ids: string[]
+  terms: string[]
+  // Flattened (index into ids, score) pairs per term
+  postings: number[][]
+}
+
+const STOP_WORDS = new Set([
+  'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+  'it', 'its', 'of', 'on', 'or', 'the', 'to', 'with',
+])
+
+// Same normalization as the Python tokenize(): lowercase, accents stripped
+export function tokenize(text: string): string[] {
+  const normalized = text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '')
+  return (normalized.match(/[a-z0-9]+/g) || []).filter((token) => !STOP_WORDS.has(token))
+}
+
+function lowerBound(terms: string[], target: string): number {
+  let low = 0
+  let high = terms.length
+  while (low < high) {
+    const mid = (low + high) >>> 1
+    if (terms[mid] < target) {
+      low = mid + 1
+    } else {
+      high = mid
+    }
+  }
+  return low
+}
+
+// Ids of tools matching every query term as a prefix, best first
+export function searchIndex(index: SearchIndex, query: string, limit?: number): { id: string; score: number }[] {
+  const queryTerms = tokenize(query)
+  if (queryTerms.length === 0) {
+    return []
+  }
+
+  let totals: Map<number, number> | null = null
+  for (const queryTerm of queryTerms) {
+    const best = new Map<number, number>()
+    const end = lowerBound(index.terms, queryTerm + '\uffff')
+    for (let position = lowerBound(index.terms, queryTerm); position < end; position++) {
+      const flat = index.postings[position]
+      for (let i = 0; i < flat.length; i += 2) {
+        if (flat[i + 1] > (best.get(flat[i]) || 0)) {
+          best.set(flat[i], flat[i + 1])
+        }
+      }
+    }
+
+    if (totals === null) {
+      totals = best
+    } else {
+      const previous: Map<number, number> = totals
+      totals = new Map()
+      best.forEach((score, doc) => {
+        const sum = previous.get(doc)
+        if (sum !== undefined) {
+          totals!.set(doc, sum + score)
+        }
+      })
+    }
+    if (totals.size === 0) {
+      return []
+    }
+  }
+
+  const ranked = Array.from(totals!.entries()).sort((a, b) => b[1] - a[1] || a[0] - b[0])
+  return ranked
+    .slice(0, limit ?? ranked.length)
+    .map(([doc, score]) => ({ id: index.ids[doc], score }))
+}
@@ -30,7 +30,8 @@ export function searchTools(query: string): AITool[] {
 }
 
 export function getFeaturedTools(limit: number = 6): AITool[] {
-  return getAllTools()
+  // Sort a copy: sorting getAllTools() itself would reorder aiToolsData for every caller
+  return [...getAllTools()]
     .sort((a, b) => {
       const aPopularity = a.popularity?.trendingScore || 0
       const bPopularity = b.popularity?.trendingScore || 0